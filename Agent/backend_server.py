@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Local stand-in for a text-generation endpoint (batch protocol used by HTTPBackend)."""
+import argparse
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+OPENINGS = [
+    "The evidence on {topic} points toward careful oversight",
+    "{topic} raises hard questions about who bears the risk",
+    "Any honest answer to {topic} must weigh benefits against harms",
+    "History offers useful analogies for {topic}",
+    "The incentives surrounding {topic} deserve scrutiny",
+    "At bottom, {topic} is a question of values",
+    "Those most affected by {topic} rarely get a say",
+    "We lack good measurements for {topic}",
+]
+MIDDLES = [
+    "because early mistakes compound quickly",
+    "since markets alone reward speed over safety",
+    "given how unevenly the costs are distributed",
+    "as past technologies show regulation usually lags",
+    "because accountability is blurred once systems scale",
+    "since public institutions move slower than labs",
+    "given that experts themselves disagree",
+    "as trust erodes faster than it can be rebuilt",
+]
+CLOSINGS = [
+    "so standards bodies should make the rules concrete.",
+    "which is why transparency has to come first.",
+    "so we should start with the highest-risk uses.",
+    "and public trust depends on getting this right.",
+    "even if the details vary from sector to sector.",
+    "so independent audits are a sensible minimum.",
+    "and that argues for reversible, incremental steps.",
+    "which a {persona} cannot simply ignore.",
+]
+
+
+def generate_text(prompt: dict) -> str:
+    # deterministic in the prompt, so seeded debates stay reproducible
+    key = f"{prompt.get('agent')}|{prompt.get('topic')}|{prompt.get('round')}|{prompt.get('attempt')}"
+    h = zlib.crc32(key.encode("utf-8"))
+    persona = (prompt.get("persona") or "").splitlines()
+    speaker = persona[0].split(":")[0] if persona else prompt.get("agent", "Agent")
+    opening = OPENINGS[h % len(OPENINGS)].format(topic=prompt.get("topic", ""))
+    middle = MIDDLES[(h >> 8) % len(MIDDLES)]
+    closing = CLOSINGS[(h >> 16) % len(CLOSINGS)].format(persona=speaker.lower())
+    return f"{opening}, {middle}, {closing}"
+
+
+class StubBackendServer(ThreadingHTTPServer):
+    """Serves ``POST /generate`` and ``GET /stats``; ``latency`` seconds are added per request."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), latency=0.0, per_prompt_latency=0.0):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.per_prompt_latency = per_prompt_latency
+        self.requests = 0
+        self.prompts = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/generate"
+
+    def start(self) -> "StubBackendServer":
+        threading.Thread(target=self.serve_forever, name="StubBackendServer", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/stats":
+            return self._reply(404, {"error": "not found"})
+        self._reply(200, {"requests": self.server.requests, "prompts": self.server.prompts})
+
+    def do_POST(self):
+        if self.path != "/generate":
+            return self._reply(404, {"error": "not found"})
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            prompts = json.loads(self.rfile.read(length))["prompts"]
+        except (ValueError, KeyError, TypeError):
+            return self._reply(400, {"error": "expected {\"prompts\": [...]}"})
+        with self.server._lock:
+            self.server.requests += 1
+            self.server.prompts += len(prompts)
+        delay = self.server.latency + self.server.per_prompt_latency * len(prompts)
+        if delay:
+            time.sleep(delay)
+        self._reply(200, {"texts": [generate_text(p) for p in prompts]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local stand-in generation server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of simulated latency per request")
+    args = parser.parse_args()
+    server = StubBackendServer((args.host, args.port), latency=args.latency)
+    print(f"Serving on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
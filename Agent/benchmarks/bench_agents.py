@@ -0,0 +1,63 @@
+"""Per-turn cost vs agent count for N-agent round-robin debates.
+
+Runs one debate per agent count with the same number of rounds and reports
+the mean and late-debate (last 10%) wall time per turn, so growth with the
+number of agents (routing, graph size) would show up directly. Agents use
+``ProseBackend`` (benchmarks/corpus.py); template agents would run out of
+arguments and time mostly error turns.
+
+Usage: python benchmarks/bench_agents.py [--agents 2 8 32] [--rounds 1000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import ProseBackend
+from nodes.debate_config import AgentSpec, DebateConfig, persona_path
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_debate_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def run(n_agents, rounds):
+    personas = ("scientist", "philosopher", "economist")
+    config = DebateConfig([AgentSpec(f"Agent{i}", persona_path(personas[i % 3]), i) for i in range(n_agents)], rounds)
+    memory = MemoryNode()
+    agents = config.build_agents(42, memory=memory, backend=ProseBackend())
+    app = build_debate_graph(agents, memory, JudgeNode(), None, TOPIC, None, schedule=config.schedule, echo=False)
+    stamps = []
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for chunk in app.stream({"messages": [], "round_count": 0, "summary": "", "topic": TOPIC},
+                                stream_mode="updates"):
+            if "Memory" in chunk:
+                stamps.append(time.perf_counter())
+    total = time.perf_counter() - t0
+    tail = max(1, rounds // 10)
+    late = (stamps[-1] - stamps[-1 - tail]) / tail
+    return total / rounds, late
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'agents':>7} {'rounds':>7} {'mean ms/turn':>13} {'last 10% ms/turn':>17}")
+    for n in args.agents:
+        mean, late = run(n, args.rounds)
+        print(f"{n:>7} {args.rounds:>7} {mean * 1e3:>13.3f} {late * 1e3:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
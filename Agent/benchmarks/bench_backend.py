@@ -0,0 +1,53 @@
+"""Turns/sec through HTTPBackend at different micro-batch sizes against the local stand-in server.
+
+Usage: python benchmarks/bench_backend.py [--debates 64] [--batch-sizes 1 8 32 128] [--latency 0.01]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend_server import StubBackendServer
+from nodes.backends import HTTPBackend
+from scheduler import DebateScheduler
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def run(server, debates, batch_size, window):
+    backend = HTTPBackend(server.url, max_batch=batch_size, batch_window=window, pool_size=32)
+    scheduler = DebateScheduler(max_concurrency=debates, backend=backend)
+    t0 = time.perf_counter()
+    results = asyncio.run(scheduler.run_all([(TOPIC, seed) for seed in range(debates)]))
+    elapsed = time.perf_counter() - t0
+    backend.close()
+    failed = sum(1 for r in results.values() if "winner" not in r)
+    return {"batch": batch_size, "seconds": elapsed, "turns_per_s": debates * 8 / elapsed,
+            "requests": backend.requests_sent, "prompts": backend.prompts_sent, "failed": failed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated backend latency per request (s)")
+    parser.add_argument("--window", type=float, default=0.002, help="Micro-batch window (s)")
+    args = parser.parse_args()
+
+    server = StubBackendServer(latency=args.latency).start()
+    try:
+        print(f"{'batch':>6} {'seconds':>8} {'turns/s':>9} {'requests':>9} {'prompts':>8} {'failed':>7}")
+        for batch in args.batch_sizes:
+            r = run(server, args.debates, batch, args.window)
+            print(f"{r['batch']:>6} {r['seconds']:>8.2f} {r['turns_per_s']:>9.1f} {r['requests']:>9} {r['prompts']:>8} {r['failed']:>7}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
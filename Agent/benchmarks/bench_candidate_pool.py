@@ -0,0 +1,63 @@
+"""Argument generation: redraw-and-compare retries vs the precomputed candidate pool.
+
+Drives two AgentNodes (scientist, philosopher) directly for ``--rounds``
+rounds over several seeds, recording failures the way the graph does (an
+``[ERROR]`` turn). Reports failed turns, generation retries and time per
+turn for both modes.
+
+Usage: python benchmarks/bench_candidate_pool.py [--rounds 8 16 32] [--seeds 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.agent_node import AgentNode
+from nodes.memory_node import MemoryNode
+
+TOPIC = "Should AI be regulated like medicine?"
+PERSONAS = os.path.join(ROOT, "persona_templates")
+
+
+def run(rounds, seed, pool):
+    memory = MemoryNode()
+    agents = [AgentNode(name, os.path.join(PERSONAS, f"{persona}.txt"), seed=seed + i, memory=memory, candidate_pool=pool)
+              for i, (name, persona) in enumerate((("AgentA", "scientist"), ("AgentB", "philosopher")))]
+    failures = retries = 0
+    for r in range(1, rounds + 1):
+        agent = agents[(r - 1) % 2]
+        try:
+            text = agent.take_turn(TOPIC, memory.get_relevant_memory_for_agent(agent.name, memory.turns, ""), memory.turns, r)
+        except Exception as error:
+            failures += 1
+            text = f"[ERROR] {error}"
+        retries += agent.last_retries
+        memory.update_with_turn(r, agent.name, text)
+    return failures, retries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--seeds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rounds':>6} {'mode':>8} {'failed turns':>13} {'retries':>8} {'ms/turn':>8}")
+    for rounds in args.rounds:
+        for label, pool in (("retry", False), ("pool", True)):
+            failures = retries = 0
+            t0 = time.perf_counter()
+            for seed in range(args.seeds):
+                f, r = run(rounds, seed, pool)
+                failures += f
+                retries += r
+            elapsed = time.perf_counter() - t0
+            print(f"{rounds:>6} {label:>8} {failures:>13} {retries:>8} {elapsed / (rounds * args.seeds) * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Checkpoint overhead: per-step put cost vs debate length, and graph runs with/without a checkpointer.
+
+SqliteCheckpointer writes only the turns appended since the previous
+checkpoint; the baseline re-serializes the whole transcript every step (what a
+generic saver does with an ever-growing messages channel).
+
+Usage: python benchmarks/bench_checkpoint.py [--turns 100 1000 5000] [--debates 20]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from nodes.agent_node import AgentNode
+from nodes.checkpointer import SqliteCheckpointer
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from nodes.transcript import Transcript, append_turns
+from run_debate import build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+TEXT = "As AgentA, I contend that Should AI be regulated like medicine? because it presents measurable risks to public safety"
+
+
+def put_cost(turns, tmp, full):
+    # returns (seconds per put over the last 100 steps, db bytes)
+    path = os.path.join(tmp, f"{'full' if full else 'delta'}_{turns}.db")
+    saver = SqliteCheckpointer(path)
+    config = {"configurable": {"thread_id": "t", "checkpoint_ns": ""}}
+    messages = Transcript()
+    tail = []
+    for r in range(1, turns + 1):
+        messages = append_turns(messages, [{"round": r, "agent": "AgentA" if r % 2 else "AgentB", "text": f"{TEXT} #{r}"}])
+        checkpoint = empty_checkpoint()
+        # a plain list is serialized whole by the saver's serde
+        checkpoint["channel_values"] = {"messages": messages.to_list() if full else messages, "round_count": r}
+        checkpoint["channel_versions"] = {"messages": r, "round_count": r}
+        t0 = time.perf_counter()
+        config = saver.put(config, checkpoint, {"step": r}, {"messages": r, "round_count": r})
+        if r > turns - 100:
+            tail.append(time.perf_counter() - t0)
+    saver.close()
+    size = sum(os.path.getsize(path + s) for s in ("", "-wal") if os.path.exists(path + s))
+    return sum(tail) / len(tail), size
+
+
+def run_debates(n, checkpointer=None):
+    t0 = time.perf_counter()
+    for seed in range(n):
+        mem = MemoryNode()
+        a = AgentNode("AgentA", persona_path=os.path.join(ROOT, "persona_templates/scientist.txt"), seed=seed, memory=mem)
+        b = AgentNode("AgentB", persona_path=os.path.join(ROOT, "persona_templates/philosopher.txt"), seed=seed + 1,
+                      memory=mem)
+        app = build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": f"debate-{seed}"}} if checkpointer else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.invoke({"messages": [], "round_count": 0, "summary": "", "topic": TOPIC}, config)
+    return (time.perf_counter() - t0) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--debates", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'turns':>7} {'delta put (us)':>15} {'full put (us)':>14} {'delta db':>10} {'full db':>10}")
+        for turns in args.turns:
+            d_t, d_size = put_cost(turns, tmp, full=False)
+            f_t, f_size = put_cost(turns, tmp, full=True)
+            print(f"{turns:>7} {d_t * 1e6:>15.1f} {f_t * 1e6:>14.1f} {d_size / 1024:>9.0f}K {f_size / 1024:>9.0f}K")
+
+        plain = run_debates(args.debates)
+        with SqliteCheckpointer(os.path.join(tmp, "graph.db")) as saver:
+            durable = run_debates(args.debates, saver)
+        print(f"\n8-round debate: {plain * 1e3:.2f} ms plain, {durable * 1e3:.2f} ms checkpointed "
+              f"({(durable - plain) * 1e3:+.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
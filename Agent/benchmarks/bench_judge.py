@@ -0,0 +1,88 @@
+"""End-of-debate judging: full transcript pass vs the incremental scoreboard.
+
+"full" re-scores the whole transcript when the debate ends (the old
+JudgeNode.judge). "incremental" is what the graph does now: JudgeNode.update
+after every turn, then judge() only reads out the scores. Reports the time
+spent in the final judge call and the per-turn update cost.
+
+Usage: python benchmarks/bench_judge.py [--turns 8 1000 100000]
+"""
+import argparse
+import collections
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.judge_node import JudgeNode
+
+WORDS = ("regulation medicine evidence risk oversight values precedent harm benefit standard audit public trust "
+         "liberty incentive market institution accountability transparency should AI be like").split()
+
+
+def full_pass(turns, summary):
+    scores = collections.Counter()
+    words = [w for w in turns[0]["text"].split() if len(w) > 3] if turns else []
+    topic = " ".join(words[:3])
+    for t in turns:
+        score = len(t["text"].split())
+        if t["text"].count(" ") < 5:
+            score -= 1
+        if topic and any(word.lower() in t["text"].lower() for word in topic.split()):
+            score += 2
+        scores[t["agent"]] += score
+    winner = scores.most_common(1)[0][0] if scores else "AgentA"
+    return {"summary": summary, "winner": winner, "justification": f"{winner} had higher aggregate score ({scores}).",
+            "scores": dict(scores)}
+
+
+def make_turns(n, rng):
+    return [{"round": r, "agent": f"Agent{r % 4}", "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30)))}
+            for r in range(1, n + 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, nargs="+", default=[8, 1000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'turns':>8} {'full judge ms':>14} {'incremental judge ms':>21} {'update us/turn':>15}")
+    for n in args.turns:
+        turns = make_turns(n, random.Random(n))
+        t0 = time.perf_counter()
+        expected = full_pass(turns, "")
+        t_full = time.perf_counter() - t0
+
+        judge = JudgeNode()
+        t0 = time.perf_counter()
+        for i in range(1, n + 1):
+            judge.update(_Prefix(turns, i))
+        t_updates = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        verdict = judge.judge(turns, "")
+        t_final = time.perf_counter() - t0
+        if verdict != expected:
+            raise Exception("incremental verdict differs from the full pass")
+        print(f"{n:>8} {t_full * 1e3:>14.3f} {t_final * 1e3:>21.3f} {t_updates / n * 1e6:>15.2f}")
+
+
+class _Prefix:
+    # a length-limited view, like the graph's Transcript, so the benchmark does not copy prefixes
+    def __init__(self, turns, n):
+        self.turns, self.n = turns, n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.turns[key.start:self.n]
+        return self.turns[key]
+
+
+if __name__ == "__main__":
+    main()
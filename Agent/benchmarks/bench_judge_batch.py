@@ -0,0 +1,65 @@
+"""Re-judging many debates: one JudgeNode per transcript vs judge_batch.
+
+Builds ``--turns`` total turns split into debates of ``--debate-len`` turns
+(the shape of a tournament sweep's transcripts), judges them with a fresh
+JudgeNode each, then with nodes.judge_batch: ``score_batch`` (winners and
+per-agent totals as arrays) and ``judge_batch`` (the same verdict dicts
+JudgeNode.judge returns, checked to be identical).
+
+Usage: python benchmarks/bench_judge_batch.py [--turns 1000 100000 1000000] [--debate-len 8]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.judge_batch import judge_batch, score_batch
+from nodes.judge_node import JudgeNode
+
+WORDS = ("regulation medicine evidence risk oversight values precedent harm benefit standard audit public trust "
+         "liberty incentive market institution accountability transparency should AI be like").split()
+
+
+def make_transcripts(n_turns, debate_len, rng):
+    # texts are drawn from a pool, as template turns repeat across a sweep
+    pool = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30))) for _ in range(2000)]
+    transcripts = []
+    for start in range(0, n_turns, debate_len):
+        transcripts.append([{"round": r, "agent": "AgentA" if r % 2 else "AgentB", "text": rng.choice(pool)}
+                            for r in range(1, min(debate_len, n_turns - start) + 1)])
+    return transcripts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--debate-len", type=int, default=8)
+    args = parser.parse_args()
+
+    score_batch(make_transcripts(16, args.debate_len, random.Random(0)))  # warm up numpy
+    print(f"{'turns':>8} {'debates':>8} {'per-debate ms':>14} {'score_batch ms':>15} {'judge_batch ms':>15} "
+          f"{'speedup':>8}")
+    for n in args.turns:
+        transcripts = make_transcripts(n, args.debate_len, random.Random(n))
+        t0 = time.perf_counter()
+        expected = [JudgeNode().judge(turns, "") for turns in transcripts]
+        t_loop = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        batch = score_batch(transcripts)
+        t_scores = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        verdicts = judge_batch(transcripts)
+        t_batch = time.perf_counter() - t0
+        if verdicts != expected or batch.winners() != [v["winner"] for v in expected]:
+            raise Exception("batch verdicts differ from JudgeNode.judge")
+        print(f"{n:>8} {len(transcripts):>8} {t_loop * 1e3:>14.1f} {t_scores * 1e3:>15.1f} {t_batch * 1e3:>15.1f} "
+              f"{t_loop / t_scores:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
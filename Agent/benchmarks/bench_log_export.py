@@ -0,0 +1,118 @@
+"""Win rate by seed from a large log: json.loads per line vs the columnar export.
+
+Builds a log of ``--debates`` debates (a few real debates, repeated with
+new seeds), then runs each step in a fresh interpreter and reports wall
+time and peak RSS: loading every event with ``json.loads`` and counting
+wins in Python (what a pandas notebook does first), exporting with
+``log_export.py`` (npz), and loading the export plus the vectorized
+``win_rates``.
+
+Usage: python benchmarks/bench_log_export.py [--debates 5000]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TOPICS = ["Should AI be regulated like medicine?", "Is nuclear power green?", "Should voting be compulsory?"]
+
+
+def build_log(path, debates, distinct=12):
+    from nodes.agent_node import AgentNode
+    from nodes.judge_node import JudgeNode
+    from nodes.logger_node import LoggerNode
+    from nodes.memory_node import MemoryNode
+    from run_debate import build_graph
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = os.path.join(tmp, "sample.jsonl")
+        logger = LoggerNode(sample, buffered=True)
+        for seed in range(distinct):
+            topic = TOPICS[seed % len(TOPICS)]
+            mem = MemoryNode(logger=logger)
+            a = AgentNode("AgentA", os.path.join(ROOT, "persona_templates/scientist.txt"), seed, logger, mem)
+            b = AgentNode("AgentB", os.path.join(ROOT, "persona_templates/philosopher.txt"), seed + 1, logger, mem)
+            logger.log_event({"event":"topic_validated","topic":topic})
+            logger.log_event({"event":"start_debate","topic":topic,"seed":seed})
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_graph(a, b, mem, JudgeNode(logger=logger), logger, topic, None).invoke(
+                    {"messages": [], "round_count": 0, "summary": ""})
+        logger.close()
+        with open(sample, "r", encoding="utf-8") as f:
+            blocks, block = [], []
+            for line in f:
+                if '"event": "topic_validated"' in line and block:
+                    blocks.append(block)
+                    block = []
+                block.append(line)
+            blocks.append(block)
+    with open(path, "w", encoding="utf-8") as out:
+        for i in range(debates):
+            for line in blocks[i % len(blocks)]:
+                if '"event": "start_debate"' in line:
+                    event = json.loads(line)
+                    event["seed"] = i % 50
+                    line = json.dumps(event, ensure_ascii=False) + "\n"
+                out.write(line)
+
+
+def step(name, log, out_dir):
+    if name == "json.loads":
+        with open(log, "r", encoding="utf-8") as f:
+            events = [json.loads(line) for line in f]
+        played, wins, seed = {}, {}, None
+        for e in events:
+            if e["event"] == "start_debate":
+                seed = e["seed"]
+            elif e["event"] == "final_verdict":
+                for agent in e["verdict"]["scores"]:
+                    played[agent, seed] = played.get((agent, seed), 0) + 1
+                    wins[agent, seed] = wins.get((agent, seed), 0) + (agent == e["verdict"]["winner"])
+        return len(played)
+    from nodes.log_columns import export_columns, load_columns
+    if name == "export":
+        return export_columns([log], out_dir, format="npz")["events"]
+    return len(load_columns(out_dir).win_rates())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=5000)
+    parser.add_argument("--child", nargs=3, metavar=("STEP", "LOG", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        t0 = time.perf_counter()
+        step(*args.child)
+        elapsed = time.perf_counter() - t0
+        print(json.dumps({"seconds": elapsed, "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log, out_dir = os.path.join(tmp, "debates.jsonl"), os.path.join(tmp, "columns")
+        build_log(log, args.debates)
+        size = os.path.getsize(log)
+        print(f"{args.debates} debates, {size / 2 ** 20:.1f} MB of JSONL")
+        print(f"{'step':<28} {'seconds':>9} {'peak RSS MB':>12}")
+        for name, label in (("json.loads", "json.loads + Python loop"), ("export", "export (npz)"),
+                            ("win_rates", "load + win_rates")):
+            out = subprocess.run([sys.executable, __file__, "--child", name, log, out_dir], check=True,
+                                 capture_output=True, text=True).stdout
+            result = json.loads(out)
+            print(f"{label:<28} {result['seconds']:>9.2f} {result['peak_mb']:>12.1f}")
+        exported = sum(os.path.getsize(os.path.join(out_dir, f)) for f in os.listdir(out_dir))
+        print(f"export size {exported / 2 ** 20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
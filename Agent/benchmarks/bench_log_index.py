@@ -0,0 +1,122 @@
+"""Indexed log queries vs parsing every line.
+
+Builds a large log by repeating one real debate under different topics, then
+times: a full json scan for "turn_error events on topic X" and for replaying one
+debate, the initial index build, an incremental refresh after one more debate is
+appended, and the same queries through the index.
+
+Usage: python benchmarks/bench_log_index.py [--debates 5000]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.log_reader import LogIndex
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def debate_lines(tmp):
+    path = os.path.join(tmp, "one.jsonl")
+    logger = LoggerNode(path)
+    mem = MemoryNode(logger=logger)
+    a = AgentNode("AgentA", persona_path=os.path.join(ROOT, "persona_templates/scientist.txt"), logger=logger, memory=mem)
+    b = AgentNode("AgentB", persona_path=os.path.join(ROOT, "persona_templates/philosopher.txt"), seed=43, logger=logger,
+                  memory=mem)
+    logger.log_event({"event":"start_debate","topic":TOPIC,"seed":42})
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_graph(a, b, mem, JudgeNode(logger=logger), logger, TOPIC, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    # one failed turn per debate so there is something for the turn_error query to find
+    lines.insert(5, json.dumps({"ts": "2026-01-01T00:00:00+00:00", "event": "turn_error", "agent": "AgentB",
+                                "error": "timeout"}) + "\n")
+    return "".join(lines)
+
+
+def write_debates(path, template, start, n):
+    with open(path, "a", encoding="utf-8") as f:
+        for i in range(start, start + n):
+            f.write(template.replace(TOPIC, f"Topic {i % 100}?"))
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def scan_errors(path, topic):
+    found, current = 0, None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            event = json.loads(line)
+            if event["event"] == "start_debate":
+                current = event["topic"]
+            elif event["event"] == "turn_error" and current == topic:
+                found += 1
+    return found
+
+
+def scan_debate(path, debate):
+    turns, seen = [], -1
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            event = json.loads(line)
+            if event["event"] == "start_debate":
+                seen += 1
+            elif seen == debate and event["event"] == "agent_turn":
+                turns.append(event)
+    return turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = debate_lines(tmp)
+        path = os.path.join(tmp, "big.jsonl")
+        write_debates(path, template, 0, args.debates)
+        events = template.count("\n") * args.debates
+        print(f"log: {events} events, {os.path.getsize(path) / 1e6:.1f} MB")
+        target = args.debates // 2
+
+        t_scan_err, n_scan = timed(lambda: scan_errors(path, "Topic 7?"))
+        t_scan_rep, _ = timed(lambda: scan_debate(path, target))
+        t_build, index = timed(lambda: LogIndex(path))
+        write_debates(path, template, args.debates, 1)
+        t_refresh, added = timed(index.refresh)
+        t_err, n_idx = timed(lambda: sum(1 for _ in index.events(event="turn_error", topic="Topic 7?")))
+        t_rep, result = timed(lambda: index.replay(target))
+        index.close()
+        # the injected turn_error adds an [ERROR] turn, so only the turn count is compared
+        if n_idx != n_scan or len(result["turns"]) != len(scan_debate(path, target)) + 1:
+            raise Exception("indexed results differ from the full scan")
+
+        print(f"{'full scan: turn_error on topic':<36} {t_scan_err * 1e3:>10.1f} ms")
+        print(f"{'full scan: one debate':<36} {t_scan_rep * 1e3:>10.1f} ms")
+        print(f"{'index build (once)':<36} {t_build * 1e3:>10.1f} ms")
+        print(f"{'refresh after +1 debate':<36} {t_refresh * 1e3:>10.1f} ms ({added} events)")
+        print(f"{'index: turn_error on topic':<36} {t_err * 1e3:>10.1f} ms ({n_idx} events)")
+        print(f"{'index: replay one debate':<36} {t_rep * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Segmented logs: write and read throughput and size on disk per compression.
+
+Writes ``--events`` debate-like events through a buffered LoggerNode into
+one file and into segment directories (no compression, gzip, and zstd if
+installed), timing until ``close()`` returns (all segments compressed),
+then reads every event back with ``read_log``.
+
+Usage: python benchmarks/bench_log_segments.py [--events 200000] [--segment-mb 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.log_reader import read_log
+from nodes.log_segments import zstd_available
+from nodes.logger_node import LoggerNode
+
+TEXT = ("From my perspective (Scientist persona: evidence-focused), the evidence on regulation points toward "
+        "careful oversight because early mistakes compound quickly")
+
+
+def disk_bytes(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def run(path, events, **kwargs):
+    logger = LoggerNode(path, buffered=True, **kwargs)
+    t0 = time.perf_counter()
+    for i in range(events):
+        if i % 2:
+            logger.log_event({"event":"agent_turn","agent":"AgentA","text":TEXT,"round":i})
+        else:
+            logger.log_event({"event":"memory_requested","agent":"AgentB",
+                              "memory_snapshot":{"turns":[{"round":i,"agent":"AgentA","text":TEXT}],"summary":TEXT}})
+    logger.close()
+    write = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    n = sum(1 for _ in read_log(path, expand=False))
+    read = time.perf_counter() - t0
+    assert n == events
+    return write, read, disk_bytes(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--segment-mb", type=float, default=8)
+    args = parser.parse_args()
+
+    modes = [("single file", {}), ("segments, none", {"compression": "none"}),
+             ("segments, gzip", {"compression": "gzip"})]
+    if zstd_available():
+        modes.append(("segments, zstd", {"compression": "zstd"}))
+    print(f"{args.events} events, {args.segment_mb:g} MB segments")
+    print(f"{'mode':<18} {'write ev/s':>11} {'read ev/s':>10} {'disk MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (label, kwargs) in enumerate(modes):
+            path = os.path.join(tmp, f"log{i}" + ("" if kwargs else ".jsonl"))
+            if kwargs:
+                kwargs["segment_bytes"] = int(args.segment_mb * 2 ** 20)
+            write, read, size = run(path, args.events, **kwargs)
+            print(f"{label:<18} {args.events / write:>11.0f} {args.events / read:>10.0f} {size / 2 ** 20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Event-log bytes for full vs compact (--log-compact) memory/summary events.
+
+Replays the graph's per-turn logging (memory request, agent turn, summary) for
+debates of increasing length, with template-sized turns and with paragraph-
+sized turns like an LLM backend would produce, and checks that the compact
+log expands back to the full one.
+
+Usage: python benchmarks/bench_log_size.py [--rounds 8 100 1000] [--turn-chars 120 1200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.log_reader import read_log
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+
+WORDS = ("evidence risk oversight values precedent harm benefit standard audit public trust liberty "
+         "incentive market institution accountability transparency").split()
+
+
+def turn_text(r, chars):
+    words = []
+    while sum(len(w) + 1 for w in words) < chars:
+        words.append(WORDS[(r * 7 + len(words) * 3) % len(WORDS)])
+    return f"Round {r}: " + " ".join(words)
+
+
+def write_log(path, rounds, chars, compact):
+    logger = LoggerNode(path, buffered=True)
+    memory = MemoryNode(logger=logger, compact_log=compact)
+    turns, summary = [], ""
+    for r in range(1, rounds + 1):
+        agent = "AgentA" if r % 2 else "AgentB"
+        memory.get_relevant_memory_for_agent(agent, turns, summary)
+        text = turn_text(r, chars)
+        logger.log_event({"event":"agent_turn","agent":agent,"text":text,"round":r})
+        memory.mark_logged(r)
+        turns.append({"round": r, "agent": agent, "text": text})
+        summary = memory.generate_summary(turns)
+    logger.close()
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[8, 100, 1000])
+    parser.add_argument("--turn-chars", type=int, nargs="+", default=[120, 1200])
+    args = parser.parse_args()
+
+    print(f"{'rounds':>7} {'turn chars':>10} {'full bytes':>12} {'compact bytes':>14} {'ratio':>6} {'compact B/turn':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for chars in args.turn_chars:
+            for rounds in args.rounds:
+                full_path = os.path.join(tmp, f"full_{chars}_{rounds}.jsonl")
+                compact_path = os.path.join(tmp, f"compact_{chars}_{rounds}.jsonl")
+                full = write_log(full_path, rounds, chars, compact=False)
+                compact = write_log(compact_path, rounds, chars, compact=True)
+                strip = lambda path: [{k: v for k, v in e.items() if k != "ts"} for e in read_log(path)]
+                if strip(full_path) != strip(compact_path):
+                    raise Exception("compact log does not expand to the full log")
+                print(f"{rounds:>7} {chars:>10} {full:>12} {compact:>14} {full / compact:>6.1f} {compact / rounds:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Load generator for debate_server.py: requests/sec and latency percentiles.
+
+Runs ``--requests`` debates from ``--concurrency`` client threads against
+``--url`` (by default an in-process DebateServer started with ``--workers``
+and ``--max-queue``). Latency is measured to the first streamed turn and
+to the verdict; shed requests (429) are counted and not retried.
+
+Usage: python benchmarks/bench_server.py [--url http://127.0.0.1:8000] [--requests 200] [--concurrency 16]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from debate_server import DebateRequestError, DebateServer, request_debate
+
+TOPICS = [
+    "Should AI be regulated like medicine?",
+    "Should cities ban cars from their centres?",
+    "Is nuclear power essential for decarbonisation?",
+    "Should voting be compulsory?",
+]
+
+
+def percentile(values, p):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def run_load(url, requests, concurrency):
+    # (first-turn latencies, total latencies, status counts, wall seconds)
+    first, total, statuses = [], [], {}
+    lock = threading.Lock()
+    next_request = iter(range(requests))
+
+    def client():
+        while True:
+            with lock:
+                i = next(next_request, None)
+            if i is None:
+                return
+            t0 = time.perf_counter()
+            ttft, status = None, 200
+            try:
+                for event in request_debate(url, TOPICS[i % len(TOPICS)], seed=i):
+                    if ttft is None and event["kind"] == "turn":
+                        ttft = time.perf_counter() - t0
+                    if event["kind"] == "error":
+                        status = "error"
+            except DebateRequestError as e:
+                status = e.status
+            elapsed = time.perf_counter() - t0
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    first.append(ttft)
+                    total.append(elapsed)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return first, total, statuses, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="A running debate_server.py (default: start one in-process)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=8)
+    parser.add_argument("--engine", default="langgraph")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server = DebateServer(workers=args.workers, max_queue=args.max_queue, engine=args.engine).start()
+        url = server.url
+    try:
+        first, total, statuses, wall = run_load(url, args.requests, args.concurrency)
+    finally:
+        if server:
+            server.stop()
+
+    done = statuses.get(200, 0)
+    print(f"{args.requests} requests, {args.concurrency} clients against {url}")
+    print(f"completed {done}, shed (429) {statuses.get(429, 0)}, other {args.requests - done - statuses.get(429, 0)}")
+    print(f"throughput: {done / wall:.1f} debates/s ({args.requests / wall:.1f} requests/s) over {wall:.2f} s")
+    print(f"{'latency ms':<14} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for label, values in (("first turn", first), ("full debate", total)):
+        row = " ".join(f"{percentile(values, p) * 1e3:>8.1f}" for p in (50, 90, 99, 100))
+        print(f"{label:<14} {row}")
+
+
+if __name__ == "__main__":
+    main()
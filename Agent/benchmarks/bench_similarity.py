@@ -0,0 +1,78 @@
+"""Compare full-history SequenceMatcher scans with the SimilarityIndex path.
+
+Usage: python benchmarks/bench_similarity.py [--sizes 8 1000 100000] [--queries 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import WORDS, make_turns
+from nodes.agent_node import is_duplicate
+from nodes.similarity_index import SimilarityIndex
+
+
+def near_duplicate(text, rng):
+    words = text.split()
+    for _ in range(rng.randint(1, 3)):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def bench(n, queries, seed=0):
+    turns = make_turns(n, seed)
+    rng = random.Random(seed + 1)
+    # half the queries are near-duplicates of a prior turn, half are fresh
+    probes = []
+    for i in range(queries):
+        if i % 2:
+            probes.append(near_duplicate(rng.choice(turns), rng))
+        else:
+            probes.append(make_turns(1, seed + 1000 + i)[0])
+
+    t0 = time.perf_counter()
+    index = SimilarityIndex()
+    for t in turns:
+        index.add(t)
+    build = time.perf_counter() - t0
+
+    # the old path is linear per query; cap its probes so 100k stays bounded
+    old_probes = probes[: max(1, min(queries, 200000 // max(n, 1)))]
+    t0 = time.perf_counter()
+    old_hits = [is_duplicate(p, turns) for p in old_probes]
+    old = (time.perf_counter() - t0) / len(old_probes)
+
+    t0 = time.perf_counter()
+    new_hits = [index.find(p) is not None for p in probes]
+    new = (time.perf_counter() - t0) / len(probes)
+
+    agree = sum(a == b for a, b in zip(old_hits, new_hits))
+    return {
+        "turns": n,
+        "build_s": build,
+        "old_query_ms": old * 1e3,
+        "new_query_ms": new * 1e3,
+        "speedup": old / new if new else float("inf"),
+        "agreement": f"{agree}/{len(old_probes)}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 1000, 100000])
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'turns':>8} {'build s':>9} {'old ms/q':>10} {'new ms/q':>10} {'speedup':>9} {'agree':>7}")
+    for n in args.sizes:
+        r = bench(n, args.queries)
+        print(f"{r['turns']:>8} {r['build_s']:>9.3f} {r['old_query_ms']:>10.3f} {r['new_query_ms']:>10.3f} {r['speedup']:>9.1f} {r['agreement']:>7}")
+
+
+if __name__ == "__main__":
+    main()
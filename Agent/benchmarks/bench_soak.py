@@ -0,0 +1,106 @@
+"""Soak test: RSS of a very long debate, unbounded vs --memory-window.
+
+Runs one debate of ``--rounds`` rounds per mode, each in a fresh subprocess,
+and samples resident set size ``--samples`` times along the way. Agents use
+``ProseBackend`` (benchmarks/corpus.py), so every turn is a distinct, valid
+argument that goes through duplicate detection and lands in the index; the
+run fails if any turn errors. The bounded mode also fails if RSS grows by
+more than ``--max-growth`` MB per 100k rounds over the second half of the
+run, once the index's near-duplicate window (4096 texts) has filled.
+
+Usage: python benchmarks/bench_soak.py [--rounds 100000] [--window 64] [--modes unbounded bounded] [--max-growth 8]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def rss_mb() -> float:
+    # current (not peak) resident set size; Linux only
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def soak(rounds, window, samples):
+    from benchmarks.corpus import ProseBackend
+    from nodes.debate_config import DebateConfig
+    from nodes.judge_node import JudgeNode
+    from nodes.memory_node import MemoryNode
+    from nodes.transcript import Transcript
+    from run_debate import build_debate_graph
+
+    config = DebateConfig.default(rounds)
+    memory = MemoryNode(resident_turns=window)
+    agents = config.build_agents(1, memory=memory, backend=ProseBackend())
+    app = build_debate_graph(agents, memory, JudgeNode(), None, TOPIC, None, schedule=config.schedule, echo=False)
+    with tempfile.TemporaryDirectory() as spill_dir:
+        transcript = Transcript.spilling(spill_dir, window) if window else []
+        state = {"messages": transcript, "round_count": 0, "summary": "", "topic": TOPIC}
+        every = max(1, rounds // samples)
+        points = [(0, rss_mb())]
+        done = errors = 0
+        t0 = time.perf_counter()
+        for chunk in app.stream(state, stream_mode="updates"):
+            for update in chunk.values():
+                errors += sum(t["text"].startswith("[ERROR]") for t in update.get("messages") or ())
+            # one Memory step per round
+            if "Memory" in chunk:
+                done += 1
+                if done % every == 0:
+                    points.append((done, rss_mb()))
+        elapsed = time.perf_counter() - t0
+        if window:
+            transcript.close()
+    return {"points": points, "seconds": elapsed, "errors": errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100000)
+    parser.add_argument("--window", type=int, default=64)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--modes", nargs="+", choices=["unbounded", "bounded"], default=["unbounded", "bounded"])
+    parser.add_argument("--max-growth", type=float, default=8.0,
+                        help="Bounded mode fails above this RSS growth, in MB per 100k rounds")
+    parser.add_argument("--child", choices=["unbounded", "bounded"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = soak(args.rounds, args.window if args.child == "bounded" else None, args.samples)
+        print(json.dumps(result))
+        return
+
+    failed = False
+    for mode in args.modes:
+        out = subprocess.run([sys.executable, __file__, "--child", mode, "--rounds", str(args.rounds),
+                              "--window", str(args.window), "--samples", str(args.samples)],
+                             check=True, capture_output=True, text=True).stdout
+        result = json.loads(out.splitlines()[-1])
+        points = result["points"]
+        print(f"{mode} ({args.rounds} rounds, {result['seconds'] / args.rounds * 1e3:.2f} ms/round)")
+        for rounds, mb in points:
+            print(f"  {rounds:>9} rounds {mb:>8.1f} MB")
+        mid = points[len(points) // 2]
+        growth = (points[-1][1] - mid[1]) / max(points[-1][0] - mid[0], 1) * 1e5
+        print(f"  growth over the second half: {growth:.1f} MB per 100k rounds, {result['errors']} error turns")
+        if result["errors"]:
+            print("  FAIL: error turns; the soak no longer measures valid turns")
+            failed = True
+        if mode == "bounded" and growth > args.max_growth:
+            print(f"  FAIL: RSS grows by more than {args.max_growth} MB per 100k rounds")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
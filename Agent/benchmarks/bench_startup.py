@@ -0,0 +1,65 @@
+"""Startup cost: import time and end-to-end latency of run_debate.py per engine.
+
+Each measurement runs in a fresh interpreter. Reports the median of
+``--repeat`` runs for: importing run_debate, a full 8-round CLI debate with
+the LangGraph engine and with the built-in local executor, and (from each
+debate's log) the gap between ``start_debate`` and the first
+``memory_requested`` event, i.e. the time spent building the graph before
+the first turn.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def wall(cmd) -> float:
+    t0 = time.perf_counter()
+    subprocess.run(cmd, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def first_turn_gap(log_path) -> float:
+    stamps = {}
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            event = json.loads(line)
+            stamps.setdefault(event["event"], datetime.fromisoformat(event["ts"]))
+    return (stamps["memory_requested"] - stamps["start_debate"]).total_seconds()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [("python -c pass", [wall([sys.executable, "-c", "pass"]) for _ in range(args.repeat)], None),
+            ("import run_debate", [wall([sys.executable, "-c", "import run_debate"]) for _ in range(args.repeat)], None)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine in ("langgraph", "local"):
+            walls, gaps = [], []
+            for i in range(args.repeat):
+                log_path = os.path.join(tmp, f"{engine}-{i}.jsonl")
+                walls.append(wall([sys.executable, "run_debate.py", "--topic", TOPIC, "--log-path", log_path,
+                                   "--engine", engine]))
+                gaps.append(first_turn_gap(log_path))
+            rows.append((f"debate --engine {engine}", walls, gaps))
+
+    print(f"{'':<28} {'median ms':>10} {'first turn ms':>14}")
+    for label, walls, gaps in rows:
+        gap = f"{statistics.median(gaps) * 1e3:>14.1f}" if gaps else f"{'':>14}"
+        print(f"{label:<28} {statistics.median(walls) * 1e3:>10.1f} {gap}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time-to-first-turn with stream_debate vs waiting for invoke, against a backend with latency.
+
+Usage: python benchmarks/bench_stream.py [--latency 0.02] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend_server import StubBackendServer
+from nodes.backends import HTTPBackend
+from streaming import stream_debate
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per backend request")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    server = StubBackendServer(latency=args.latency).start()
+    backend = HTTPBackend(server.url)
+    first, total = [], []
+    try:
+        for seed in range(args.runs):
+            t0 = time.perf_counter()
+            ttft = None
+            for event in stream_debate(TOPIC, seed=seed, backend=backend):
+                if ttft is None and event.kind == "turn":
+                    ttft = time.perf_counter() - t0
+            first.append(ttft)
+            total.append(time.perf_counter() - t0)
+    finally:
+        backend.close()
+        server.stop()
+    print(f"backend latency {args.latency * 1e3:.0f} ms, {args.runs} debates")
+    print(f"first turn (stream):        {statistics.median(first) * 1e3:8.1f} ms median")
+    print(f"full debate (invoke waits): {statistics.median(total) * 1e3:8.1f} ms median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Sweep work queue: coordination overhead and throughput against run_tournament.
+
+First, ``--procs`` processes drain a queue of ``--items`` no-op items
+(lease a batch, complete each item), which measures what the queue alone
+can sustain. Then the same ``--debates`` debate grid runs through
+``run_tournament`` and through ``sweep.py`` workers, with 1 and ``--procs``
+processes.
+
+Usage: python benchmarks/bench_sweep.py [--items 20000] [--debates 200] [--procs 4] [--batch 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.work_queue import WorkQueue
+from run_tournament import run_tournament
+from sweep import init_sweep, run_workers
+
+TOPICS = ["Should AI be regulated like medicine?", "Is nuclear power green?"]
+
+
+def drain(path, batch):
+    # lease/complete round trips only, no work
+    done = 0
+    with WorkQueue(path) as queue:
+        worker = f"bench-{os.getpid()}"
+        while True:
+            items = queue.lease(worker, batch)
+            if not items:
+                return done
+            for item_id, _ in items:
+                done += queue.complete(item_id, worker, {})
+
+
+def queue_rate(tmp, items, procs, batch):
+    path = os.path.join(tmp, f"noop-{procs}-{batch}.db")
+    with WorkQueue(path) as queue:
+        queue.add((str(i), {}) for i in range(items))
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procs) as pool:
+        done = sum(pool.map(drain, [path] * procs, [batch] * procs))
+    assert done == items
+    return items / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--debates", type=int, default=200)
+    parser.add_argument("--procs", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=8)
+    args = parser.parse_args()
+    seeds = range(args.debates // len(TOPICS))
+    n = len(TOPICS) * len(seeds)
+    print(f"{os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as tmp:
+        for procs in sorted({1, args.procs}):
+            for batch in sorted({1, args.batch}):
+                rate = queue_rate(tmp, args.items, procs, batch)
+                print(f"queue only, {procs} procs, batch {batch:<3} {rate:>10.0f} items/s")
+        for procs in sorted({1, args.procs}):
+            # best of two, alternating, so neither side gets the warm caches
+            base = rate = 0.0
+            for attempt in range(2):
+                t0 = time.perf_counter()
+                run_tournament(TOPICS, seeds, workers=procs)
+                base = max(base, n / (time.perf_counter() - t0))
+                path = os.path.join(tmp, f"sweep-{procs}-{attempt}.db")
+                init_sweep(path, TOPICS, seeds)
+                t0 = time.perf_counter()
+                run_workers(path, workers=procs, batch=args.batch)
+                rate = max(rate, n / (time.perf_counter() - t0))
+            print(f"{n} debates, {procs} procs: run_tournament {base:>7.1f}/s, sweep {rate:>7.1f}/s")
+
+
+if __name__ == "__main__":
+    main()
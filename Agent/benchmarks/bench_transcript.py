@@ -0,0 +1,60 @@
+"""Time and memory of accumulating DebateState.messages: operator.add lists vs Transcript.
+
+Each simulated turn mirrors the graph: the reducer appends one entry, then the
+next node reads the last two turns (memory slice) and the last four (summary).
+
+Usage: python benchmarks/bench_transcript.py [--rounds 8 10000]
+"""
+import argparse
+import operator
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from nodes.transcript import append_turns
+
+TEXT = "As AgentA, I contend that Should AI be regulated like medicine? because it presents measurable risks to public safety"
+
+
+def simulate(reducer, initial, rounds):
+    state = initial
+    for r in range(1, rounds + 1):
+        agent = "AgentA" if r % 2 else "AgentB"
+        state = reducer(state, [{"round": r, "agent": agent, "text": f"{TEXT} #{r}"}])
+        state[-2:]
+        state[-4:]
+    return state
+
+
+def measure(name, reducer, initial, rounds):
+    t0 = time.perf_counter()
+    simulate(reducer, initial, rounds)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    state = simulate(reducer, initial, rounds)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del state
+    return {"store": name, "rounds": rounds, "seconds": elapsed, "current_kb": current / 1024, "peak_kb": peak / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[8, 10000])
+    args = parser.parse_args()
+
+    print(f"{'store':<12} {'rounds':>7} {'ms':>10} {'retained KiB':>13} {'peak KiB':>10}")
+    for rounds in args.rounds:
+        for name, reducer, initial in (("list+add", operator.add, []), ("transcript", append_turns, None)):
+            r = measure(name, reducer, initial, rounds)
+            print(f"{r['store']:<12} {r['rounds']:>7} {r['seconds'] * 1e3:>10.2f} {r['current_kb']:>13.1f} {r['peak_kb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Shared benchmark inputs: a large vocabulary, random turn texts and a backend that never runs dry.
+
+Import as ``benchmarks.corpus`` with the Agent directory on ``sys.path``.
+"""
+import random
+
+from nodes.backends import GenerationBackend
+
+BASE = (
+    "risk safety oversight innovation ethics data policy harm benefit standard "
+    "regulation precedent evidence principle society market freedom research "
+    "model review audit trust public private incentive cost impact value"
+).split()
+# a few thousand inflected words so unrelated turns do not share most n-grams
+WORDS = [f"{w}{suffix}" for w in BASE for suffix in ("", "s", "al", "ing", "ed", "ive", "ly", "ness")] + [
+    f"{a[:4]}{b[-4:]}" for a in BASE for b in BASE if a != b
+]
+# ~39k pronounceable pseudo-words for ProseBackend; WORDS share stems, so its texts often share n-grams
+SYLLABLES = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+_rng = random.Random(0)
+PSEUDO_WORDS = sorted({"".join(_rng.choice(SYLLABLES) for _ in range(_rng.randint(2, 4))) for _ in range(50000)})
+del _rng
+
+
+def make_text(rng, low=12, high=24, words=WORDS) -> str:
+    return " ".join(rng.choice(words) for _ in range(rng.randint(low, high)))
+
+
+def make_turns(n, seed=0, low=12, high=24):
+    rng = random.Random(seed)
+    return [make_text(rng, low, high) for _ in range(n)]
+
+
+class ProseBackend(GenerationBackend):
+    """Random pseudo-word prose, fixed per (agent, topic, round, attempt).
+
+    The template backend runs out of distinct arguments after a few dozen
+    turns, after which every turn is an error turn. These texts practically
+    never repeat or share LSH bands, so a debate of any length measures
+    valid turns going through duplicate detection.
+    """
+
+    def generate(self, agent, request) -> str:
+        rng = random.Random(f"{request.agent}|{request.topic}|{request.round}|{request.attempt}")
+        return make_text(rng, 8, 16, PSEUDO_WORDS)
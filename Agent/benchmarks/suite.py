@@ -0,0 +1,322 @@
+"""Benchmark suite: every node plus end-to-end debate throughput, with baseline comparison.
+
+Cases (setup is never timed):
+  duplicate_check[history=N]  MemoryNode.has_similar against N prior turns
+  logger[mode=M]              LoggerNode.log_event, events/sec per logger mode
+  summary[history=N]          MemoryNode.generate_summary on an N-turn transcript
+  judge[turns=N]              JudgeNode.judge on an N-turn transcript
+  graph_compile[engine=E]     building and compiling the debate graph
+  debate[rounds=N,engine=E]   full in-process debates, debates/sec; agents use ProseBackend
+                              (benchmarks/corpus.py) so every turn is a valid, distinct argument
+
+Each case is timed ``--repeat`` times, looping so that one sample takes at
+least ``--min-time`` seconds; the median is what gets compared. ``--save``
+writes the results as JSON, ``--baseline`` compares against an earlier
+file and exits with status 1 if any case got slower by more than
+``--threshold`` (a fraction of the baseline median).
+
+Usage: python benchmarks/suite.py [--quick] [-k PATTERN] [--save out.json] [--baseline base.json] [--threshold 0.25]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks import corpus
+from benchmarks.corpus import WORDS, ProseBackend
+from nodes.debate_config import DebateConfig
+from nodes.judge_node import JudgeNode
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from nodes.transcript import Transcript
+
+# version 2: debate cases run ProseBackend turns instead of template turns that mostly failed
+FORMAT_VERSION = 2
+TOPIC = "Should AI be regulated like medicine?"
+
+# name -> (context manager factory yielding the function to time, operations per call, unit)
+CASES = {}
+
+
+def case(name, ops=1, unit="calls", quick=True):
+    def register(factory):
+        CASES[name] = (contextlib.contextmanager(factory), ops, unit, quick)
+        return factory
+    return register
+
+
+def make_turns(n, seed=0):
+    # random prose with a topical opening turn, alternating between two agents
+    turns = [{"round": 1, "agent": "AgentA", "text": f"AI regulation needs evidence and oversight, {TOPIC.lower()}"}]
+    for i, text in enumerate(corpus.make_turns(n - 1, seed, 6, 24), 1):
+        turns.append({"round": i + 1, "agent": f"Agent{'AB'[i % 2]}", "text": text})
+    return turns
+
+
+def _duplicate_check(history):
+    def factory():
+        turns = make_turns(history)
+        memory = MemoryNode()
+        memory.sync_index(turns)
+        rng = random.Random(1)
+        # half fresh texts, half edited copies of earlier turns
+        queries = [" ".join(rng.choice(WORDS) for _ in range(16)) for _ in range(10)]
+        for _ in range(10):
+            words = rng.choice(turns)["text"].split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            queries.append(" ".join(words))
+
+        def run():
+            for q in queries:
+                memory.has_similar(q, turns)
+        yield run
+    return factory
+
+
+def _logger(mode):
+    def factory():
+        with tempfile.TemporaryDirectory() as tmp:
+            kwargs = {"default": {}, "buffered": {"buffered": True}, "background": {"background": True}}[mode]
+            logger = LoggerNode(os.path.join(tmp, "bench.jsonl"), **kwargs)
+            event = {"event": "agent_turn", "agent": "AgentA", "round": 3, "text": make_turns(2)[1]["text"]}
+
+            def run():
+                for _ in range(1000):
+                    logger.log_event(event)
+                logger.flush()
+            try:
+                yield run
+            finally:
+                logger.close()
+    return factory
+
+
+def _summary(history):
+    def factory():
+        turns = Transcript(make_turns(history))
+        memory = MemoryNode()
+        yield lambda: memory.generate_summary(turns)
+    return factory
+
+
+def _judge(n):
+    def factory():
+        turns = make_turns(n)
+        # a fresh node each call so nothing is reused from the previous call's incremental scores
+        yield lambda: JudgeNode().judge(turns, "")
+    return factory
+
+
+def _graph_compile(engine):
+    def factory():
+        from run_debate import _compile_graph
+        yield lambda: _compile_graph(("AgentA", "AgentB"), None, engine)
+    return factory
+
+
+def _debate(rounds, engine):
+    def factory():
+        from run_debate import build_debate_graph
+        config = DebateConfig.default(rounds)
+        backend = ProseBackend()
+
+        def run():
+            memory = MemoryNode()
+            agents = config.build_agents(42, memory=memory, backend=backend)
+            app = build_debate_graph(agents, memory, JudgeNode(), None, TOPIC, None, schedule=config.schedule,
+                                     echo=False, engine=engine)
+            with contextlib.redirect_stdout(io.StringIO()):
+                return app.invoke({"messages": [], "round_count": 0, "summary": "", "topic": TOPIC})
+
+        # untimed: a case that mostly measured the error path would be meaningless
+        errors = sum(t["text"].startswith("[ERROR]") for t in run()["messages"])
+        if errors:
+            raise RuntimeError(f"debate[rounds={rounds}] produced {errors} error turns")
+        yield run
+    return factory
+
+
+for n in (8, 1000, 10000):
+    case(f"duplicate_check[history={n}]", ops=20, unit="checks", quick=n <= 1000)(_duplicate_check(n))
+for m in ("default", "buffered", "background"):
+    case(f"logger[mode={m}]", ops=1000, unit="events")(_logger(m))
+for n in (8, 1000):
+    case(f"summary[history={n}]", unit="summaries")(_summary(n))
+for n in (8, 1000, 10000):
+    case(f"judge[turns={n}]", unit="verdicts", quick=n <= 1000)(_judge(n))
+for e in ("langgraph", "local"):
+    case(f"graph_compile[engine={e}]", unit="graphs")(_graph_compile(e))
+for e in ("langgraph", "local"):
+    case(f"debate[rounds=8,engine={e}]", unit="debates")(_debate(8, e))
+case("debate[rounds=100,engine=langgraph]", unit="debates")(_debate(100, "langgraph"))
+case("debate[rounds=1000,engine=langgraph]", unit="debates", quick=False)(_debate(1000, "langgraph"))
+
+
+def measure(func, repeat=5, min_time=0.1) -> list:
+    # seconds per call for each of `repeat` samples; each sample loops until it lasts at least min_time
+    t0 = time.perf_counter()
+    func()
+    first = time.perf_counter() - t0
+    loops = max(1, int(min_time / first)) if first > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - t0) / loops)
+    return samples
+
+
+def run_cases(names, repeat=5, min_time=0.1, progress=None) -> dict:
+    results = {}
+    for name in names:
+        factory, ops, unit, quick = CASES[name]
+        with factory() as func:
+            samples = measure(func, repeat, min_time)
+        median = statistics.median(samples)
+        results[name] = {
+            "median_s": median,
+            "min_s": min(samples),
+            "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "samples": len(samples),
+            "ops_per_s": ops / median if median else None,
+            "unit": unit,
+        }
+        if progress:
+            progress(name, results[name])
+    return results
+
+
+def select(pattern=None, quick=False) -> list:
+    return [name for name, (_, _, _, in_quick) in CASES.items()
+            if (in_quick or not quick) and (pattern is None or pattern in name)]
+
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def report(results: dict, quick=False) -> dict:
+    return {
+        "version": FORMAT_VERSION,
+        "meta": {"created": datetime.now(timezone.utc).isoformat(), "commit": _commit(), "quick": quick,
+                 "python": platform.python_version(), "platform": platform.platform()},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold=0.25) -> list:
+    """(name, baseline median, current median, ratio, status) per case in either result set.
+
+    status is "regression" when the current median exceeds the baseline by
+    more than ``threshold``, "improved" when it is below by more than that,
+    otherwise "ok"; "new"/"missing" mark cases present on one side only.
+    """
+    rows = []
+    for name in list(dict.fromkeys([*baseline, *current])):
+        if name not in baseline:
+            rows.append((name, None, current[name]["median_s"], None, "new"))
+            continue
+        if name not in current:
+            rows.append((name, baseline[name]["median_s"], None, None, "missing"))
+            continue
+        base, now = baseline[name]["median_s"], current[name]["median_s"]
+        ratio = now / base if base else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((name, base, now, ratio, status))
+    return rows
+
+
+def _ms(seconds):
+    return f"{seconds * 1e3:>12.3f}" if seconds is not None else f"{'-':>12}"
+
+
+def format_comparison(rows: list) -> str:
+    lines = [f"{'case':<40} {'base ms':>12} {'now ms':>12} {'change':>8}  status"]
+    for name, base, now, ratio, status in rows:
+        change = f"{(ratio - 1) * 100:>+7.1f}%" if ratio is not None else f"{'':>8}"
+        lines.append(f"{name:<40} {_ms(base)} {_ms(now)} {change}  {status}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer samples (not comparable "
+                                                                "with a full run)")
+    parser.add_argument("-k", dest="pattern", help="Only run cases whose name contains PATTERN")
+    parser.add_argument("--repeat", type=int, default=None, help="Samples per case (default 5, 3 with --quick)")
+    parser.add_argument("--min-time", type=float, default=None, help="Minimum seconds per sample")
+    parser.add_argument("--save", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against results saved earlier with --save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Slowdown (fraction) reported as a regression")
+    parser.add_argument("--list", action="store_true", help="List the selected cases and exit")
+    args = parser.parse_args(argv)
+
+    names = select(args.pattern, args.quick)
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        parser.error("no benchmark case matches the selection")
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != FORMAT_VERSION:
+            parser.error(f"{args.baseline} is not a version {FORMAT_VERSION} results file")
+
+    repeat = args.repeat or (3 if args.quick else 5)
+    min_time = args.min_time if args.min_time is not None else (0.02 if args.quick else 0.1)
+    print(f"{'case':<40} {'median ms':>12} {'ops/s':>14}")
+
+    def progress(name, r):
+        ops = f"{r['ops_per_s']:>10.1f} {r['unit']}" if r["ops_per_s"] else ""
+        print(f"{name:<40} {_ms(r['median_s'])} {ops}", flush=True)
+
+    results = report(run_cases(names, repeat, min_time, progress), quick=args.quick)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.save}")
+    if baseline is None:
+        return 0
+
+    if baseline["meta"].get("quick") != args.quick:
+        print("Warning: baseline and current run differ in --quick; sizes and timings are not comparable")
+    # cases deselected with -k/--quick are not "missing"
+    base = {name: r for name, r in baseline["results"].items() if name in names}
+    rows = compare(results["results"], base, args.threshold)
+    print(f"\nAgainst {args.baseline} (commit {baseline['meta'].get('commit')}), threshold {args.threshold:.0%}")
+    print(format_comparison(rows))
+    regressions = [row[0] for row in rows if row[4] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Long-running HTTP/JSON debate service (warm graphs, bounded workers, streamed turns)."""
+import argparse
+import collections
+import http.client
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from nodes.user_input_node import UserInputNode
+from run_debate import ENGINES, compile_graph
+from streaming import PERSONA_DIR, load_persona, stream_debate
+
+
+class Admission:
+    """At most ``workers`` debates run at once and at most ``max_queue`` wait for a slot.
+
+    ``admit()`` returns None when the queue is full (the request is shed)
+    and otherwise a ticket: ``ticket.wait()`` blocks until the debate may
+    run, and ``release()`` must follow once it is done. Waiting debates get
+    slots in arrival order.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        if workers < 1 or max_queue < 0:
+            raise ValueError("workers must be at least 1 and max_queue at least 0")
+        self.workers = workers
+        self.max_queue = max_queue
+        self.running = 0
+        self._waiting = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+    def admit(self):
+        ticket = threading.Event()
+        with self._lock:
+            if self.running < self.workers and not self._waiting:
+                self.running += 1
+                ticket.set()
+            elif len(self._waiting) < self.max_queue:
+                self._waiting.append(ticket)
+            else:
+                return None
+        return ticket
+
+    def release(self):
+        with self._lock:
+            if self._waiting:
+                # hand the slot straight to the next waiter; running stays the same
+                self._waiting.popleft().set()
+            else:
+                self.running -= 1
+
+
+class DebateServer(ThreadingHTTPServer):
+    """Serves ``POST /debates`` (streamed NDJSON events), ``GET /stats`` and ``GET /health``.
+
+    Graphs are compiled and persona templates read once per process, by
+    ``warm()`` at start-up, and reused by every debate. ``workers`` bounds
+    concurrent debates and ``max_queue`` the debates waiting for a worker;
+    beyond that requests get 429. ``log_dir`` keeps one log per debate.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), workers=4, max_queue=16, engine="langgraph", log_dir=None,
+                 backend=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+        super().__init__(address, _Handler)
+        self.admission = Admission(workers, max_queue)
+        self.engine = engine
+        self.log_dir = log_dir
+        self.backend = backend
+        self.personas = sorted(f[:-4] for f in os.listdir(PERSONA_DIR) if f.endswith(".txt"))
+        self.counts = collections.Counter()
+        self._lock = threading.Lock()
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def warm(self) -> "DebateServer":
+        compile_graph(("AgentA", "AgentB"), None, self.engine)
+        for persona in self.personas:
+            load_persona(persona)
+        return self
+
+    def count(self, key: str) -> int:
+        # the new total; the "accepted" total doubles as the debate id
+        with self._lock:
+            self.counts[key] += 1
+            return self.counts[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self.counts)
+        return {"workers": self.admission.workers, "max_queue": self.admission.max_queue,
+                "running": self.admission.running, "queued": self.admission.queued, "engine": self.engine,
+                **{k: counts.get(k, 0) for k in ("accepted", "rejected", "completed", "stopped", "failed")}}
+
+    def start(self) -> "DebateServer":
+        self.warm()
+        threading.Thread(target=self.serve_forever, name="DebateServer", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: dict, headers=()):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_event(self, payload: dict):
+        # one NDJSON line per HTTP chunk, flushed so the client sees each turn as it happens
+        line = json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+        self.wfile.write(f"{len(line):X}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == "/health":
+            return self._reply(200, {"status": "ok"})
+        if self.path == "/stats":
+            return self._reply(200, self.server.stats())
+        self._reply(404, {"error": "not found"})
+
+    def _parse(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return None, "request body must be JSON"
+        if not isinstance(body, dict):
+            return None, "request body must be a JSON object"
+        topic = body.get("topic")
+        if not UserInputNode().validate_and_sanitize(topic):
+            return None, "invalid topic (5-200 characters)"
+        seed = body.get("seed", 42)
+        if not isinstance(seed, int) or isinstance(seed, bool):
+            return None, "seed must be an integer"
+        request = {"topic": topic, "seed": seed,
+                   "persona_a": body.get("persona_a", "scientist"), "persona_b": body.get("persona_b", "philosopher")}
+        for key in ("persona_a", "persona_b"):
+            # only known template names, never arbitrary paths
+            if request[key] not in self.server.personas:
+                return None, f"{key} must be one of {self.server.personas}"
+        return request, None
+
+    def do_POST(self):
+        if self.path != "/debates":
+            return self._reply(404, {"error": "not found"})
+        request, error = self._parse()
+        if error:
+            return self._reply(400, {"error": error})
+        server = self.server
+        ticket = server.admission.admit()
+        if ticket is None:
+            server.count("rejected")
+            return self._reply(429, {"error": "server busy", "queued": server.admission.queued},
+                               headers=[("Retry-After", "1")])
+        try:
+            debate_id = server.count("accepted")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            if not ticket.is_set():
+                self._send_event({"kind": "queued", "id": debate_id, "position": server.admission.queued})
+            ticket.wait()
+            self._run(debate_id, request)
+        except (BrokenPipeError, ConnectionResetError):
+            # the client went away; closing the event generator stopped the debate
+            server.count("stopped")
+            self.close_connection = True
+        finally:
+            server.admission.release()
+
+    def _run(self, debate_id: int, request: dict):
+        server = self.server
+        log_path = os.path.join(server.log_dir, f"debate_{debate_id:06d}.jsonl") if server.log_dir else None
+        self._send_event({"kind": "started", "id": debate_id})
+        events = stream_debate(request["topic"], request["seed"], request["persona_a"], request["persona_b"],
+                               log_path=log_path, backend=server.backend, engine=server.engine)
+        try:
+            for event in events:
+                self._send_event(event.to_dict())
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception as e:
+            server.count("failed")
+            self._send_event({"kind": "error", "error": str(e)})
+        else:
+            server.count("completed")
+        finally:
+            events.close()
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class DebateRequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+def request_debate(url: str, topic: str, timeout: float = 60.0, **params):
+    """POST a debate to a DebateServer at ``url`` and yield its events as dicts.
+
+    Raises ``DebateRequestError`` (with ``status``) for a non-200 reply,
+    e.g. 429 when the server is shedding load.
+    """
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+    try:
+        body = json.dumps({"topic": topic, **params})
+        conn.request("POST", "/debates", body=body, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        if resp.status != 200:
+            raise DebateRequestError(resp.status, json.loads(resp.read() or b"{}").get("error", resp.reason))
+        for line in resp:
+            yield json.loads(line)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the debate service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=4, help="Debates run concurrently")
+    parser.add_argument("--max-queue", type=int, default=16, help="Debates waiting for a worker before 429s")
+    parser.add_argument("--engine", choices=ENGINES, default="langgraph")
+    parser.add_argument("--log-dir", default=None, help="Write one JSON-lines log per debate here")
+    parser.add_argument("--backend-url", default=None, help="Generation endpoint (see backend_server.py)")
+    args = parser.parse_args()
+
+    backend = None
+    if args.backend_url:
+        from nodes.backends import HTTPBackend
+        backend = HTTPBackend(args.backend_url)
+    server = DebateServer((args.host, args.port), workers=args.workers, max_queue=args.max_queue,
+                          engine=args.engine, log_dir=args.log_dir, backend=backend).warm()
+    print(f"Serving debates on {server.url} ({args.workers} workers, queue {args.max_queue}, {args.engine})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if backend:
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
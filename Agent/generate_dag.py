@@ -1,29 +1,40 @@
-from run_debate import build_graph
-from nodes.logger_node import LoggerNode
-from nodes.agent_node import AgentNode
-from nodes.memory_node import MemoryNode
-from nodes.judge_node import JudgeNode
+"""Export the debate DAG as Mermaid or DOT text (offline) or, explicitly, as PNG."""
 import os
+import sys
 
-def generate_dag(output_path="dag.png"):
-    # Create dummy objects to initialize graph
-    logger = LoggerNode("dummy_log.json")
-    
-    a_persona = os.path.join("persona_templates", "scientist.txt")
-    b_persona = os.path.join("persona_templates", "philosopher.txt")
-    
-    agent_a = AgentNode("AgentA", persona_path=a_persona, seed=42, logger=logger)
-    agent_b = AgentNode("AgentB", persona_path=b_persona, seed=43, logger=logger)
-    memory_node = MemoryNode(logger=logger)
-    judge_node = JudgeNode(logger=logger)
-    
-    # Build graph
-    app = build_graph(agent_a, agent_b, memory_node, judge_node, logger, "dummy_topic", "dummy_log.json")
-    
+from run_debate import compile_graph
+
+
+def to_mermaid(app) -> str:
+    return app.get_graph().draw_mermaid()
+
+
+def to_dot(app) -> str:
+    graph = app.get_graph()
+    lines = ["digraph debate {", "  rankdir=TB;"]
+    for node_id in graph.nodes:
+        shape = "ellipse" if node_id in ("__start__", "__end__") else "box"
+        lines.append(f'  "{node_id}" [shape={shape}];')
+    for edge in graph.edges:
+        style = " [style=dashed]" if edge.conditional else ""
+        lines.append(f'  "{edge.source}" -> "{edge.target}"{style};')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_dag(output_path="dag.mmd", agent_names=("AgentA", "AgentB"), engine="langgraph"):
+    # format follows the extension: .dot/.gv -> DOT, .png -> remote Mermaid render (langgraph only), else Mermaid text
+    app = compile_graph(agent_names, engine=engine)
+    ext = os.path.splitext(output_path)[1].lower()
     try:
-        png_data = app.get_graph().draw_mermaid_png()
-        with open(output_path, "wb") as f:
-            f.write(png_data)
+        if ext == ".png":
+            data = app.get_graph().draw_mermaid_png()
+            with open(output_path, "wb") as f:
+                f.write(data)
+        else:
+            text = to_dot(app) if ext in (".dot", ".gv") else to_mermaid(app)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(text)
         print(f"Generated DAG: {output_path}")
         return output_path
     except Exception as e:
@@ -31,4 +42,6 @@ def generate_dag(output_path="dag.png"):
         return None
 
 if __name__ == "__main__":
-    generate_dag()
+    # python generate_dag.py [PATH [ENGINE]]
+    path = sys.argv[1] if len(sys.argv) > 1 else "dag.mmd"
+    generate_dag(path, engine=sys.argv[2] if len(sys.argv) > 2 else "langgraph")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Convert LoggerNode JSONL logs into columnar tables (Parquet with pyarrow, else uncompressed .npz)."""
+import argparse
+import json
+
+from nodes.log_columns import FORMATS, export_columns, load_columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export debate logs to columnar events/debates/scores tables.")
+    parser.add_argument("out_dir", help="Directory for events/debates/scores.{parquet,npz}")
+    parser.add_argument("logs", nargs="+", help="LoggerNode JSONL files, in order")
+    parser.add_argument("--format", choices=("auto",) + FORMATS, default="auto",
+                        help="auto = parquet when pyarrow is installed, else npz")
+    parser.add_argument("--chunk-rows", type=int, default=65536, help="Rows buffered per written chunk")
+    parser.add_argument("--win-rates", action="store_true", help="Print win rates by agent and seed afterwards")
+    args = parser.parse_args()
+
+    counts = export_columns(args.logs, args.out_dir, format=args.format, chunk_rows=args.chunk_rows)
+    print(f"Wrote {counts['events']} events, {counts['debates']} debates, {counts['scores']} scores to {args.out_dir}")
+    if args.win_rates:
+        for row in load_columns(args.out_dir).win_rates():
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
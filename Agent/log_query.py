@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Query or replay LoggerNode JSONL logs through a sidecar offset index."""
+import argparse
+import json
+import sys
+
+from nodes.log_reader import LogIndex
+
+
+def _round_range(value: str):
+    lo, sep, hi = value.partition(":")
+    try:
+        return (int(lo or 0), int(hi)) if sep else int(lo)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"round must look like 5 or 2:5, got {value!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query or replay a debate log (builds/updates <log>.idx).")
+    parser.add_argument("log", help="LoggerNode JSONL file")
+    parser.add_argument("--index", default=None, help="Index path (default <log>.idx)")
+    parser.add_argument("--event", nargs="+", default=None, help="Event type(s) to match")
+    parser.add_argument("--agent", nargs="+", default=None, help="Agent name(s) to match")
+    parser.add_argument("--round", type=_round_range, default=None, help="Round N or inclusive range LO:HI")
+    parser.add_argument("--debate", type=int, default=None, help="Debate number within the log")
+    parser.add_argument("--topic", default=None, help="Only debates on this topic")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--expand", action="store_true", help="Resolve compact memory/summary references")
+    parser.add_argument("--count", action="store_true", help="Print the number of matching events only")
+    parser.add_argument("--debates", action="store_true", help="List the debates in the log")
+    parser.add_argument("--replay", type=int, default=None, metavar="DEBATE",
+                        help="Rebuild a debate through MemoryNode/JudgeNode and print the result")
+    parser.add_argument("--until-round", type=int, default=None, help="With --replay, stop after this round")
+    args = parser.parse_args()
+
+    with LogIndex(args.log, args.index) as index:
+        if args.debates:
+            for row in index.debates():
+                print(json.dumps(row, ensure_ascii=False))
+            return
+        if args.replay is not None:
+            result = index.replay(args.replay, until_round=args.until_round)
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+            return
+        filters = {"event": args.event, "agent": args.agent, "round": args.round, "debate": args.debate,
+                   "topic": args.topic}
+        if args.count:
+            print(index.count(**filters))
+            return
+        try:
+            for event in index.events(expand=args.expand, limit=args.limit, **filters):
+                sys.stdout.write(json.dumps(event, ensure_ascii=False) + "\n")
+        except BrokenPipeError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@ import json
 import difflib
 from typing import List
 
+from nodes.backends import CLAIM_PHRASES, REASON_PHRASES, SUPPORT_PHRASES, TemplateBackend, TurnRequest
+from nodes.candidate_pool import CandidatePool
+
+DEFAULT_BACKEND = TemplateBackend()
+
 
 def is_duplicate(new_text: str, prior_texts: List[str], threshold: float = 0.75) -> bool:
     # use sequence matcher as a cheap semantic similarity proxy
@@ -15,14 +20,34 @@ def is_duplicate(new_text: str, prior_texts: List[str], threshold: float = 0.75)
 
 
 class AgentNode:
-    def __init__(self, name: str, persona_path: str, seed: int = 42, logger=None):
+    def __init__(self, name: str, persona_path: str, seed: int = 42, logger=None, memory=None, backend=None, cache=None,
+                 candidate_pool: bool = False, persona_text: str = None):
         self.name = name
         self.logger = logger
-        self.persona_text = ""
-        if os.path.exists(persona_path):
+        # optional MemoryNode whose similarity index replaces full-history scans
+        self.memory = memory
+        # text generation backend; defaults to the seeded phrase templates
+        self.backend = backend or DEFAULT_BACKEND
+        # optional TurnCache; None bypasses it entirely (seeded runs unchanged)
+        self.cache = cache
+        # persona_text (already loaded, e.g. by a long-running server) skips reading persona_path
+        self.persona_text = persona_text if persona_text is not None else ""
+        if persona_text is None and os.path.exists(persona_path):
             with open(persona_path, "r", encoding="utf-8") as f:
                 self.persona_text = f.read()
         self.rng = random.Random(seed)
+        # generation attempts beyond the first in the most recent turn (read by the profiler)
+        self.last_retries = 0
+        # draw from a seeded pool of every candidate text (when the backend can enumerate them) instead of retrying
+        self.candidate_pool = candidate_pool
+        self._pool = None
+        self._pool_topic = None
+
+    def reseed(self, seed: int):
+        # start over as if constructed with this seed; the candidate pool is reshuffled on next use
+        self.rng.seed(seed)
+        self._pool = None
+        self._pool_topic = None
 
     def take_turn(self, topic: str, relevant_memory: dict, current_round: int) -> str:
         # relevant_memory comes from MemoryNode (turns + summary)
@@ -47,50 +72,106 @@ class AgentNode:
         # I will just write the code.
         
     def take_turn(self, topic: str, relevant_memory: dict, all_turns: List[dict], current_round: int) -> str:
-        prior_texts = [t["text"] for t in all_turns]
-        
+        self.last_retries = 0
+        seen = self._duplicate_check(all_turns)
+        key, cached = self._cached(topic, relevant_memory, current_round, seen)
+        if cached is not None:
+            return self._accept(cached, current_round)
+        pool = self._candidates(topic)
+        if pool is not None:
+            return self._pool_turn(pool, all_turns, current_round, seen, key)
         for attempt in range(5):
-            # generate a short argument combining persona and seeded behavior
-            base_templates = [
-                f"As {self.name}, I contend that {topic} because {self._reason_phrase()}",
-                f"{self._reason_phrase().capitalize()} is why {topic} matters, and {self._support_phrase()}",
-                f"From my perspective ({self.persona_text.splitlines()[0] if self.persona_text else self.name}), {self._claim_phrase(topic)}",
-            ]
-            text = self.rng.choice(base_templates)
-            
-            # Simple local check if we want, but better to use the exact logic as before
-            if is_duplicate(text, prior_texts):
+            self.last_retries = attempt
+            request = self._request(topic, relevant_memory, current_round, attempt)
+            text = self.backend.generate(self, request)
+            if seen(text):
                 # try to vary
-                text = text + " " + self._support_phrase()
-            if is_duplicate(text, prior_texts):
+                text = self.backend.vary(self, request, text)
+            if text is None or seen(text):
                 continue
-                
-            # log
-            if self.logger:
-                self.logger.log_event({"event":"agent_turn","agent":self.name,"text":text,"round":current_round})
-            return text
+            return self._accept(text, current_round, key)
 
         raise Exception("Could not generate a non-duplicate argument after attempts")
 
+    async def atake_turn(self, topic: str, relevant_memory: dict, all_turns: List[dict], current_round: int) -> str:
+        # async entry point for the asyncio engine; awaits the backend instead of blocking on it
+        self.last_retries = 0
+        seen = self._duplicate_check(all_turns)
+        key, cached = self._cached(topic, relevant_memory, current_round, seen)
+        if cached is not None:
+            return self._accept(cached, current_round)
+        pool = self._candidates(topic)
+        if pool is not None:
+            return self._pool_turn(pool, all_turns, current_round, seen, key)
+        for attempt in range(5):
+            self.last_retries = attempt
+            request = self._request(topic, relevant_memory, current_round, attempt)
+            text = await self.backend.agenerate(self, request)
+            if seen(text):
+                text = self.backend.vary(self, request, text)
+            if text is None or seen(text):
+                continue
+            return self._accept(text, current_round, key)
+
+        raise Exception("Could not generate a non-duplicate argument after attempts")
+
+    def _candidates(self, topic: str):
+        # the pool for this topic, built on first use; None when pooling is off or unsupported by the backend
+        if not self.candidate_pool:
+            return None
+        if self._pool_topic != topic:
+            texts = self.backend.candidates(self, topic)
+            self._pool = CandidatePool(texts, self.rng) if texts else None
+            self._pool_topic = topic
+        return self._pool
+
+    def _pool_turn(self, pool: CandidatePool, all_turns: List[dict], current_round: int, seen, cache_key: str = None) -> str:
+        pool.sync(all_turns)
+        text = pool.next(seen)
+        if text is None:
+            raise Exception("Could not generate a non-duplicate argument: candidate pool exhausted")
+        text = self._accept(text, current_round, cache_key)
+        if not pool.remaining and self.logger:
+            # known one turn early: the next turn for this agent will fail
+            self.logger.log_event({"event":"candidate_pool_exhausted","agent":self.name,"round":current_round})
+        return text
+
+    def _duplicate_check(self, all_turns: List[dict]):
+        if self.memory is not None:
+            index = self.memory.sync_index(all_turns)
+            return lambda candidate: index.find(candidate) is not None
+        prior_texts = [t["text"] for t in all_turns]
+        return lambda candidate: is_duplicate(candidate, prior_texts)
+
+    def _request(self, topic: str, relevant_memory: dict, current_round: int, attempt: int) -> TurnRequest:
+        return TurnRequest(self.name, self.persona_text, topic, relevant_memory, current_round, attempt)
+
+    def _cached(self, topic: str, relevant_memory: dict, current_round: int, seen):
+        # (key, text) for a cached turn that is still not a duplicate here; (key, None) otherwise
+        if self.cache is None:
+            return None, None
+        backend = type(self.backend).__name__ + ":" + getattr(self.backend, "url", "")
+        key = self.cache.key(self.name, self.persona_text, topic, relevant_memory, current_round, backend)
+        text = self.cache.get(key)
+        if text is not None and seen(text):
+            text = None
+        return key, text
+
+    def _accept(self, text: str, current_round: int, cache_key: str = None) -> str:
+        if cache_key is not None:
+            self.cache.put(cache_key, text)
+        # log
+        if self.logger:
+            self.logger.log_event({"event":"agent_turn","agent":self.name,"text":text,"round":current_round})
+            if self.memory is not None and self.memory.logger is self.logger:
+                self.memory.mark_logged(current_round)
+        return text
+
     def _reason_phrase(self):
-        return self.rng.choice([
-            "it presents measurable risks to public safety",
-            "it fosters responsible development",
-            "historical precedents suggest oversight is needed",
-            "unchecked progress can cause long-term harm",
-        ])
+        return self.rng.choice(REASON_PHRASES)
 
     def _support_phrase(self):
-        return self.rng.choice([
-            "for example, consider high-risk applications",
-            "this can be addressed through standards",
-            "society benefits when harms are mitigated",
-            "case studies show meaningful impact",
-        ])
+        return self.rng.choice(SUPPORT_PHRASES)
 
     def _claim_phrase(self, topic):
-        return self.rng.choice([
-            f"{topic} should balance innovation with caution",
-            f"we must consider ethical consequences of {topic}",
-            f"regulation may be appropriate depending on risk profiles of {topic}",
-        ])
+        return self.rng.choice([claim.format(topic=topic) for claim in CLAIM_PHRASES])
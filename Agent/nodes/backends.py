@@ -0,0 +1,220 @@
+import abc
+import json
+import queue
+import threading
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+# asyncio and http.client are imported where HTTPBackend uses them, so template-only runs start faster
+
+# phrase tables for TemplateBackend; AgentNode draws from them with its seeded RNG
+REASON_PHRASES = (
+    "it presents measurable risks to public safety",
+    "it fosters responsible development",
+    "historical precedents suggest oversight is needed",
+    "unchecked progress can cause long-term harm",
+)
+SUPPORT_PHRASES = (
+    "for example, consider high-risk applications",
+    "this can be addressed through standards",
+    "society benefits when harms are mitigated",
+    "case studies show meaningful impact",
+)
+CLAIM_PHRASES = (
+    "{topic} should balance innovation with caution",
+    "we must consider ethical consequences of {topic}",
+    "regulation may be appropriate depending on risk profiles of {topic}",
+)
+
+
+class TurnRequest:
+    """Everything a backend may use to produce one candidate argument."""
+
+    __slots__ = ("agent", "persona", "topic", "memory", "round", "attempt")
+
+    def __init__(self, agent: str, persona: str, topic: str, memory: dict, round: int, attempt: int):
+        self.agent = agent
+        self.persona = persona
+        self.topic = topic
+        self.memory = memory
+        self.round = round
+        self.attempt = attempt
+
+    def to_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+class GenerationBackend(abc.ABC):
+    """Produces candidate turn texts for an AgentNode.
+
+    ``generate`` returns one candidate; ``vary`` may return a variant of a
+    candidate that was rejected as a duplicate, or ``None`` to make the agent
+    ask for a fresh candidate instead.
+    """
+
+    @abc.abstractmethod
+    def generate(self, agent, request: TurnRequest) -> str:
+        ...
+
+    async def agenerate(self, agent, request: TurnRequest) -> str:
+        return self.generate(agent, request)
+
+    def vary(self, agent, request: TurnRequest, text: str) -> Optional[str]:
+        return None
+
+    def candidates(self, agent, topic: str) -> Optional[List[str]]:
+        # every text generate() and vary() can produce for this agent and topic; None when not enumerable
+        return None
+
+    def close(self):
+        pass
+
+
+class TemplateBackend(GenerationBackend):
+    """The built-in seeded template generator (uses the agent's own RNG)."""
+
+    def generate(self, agent, request: TurnRequest) -> str:
+        topic = request.topic
+        # generate a short argument combining persona and seeded behavior
+        base_templates = [
+            f"As {agent.name}, I contend that {topic} because {agent._reason_phrase()}",
+            f"{agent._reason_phrase().capitalize()} is why {topic} matters, and {agent._support_phrase()}",
+            f"From my perspective ({agent.persona_text.splitlines()[0] if agent.persona_text else agent.name}), {agent._claim_phrase(topic)}",
+        ]
+        return agent.rng.choice(base_templates)
+
+    def vary(self, agent, request: TurnRequest, text: str) -> Optional[str]:
+        return text + " " + agent._support_phrase()
+
+    def candidates(self, agent, topic: str) -> List[str]:
+        # the same templates as generate(), expanded over every phrase, plus each vary() suffix
+        opener = agent.persona_text.splitlines()[0] if agent.persona_text else agent.name
+        texts = [f"As {agent.name}, I contend that {topic} because {reason}" for reason in REASON_PHRASES]
+        texts += [f"{reason.capitalize()} is why {topic} matters, and {support}"
+                  for reason in REASON_PHRASES for support in SUPPORT_PHRASES]
+        texts += [f"From my perspective ({opener}), {claim.format(topic=topic)}" for claim in CLAIM_PHRASES]
+        return texts + [f"{text} {support}" for text in texts for support in SUPPORT_PHRASES]
+
+
+class _ConnectionPool:
+    # keep-alive HTTP connections shared by the caller's threads
+    def __init__(self, url: str, size: int, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port
+        self.path = parts.path or "/generate"
+        self.https = parts.scheme == "https"
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _connect(self):
+        import http.client
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def post_json(self, payload: dict) -> dict:
+        import http.client
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for retry in (False, True):
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                conn.request("POST", self.path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                conn.close()
+                # a pooled connection may have been dropped by the server; retry once on a fresh one
+                if retry:
+                    raise
+                continue
+            if resp.status != 200:
+                conn.close()
+                raise Exception(f"Backend returned HTTP {resp.status}: {data[:200]!r}")
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+            return json.loads(data)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HTTPBackend(GenerationBackend):
+    """Client for a text-generation endpoint speaking the batch protocol.
+
+    POST ``{"prompts": [TurnRequest.to_dict(), ...]}`` and receive
+    ``{"texts": [...]}`` in the same order. Synchronous calls send a batch of
+    one over a pooled keep-alive connection. Async calls from concurrent
+    debates are micro-batched: prompts collect for up to ``batch_window``
+    seconds or until ``max_batch`` are pending, then go out as one request.
+    """
+
+    def __init__(self, url: str, max_batch: int = 32, batch_window: float = 0.005, pool_size: int = 8, timeout: float = 30.0):
+        self.url = url
+        self.max_batch = max(1, max_batch)
+        self.batch_window = batch_window
+        self.pool = _ConnectionPool(url, pool_size, timeout)
+        self.requests_sent = 0
+        self.prompts_sent = 0
+        self._stats_lock = threading.Lock()
+        self._pending = []
+        self._flush_handle = None
+
+    def generate(self, agent, request: TurnRequest) -> str:
+        return self._post([request])[0]
+
+    async def agenerate(self, agent, request: TurnRequest) -> str:
+        import asyncio
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    def close(self):
+        self.pool.close()
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            import asyncio
+            asyncio.get_running_loop().create_task(self._send(batch))
+
+    async def _send(self, batch):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        try:
+            texts = await loop.run_in_executor(None, self._post, [r for r, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), text in zip(batch, texts):
+            if not future.done():
+                future.set_result(text)
+
+    def _post(self, requests: List[TurnRequest]) -> List[str]:
+        reply = self.pool.post_json({"prompts": [r.to_dict() for r in requests]})
+        texts = reply.get("texts")
+        if not isinstance(texts, list) or len(texts) != len(requests):
+            raise Exception("Backend reply does not match the batch size")
+        with self._stats_lock:
+            self.requests_sent += 1
+            self.prompts_sent += len(requests)
+        return texts
@@ -0,0 +1,137 @@
+import difflib
+import functools
+from typing import List, Optional, Tuple
+
+from nodes.similarity_index import SimilarityIndex
+
+
+class SimilarityRows:
+    """Near-duplicate pairs within a fixed candidate list, verified on demand.
+
+    ``row(i, is_open)`` lists the open candidates j that ``is_duplicate``
+    rejects once text i has been said (the ratio of j against i). Pairs are
+    narrowed with the same MinHash LSH bands as ``SimilarityIndex`` and then
+    verified with SequenceMatcher; each verified pair is kept, so pools over
+    the same candidates (the same agent and topic in later debates) reuse
+    the work. A pair LSH misses is still caught by the caller's duplicate
+    check when that candidate comes up.
+    """
+
+    def __init__(self, texts: Tuple[str, ...], threshold: float = 0.75):
+        self.texts = texts
+        self.threshold = threshold
+        self.index = SimilarityIndex(threshold=threshold, exact_below=0)
+        for text in texts:
+            self.index.add(text)
+        self._lowered = [t.lower() for t in texts]
+        self._candidates = {}
+        self._pairs = {}
+
+    def row(self, i: int, is_open=None) -> List[int]:
+        candidates = self._candidates.get(i)
+        if candidates is None:
+            candidates = self._candidates[i] = [j for j in self.index.candidates(self.texts[i]) if j != i]
+        prior = self._lowered[i]
+        sm = None
+        found = []
+        for j in candidates:
+            if is_open is not None and not is_open(j):
+                continue
+            similar = self._pairs.get((i, j))
+            if similar is None:
+                if sm is None:
+                    # SequenceMatcher caches its analysis of the second sequence, so prior stays fixed
+                    sm = difflib.SequenceMatcher(None, "", prior)
+                similar = self._pairs[i, j] = self._similar(sm, self._lowered[j], prior)
+            if similar:
+                found.append(j)
+        return found
+
+    def _similar(self, sm, new: str, prior: str) -> bool:
+        n, m = len(new), len(prior)
+        if n + m and 2.0 * min(n, m) / (n + m) < self.threshold:
+            return False
+        sm.set_seq1(new)
+        return sm.quick_ratio() >= self.threshold and sm.ratio() >= self.threshold
+
+
+@functools.lru_cache(maxsize=64)
+def similarity_rows(texts: Tuple[str, ...], threshold: float = 0.75) -> SimilarityRows:
+    # shared by every pool over the same candidates (same agent and topic across debates)
+    return SimilarityRows(texts, threshold)
+
+
+class CandidatePool:
+    """Every argument an agent can make on one topic, in a seeded order.
+
+    The texts come from ``GenerationBackend.candidates``. Using a text, or
+    seeing it in the transcript, blocks it and its near-duplicates, and a
+    cursor skips blocked texts, so picking the next argument is O(1)
+    amortized instead of a redraw-and-compare loop. Texts the pool does not
+    know about (other agents' turns) are caught by the caller's duplicate
+    check, and a rejected candidate stays blocked. ``remaining`` counts the
+    texts still usable; at 0 the agent is known to be out of arguments
+    before it tries.
+    """
+
+    def __init__(self, texts: List[str], rng, threshold: float = 0.75):
+        self.texts = list(dict.fromkeys(texts))
+        self.similar = similarity_rows(tuple(self.texts), threshold)
+        self.order = list(range(len(self.texts)))
+        rng.shuffle(self.order)
+        self.position = {t: i for i, t in enumerate(self.texts)}
+        self.reset()
+
+    def reset(self):
+        self.blocked = bytearray(len(self.texts))
+        self.remaining = len(self.texts)
+        self.cursor = 0
+        self.synced = 0
+        # key of the last synced turn, so a different transcript is not mistaken for a continuation
+        self._last = None
+
+    def __len__(self):
+        return len(self.texts)
+
+    def block(self, i: int, neighbours: bool = True):
+        if not self.blocked[i]:
+            self.blocked[i] = 1
+            self.remaining -= 1
+        if neighbours:
+            # only still-open candidates need checking against i
+            for k in self.similar.row(i, lambda j: not self.blocked[j]):
+                self.blocked[k] = 1
+                self.remaining -= 1
+
+    def sync(self, turns: List[dict]):
+        # turns is an append-only transcript; a shorter or different one means a new debate
+        n = self.synced
+        if n > len(turns) or (n and self._last != self._key(turns[n - 1])):
+            self.reset()
+            n = 0
+        for t in turns[n:]:
+            i = self.position.get(t["text"])
+            if i is not None:
+                self.block(i)
+        if len(turns) > n:
+            self._last = self._key(turns[-1])
+        self.synced = len(turns)
+
+    @staticmethod
+    def _key(t):
+        return t.get("round"), t.get("agent"), t["text"]
+
+    def next(self, seen) -> Optional[str]:
+        # the next unblocked text that passes seen(); None when the pool is exhausted
+        while self.remaining:
+            i = self.order[self.cursor]
+            self.cursor += 1
+            if self.blocked[i]:
+                continue
+            text = self.texts[i]
+            if seen(text):
+                self.block(i, neighbours=False)
+                continue
+            self.block(i)
+            return text
+        return None
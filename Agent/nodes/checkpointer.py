@@ -0,0 +1,286 @@
+import hashlib
+import random
+import sqlite3
+import threading
+from typing import Any, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from nodes.transcript import Transcript
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL, ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, parent_id TEXT,
+    type TEXT, checkpoint BLOB, metadata_type TEXT, metadata BLOB,
+    PRIMARY KEY (thread_id, ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL, ns TEXT NOT NULL, channel TEXT NOT NULL, version TEXT NOT NULL,
+    type TEXT, data BLOB,
+    PRIMARY KEY (thread_id, ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL, ns TEXT NOT NULL, checkpoint_id TEXT NOT NULL, task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL, channel TEXT, type TEXT, data BLOB, task_path TEXT,
+    PRIMARY KEY (thread_id, ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS turns (
+    thread_id TEXT NOT NULL, ns TEXT NOT NULL, chain BLOB NOT NULL, parent BLOB, idx INTEGER NOT NULL,
+    round INTEGER, agent TEXT, text TEXT,
+    PRIMARY KEY (thread_id, ns, chain)
+);
+"""
+
+# the transcript ending at `chain`, oldest turn first
+_LOAD_TURNS = """
+WITH RECURSIVE chain(chain, parent, idx, round, agent, text) AS (
+    SELECT chain, parent, idx, round, agent, text FROM turns WHERE thread_id = ?1 AND ns = ?2 AND chain = ?3
+    UNION ALL
+    SELECT t.chain, t.parent, t.idx, t.round, t.agent, t.text FROM turns t JOIN chain c
+    ON t.thread_id = ?1 AND t.ns = ?2 AND t.chain = c.parent
+)
+SELECT round, agent, text FROM chain ORDER BY idx
+"""
+
+
+def _chain(parent: bytes, turn) -> bytes:
+    # identifies a whole transcript prefix: hash of the previous prefix's chain and this turn
+    data = f"{turn.round}\x00{turn.agent}\x00{turn.text}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(parent + data, digest_size=16).digest()
+
+
+class SqliteCheckpointer(BaseCheckpointSaver):
+    """SQLite-backed LangGraph checkpointer that stores transcripts as deltas.
+
+    Channels are stored per version like the in-memory saver, except that a
+    ``Transcript`` value (``DebateState.messages``) is written as the turns
+    appended since the last checkpoint plus its length. Per-step write cost is
+    therefore independent of debate length; the full transcript is only
+    rebuilt when a checkpoint is loaded (e.g. on resume).
+
+    Turn rows are keyed by a hash chain over the transcript prefix they end,
+    and link to the row before them. Histories that fork (resuming from an
+    earlier checkpoint, time travel) share the rows of their common prefix
+    and never overwrite each other's turns; channel versions carry a random
+    suffix so their blobs do not collide either.
+    """
+
+    def __init__(self, path: str, *, serde=None):
+        super().__init__(serde=serde)
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # (thread_id, ns) -> (turn store, length, chain) of the transcript last stored or loaded
+        self._stored_turns = {}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- writing ---
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # as in LangGraph's InMemorySaver: the random suffix keeps a forked run from reusing (and
+        # overwriting) the blob versions of the history it branched from
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint, metadata: CheckpointMetadata,
+            new_versions: ChannelVersions) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"].get("checkpoint_ns", "")
+        c = checkpoint.copy()
+        values = c.pop("channel_values")
+        with self._lock:
+            rows = []
+            for channel, version in new_versions.items():
+                if channel not in values:
+                    rows.append((thread_id, ns, channel, str(version), "empty", b""))
+                elif isinstance(values[channel], Transcript):
+                    chain = self._append_transcript(thread_id, ns, values[channel])
+                    rows.append((thread_id, ns, channel, str(version), "turns", chain))
+                else:
+                    type_, data = self.serde.dumps_typed(values[channel])
+                    rows.append((thread_id, ns, channel, str(version), type_, data))
+            self._conn.executemany("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", rows)
+            c_type, c_data = self.serde.dumps_typed(c)
+            m_type, m_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, ns, checkpoint["id"], config["configurable"].get("checkpoint_id"), c_type, c_data,
+                 m_type, m_data),
+            )
+            self._conn.commit()
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": checkpoint["id"]}}
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str,
+                   task_path: str = "") -> None:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, data = self.serde.dumps_typed(value)
+            rows.append((thread_id, ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx), channel, type_,
+                         data, task_path))
+        with self._lock:
+            # regular writes are idempotent; special (negative idx) writes replace
+            self._conn.executemany("INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   [r for r in rows if r[4] >= 0])
+            self._conn.executemany("INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   [r for r in rows if r[4] < 0])
+            self._conn.commit()
+
+    def _append_transcript(self, thread_id: str, ns: str, transcript: Transcript) -> bytes:
+        # caller holds self._lock; returns the chain of the whole transcript
+        key = (thread_id, ns)
+        store, stored, chain = self._stored_turns.get(key, (None, 0, b""))
+        # views of one store share their prefix, so only the turns past the stored one are new;
+        # any other transcript is re-chained from the start and rows it shares are skipped
+        if transcript._store is not store or len(transcript) < stored:
+            stored, chain = 0, b""
+        n = len(transcript)
+        rows = []
+        for i, t in enumerate(transcript[stored:n], stored):
+            parent, chain = chain, _chain(chain, t)
+            rows.append((thread_id, ns, chain, parent or None, i, t.round, t.agent, t.text))
+        self._conn.executemany("INSERT OR IGNORE INTO turns VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self._stored_turns[key] = (transcript._store, n, chain)
+        return chain
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            for table in ("checkpoints", "blobs", "writes", "turns"):
+                self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self._conn.commit()
+            for key in [k for k in self._stored_turns if k[0] == thread_id]:
+                del self._stored_turns[key]
+
+    # --- reading ---
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        with self._lock:
+            if checkpoint_id:
+                row = self._conn.execute(
+                    "SELECT checkpoint_id, parent_id, type, checkpoint, metadata_type, metadata FROM checkpoints "
+                    "WHERE thread_id = ? AND ns = ? AND checkpoint_id = ?", (thread_id, ns, checkpoint_id)).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT checkpoint_id, parent_id, type, checkpoint, metadata_type, metadata FROM checkpoints "
+                    "WHERE thread_id = ? AND ns = ? ORDER BY checkpoint_id DESC LIMIT 1", (thread_id, ns)).fetchone()
+            if row is None:
+                return None
+            return self._tuple(thread_id, ns, row)
+
+    def list(self, config: Optional[RunnableConfig], *, filter: Optional[dict] = None,
+             before: Optional[RunnableConfig] = None, limit: Optional[int] = None) -> Iterator[CheckpointTuple]:
+        query = ("SELECT thread_id, ns, checkpoint_id, parent_id, type, checkpoint, metadata_type, metadata "
+                 "FROM checkpoints")
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if "checkpoint_ns" in config["configurable"]:
+                clauses.append("ns = ?")
+                params.append(config["configurable"]["checkpoint_ns"])
+        if before and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        count = 0
+        for row in rows:
+            with self._lock:
+                tup = self._tuple(row[0], row[1], row[2:])
+            if filter and any(tup.metadata.get(k) != v for k, v in filter.items()):
+                continue
+            yield tup
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+    def _tuple(self, thread_id: str, ns: str, row) -> CheckpointTuple:
+        # caller holds self._lock
+        checkpoint_id, parent_id, c_type, c_data, m_type, m_data = row
+        checkpoint = self.serde.loads_typed((c_type, c_data))
+        writes = self._conn.execute(
+            "SELECT task_id, channel, type, data, task_path, idx FROM writes "
+            "WHERE thread_id = ? AND ns = ? AND checkpoint_id = ?", (thread_id, ns, checkpoint_id)).fetchall()
+        writes.sort(key=lambda w: (w[4] or "", w[0], w[5]))
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": checkpoint_id}},
+            checkpoint={**checkpoint,
+                        "channel_values": self._load_blobs(thread_id, ns, checkpoint["channel_versions"])},
+            metadata=self.serde.loads_typed((m_type, m_data)),
+            pending_writes=[(w[0], w[1], self.serde.loads_typed((w[2], w[3]))) for w in writes],
+            parent_config=({"configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": parent_id}}
+                           if parent_id else None),
+        )
+
+    def _load_blobs(self, thread_id: str, ns: str, versions: ChannelVersions) -> dict:
+        values = {}
+        for channel, version in versions.items():
+            row = self._conn.execute(
+                "SELECT type, data FROM blobs WHERE thread_id = ? AND ns = ? AND channel = ? AND version = ?",
+                (thread_id, ns, channel, str(version))).fetchone()
+            if row is None or row[0] == "empty":
+                continue
+            if row[0] == "turns":
+                chain = bytes(row[1])
+                turns = self._conn.execute(_LOAD_TURNS, (thread_id, ns, chain)).fetchall() if chain else []
+                transcript = Transcript({"round": r, "agent": a, "text": t} for r, a, t in turns)
+                # a resumed run extends this view, so its next checkpoint only hashes the new turns
+                self._stored_turns[(thread_id, ns)] = (transcript._store, len(transcript), chain)
+                values[channel] = transcript
+            else:
+                values[channel] = self.serde.loads_typed(row)
+        return values
+
+    # --- async: SQLite calls are short, so the async API runs them inline ---
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        for tup in self.list(config, filter=filter, before=before, limit=limit):
+            yield tup
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        return self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return self.delete_thread(thread_id)
@@ -1,8 +1,21 @@
 class RoundCoordinator:
-    def __init__(self, total_rounds=8, logger=None):
+    def __init__(self, total_rounds=8, logger=None, schedule=None):
         self.total = total_rounds
         self._round = 1
         self.logger = logger
+        # optional precomputed speaker per round (see nodes/debate_config.py)
+        self.schedule = None
+        if schedule is not None:
+            self.use_schedule(schedule)
+
+    def use_schedule(self, schedule):
+        self.schedule = tuple(schedule)
+        self.total = len(self.schedule)
+
+    def expected_agent(self):
+        if self.schedule is None or self.finished():
+            return None
+        return self.schedule[self._round - 1]
 
     def round_number(self):
         return self._round
@@ -16,7 +29,9 @@ class RoundCoordinator:
             if self.logger:
                 self.logger.log_event({"event":"advance_round","round":self._round})
 
-    def require_turn(self, agent_name, expected_agent):
-        # expected_agent is name of agent expected at this turn
+    def require_turn(self, agent_name, expected_agent=None):
+        # expected_agent is name of agent expected at this turn; defaults to the schedule's
+        if expected_agent is None:
+            expected_agent = self.expected_agent()
         if agent_name != expected_agent:
             raise Exception(f"Out of order turn: expected {expected_agent}, got {agent_name}")
@@ -0,0 +1,87 @@
+import json
+import os
+from typing import List, Optional, Sequence
+
+from nodes.agent_node import AgentNode
+
+PERSONA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "persona_templates")
+# graph node names an agent may not take
+RESERVED_NAMES = ("Memory", "Judge", "__start__", "__end__")
+
+
+def round_robin(names: Sequence[str], rounds: int, order: Optional[Sequence[str]] = None) -> tuple:
+    # speaker for every round, precomputed so routing is one tuple lookup per turn
+    cycle = list(order or names)
+    return tuple(cycle[r % len(cycle)] for r in range(rounds))
+
+
+class AgentSpec:
+    __slots__ = ("name", "persona_path", "seed_offset")
+
+    def __init__(self, name: str, persona_path: str, seed_offset: int):
+        self.name = name
+        self.persona_path = persona_path
+        self.seed_offset = seed_offset
+
+
+class DebateConfig:
+    """Who debates and in which order.
+
+    ``schedule[r - 1]`` is the agent that speaks in round ``r``; its length is
+    the number of rounds. Agent ``i`` is seeded with ``seed + i`` unless the
+    config gives a ``seed_offset``, so the default pair matches the original
+    AgentA/AgentB seeding.
+    """
+
+    def __init__(self, agents: List[AgentSpec], rounds: int = 8, order: Optional[Sequence[str]] = None):
+        names = [a.name for a in agents]
+        if len(agents) < 2:
+            raise ValueError("A debate needs at least two agents")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Agent names must be unique: {names}")
+        for name in names:
+            if name in RESERVED_NAMES:
+                raise ValueError(f"Agent name {name!r} is reserved")
+        if rounds < 1:
+            raise ValueError("rounds must be at least 1")
+        unknown = [n for n in (order or ()) if n not in names]
+        if unknown:
+            raise ValueError(f"Turn order names unknown agents: {unknown}")
+        self.agents = list(agents)
+        self.rounds = rounds
+        self.schedule = round_robin(names, rounds, order)
+
+    @property
+    def names(self) -> tuple:
+        return tuple(a.name for a in self.agents)
+
+    @classmethod
+    def default(cls, rounds: int = 8) -> "DebateConfig":
+        return cls([AgentSpec("AgentA", persona_path("scientist"), 0),
+                    AgentSpec("AgentB", persona_path("philosopher"), 1)], rounds)
+
+    @classmethod
+    def from_dict(cls, data: dict, base_dir: str = None) -> "DebateConfig":
+        agents = []
+        for i, entry in enumerate(data.get("agents", [])):
+            agents.append(AgentSpec(entry["name"], persona_path(entry["persona"], base_dir),
+                                    entry.get("seed_offset", i)))
+        return cls(agents, data.get("rounds", 8), data.get("order"))
+
+    @classmethod
+    def load(cls, path: str) -> "DebateConfig":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), os.path.dirname(os.path.abspath(path)))
+
+    def build_agents(self, seed: int, **kwargs) -> list:
+        # one AgentNode per spec; kwargs (logger, memory, backend, cache) are shared
+        return [AgentNode(a.name, persona_path=a.persona_path, seed=seed + a.seed_offset, **kwargs) for a in self.agents]
+
+
+def persona_path(persona: str, base_dir: str = None) -> str:
+    # a bare name ("scientist") means persona_templates/<name>.txt; anything else is a path
+    if os.sep not in persona and "/" not in persona and not persona.endswith(".txt"):
+        return os.path.join(PERSONA_DIR, f"{persona}.txt")
+    if base_dir and not os.path.isabs(persona):
+        return os.path.join(base_dir, persona)
+    return persona
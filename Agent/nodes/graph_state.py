@@ -1,12 +1,22 @@
-from typing import TypedDict, List, Annotated
-import operator
+from typing import TypedDict, Annotated
+
+from nodes.transcript import Transcript, append_turns
+
+
+def merge_dicts(left: dict, right: dict) -> dict:
+    return {**(left or {}), **(right or {})}
+
 
 class DebateState(TypedDict):
-    # The list of messages in the conversation
-    messages: Annotated[List[dict], operator.add]
+    # Append-only transcript of the conversation (nodes return new turns as a list)
+    messages: Annotated[Transcript, append_turns]
     # Current round number (1-8)
     round_count: int
     # Summary of the conversation so far
     summary: str
     # The final verdict from the judge
     verdict: dict
+    # Debate topic; lets one compiled graph serve many debates
+    topic: str
+    # RNG state of each agent after its last turn, so a resumed debate continues identically
+    agent_rng: Annotated[dict, merge_dicts]
@@ -0,0 +1,133 @@
+import collections
+import operator
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from nodes.judge_node import JudgeNode
+
+_INFER = JudgeNode()._infer_topic
+
+
+class BatchScores:
+    """Flat per-(debate, agent) totals for many transcripts.
+
+    Pairs of debate ``d`` occupy ``pair_start[d]:pair_start[d + 1]``, with
+    agents in first-appearance order (the order ``JudgeNode``'s Counter
+    keeps). ``winner_pair[d]`` is -1 for an empty transcript.
+    """
+
+    def __init__(self, agents, pair_agent, pair_start, totals, winner_pair):
+        self.agents = agents
+        self.pair_agent = pair_agent
+        self.pair_start = pair_start
+        self.totals = totals
+        self.winner_pair = winner_pair
+
+    def __len__(self):
+        return len(self.pair_start) - 1
+
+    def winners(self) -> list:
+        names = [self.agents[a] for a in self.pair_agent[self.winner_pair].tolist()] if len(self.pair_agent) else []
+        return [names[d] if pair >= 0 else "AgentA" for d, pair in enumerate(self.winner_pair.tolist())]
+
+    def scores(self, debate: int) -> dict:
+        lo, hi = self.pair_start[debate], self.pair_start[debate + 1]
+        return dict(zip((self.agents[a] for a in self.pair_agent[lo:hi].tolist()), self.totals[lo:hi].tolist()))
+
+
+def _intern(values):
+    # (id per value, distinct values in first-appearance order); itemgetter keeps the lookup loop in C
+    ids = {v: i for i, v in enumerate(dict.fromkeys(values))}
+    if len(values) < 2:
+        return np.asarray([ids[v] for v in values], dtype=np.int64), list(ids)
+    return np.asarray(operator.itemgetter(*values)(ids), dtype=np.int64), list(ids)
+
+
+def score_batch(transcripts: Sequence) -> BatchScores:
+    """Score every transcript at once; same heuristics as ``JudgeNode.judge``.
+
+    Each distinct text is tokenized once and each distinct (topic word, text)
+    pair is checked once; everything per turn is a NumPy gather, and the
+    per-agent totals are one segment sum.
+    """
+    lengths = np.asarray([len(turns) for turns in transcripts], dtype=np.int64)
+    n_debates = len(lengths)
+    text_of_turn, texts = _intern([t["text"] for turns in transcripts for t in turns])
+    agent_of_turn, agents = _intern([t["agent"] for turns in transcripts for t in turns])
+    n_texts, n_agents = max(len(texts), 1), max(len(agents), 1)
+
+    # word count minus the short-turn penalty, per distinct text
+    base = np.asarray([len(s.split()) - (s.count(" ") < 5) for s in texts], dtype=np.int64)
+    score = base[text_of_turn]
+
+    # topic words (up to 3, -1 padded) per debate, inferred once per distinct opening text
+    debate_of_turn = np.repeat(np.arange(n_debates), lengths)
+    nonempty = np.flatnonzero(lengths)
+    openers = np.unique(text_of_turn[(np.cumsum(lengths) - lengths)[nonempty]])
+    word_ids = {}
+    opener_words = np.full((n_texts, 3), -1, dtype=np.int64)
+    for i in openers.tolist():
+        for j, w in enumerate(_INFER(texts[i]).split()):
+            opener_words[i, j] = word_ids.setdefault(w.lower(), len(word_ids))
+    debate_words = np.full((n_debates, 3), -1, dtype=np.int64)
+    debate_words[nonempty] = opener_words[text_of_turn[(np.cumsum(lengths) - lengths)[nonempty]]]
+    turn_words = debate_words[debate_of_turn]
+
+    # topic overlap: each distinct (word, text) is a substring test done once
+    valid = turn_words >= 0
+    pairs, pair_hit = np.unique((turn_words * n_texts + text_of_turn[:, None])[valid], return_inverse=True)
+    words = list(word_ids)
+    lowered = {}
+    hits = []
+    for key in pairs.tolist():
+        w, t = divmod(key, n_texts)
+        if t not in lowered:
+            lowered[t] = texts[t].lower()
+        hits.append(words[w] in lowered[t])
+    overlap = np.zeros(turn_words.shape, dtype=bool)
+    overlap[valid] = np.asarray(hits, dtype=bool)[pair_hit.ravel()]
+    score += 2 * overlap.any(axis=1)
+
+    # (debate, agent) pairs ordered by first appearance within each debate
+    key = debate_of_turn * n_agents + agent_of_turn
+    keys, first, pair_of_turn = np.unique(key, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    order = order[np.argsort(keys[order] // n_agents, kind="stable")]
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    pair_of_turn = rank[pair_of_turn.ravel()]
+    pair_agent = (keys % n_agents)[order]
+    n_pairs = len(pair_agent)
+    pair_start = np.zeros(n_debates + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // n_agents, minlength=n_debates), out=pair_start[1:])
+
+    # segment sum per pair; float64 is exact for these magnitudes
+    totals = np.rint(np.bincount(pair_of_turn, weights=score, minlength=n_pairs)).astype(np.int64)
+
+    winner_pair = np.full(n_debates, -1, dtype=np.int64)
+    if n_pairs:
+        sizes = np.diff(pair_start)
+        has_pairs = np.flatnonzero(sizes)
+        best = np.maximum.reduceat(totals, pair_start[has_pairs])
+        # the first pair at the maximum wins, as with Counter.most_common's stable sort
+        best_pairs = np.flatnonzero(totals == np.repeat(best, sizes[has_pairs]))
+        debate_of_pair = np.repeat(np.arange(n_debates), sizes)
+        debates, at = np.unique(debate_of_pair[best_pairs], return_index=True)
+        winner_pair[debates] = best_pairs[at]
+    return BatchScores(agents, pair_agent, pair_start, totals, winner_pair)
+
+
+def judge_batch(transcripts: Sequence, summaries: Optional[Sequence[str]] = None) -> List[dict]:
+    """Verdicts for many transcripts, identical to ``JudgeNode().judge(turns, summary)`` for each (nothing is logged)."""
+    batch = score_batch(transcripts)
+    agents, pair_agent, totals = batch.agents, batch.pair_agent.tolist(), batch.totals.tolist()
+    bounds = batch.pair_start.tolist()
+    verdicts = []
+    for d, winner in enumerate(batch.winners()):
+        lo, hi = bounds[d], bounds[d + 1]
+        scores = dict(zip([agents[a] for a in pair_agent[lo:hi]], totals[lo:hi]))
+        justification = f"{winner} had higher aggregate score ({collections.Counter(scores)})."
+        verdicts.append({"summary": summaries[d] if summaries is not None else "", "winner": winner,
+                         "justification": justification, "scores": scores})
+    return verdicts
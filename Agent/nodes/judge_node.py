@@ -5,25 +5,35 @@ from typing import Dict
 class JudgeNode:
     def __init__(self, logger=None):
         self.logger = logger
+        # running per-agent scores, updated as turns arrive (see update)
+        self.scores = collections.Counter()
+        self._topic_words = None
+        self._scored = 0
+        self._last = None
+
+    def update(self, turns: list) -> collections.Counter:
+        # score only turns not seen yet; a transcript that is not a continuation of the scored one starts over
+        n = self._scored
+        if n > len(turns) or (n and self._last != self._key(turns[n - 1])):
+            self.reset()
+            n = 0
+        for t in turns[n:]:
+            self._score_turn(t)
+        return self.scores
+
+    def current_scores(self) -> dict:
+        return dict(self.scores)
+
+    def reset(self):
+        self.scores = collections.Counter()
+        self._topic_words = None
+        self._scored = 0
+        self._last = None
 
     def judge(self, turns: list, summary: str) -> Dict:
 
-        # basic scoring: count novel (non-duplicate) phrases and topic overlap
-        scores = collections.Counter()
-        topic = "" if not turns else self._infer_topic(turns[0]["text"]) or ""
-
-        for t in turns:
-            agent = t["agent"]
-            text = t["text"]
-            score = 0
-            score += len(text.split())
-            # novelty heuristic: penalize reused short suffixes
-            if text.count(" ") < 5:
-                score -= 1
-            # topic overlap
-            if topic and any(word.lower() in text.lower() for word in topic.split()):
-                score += 2
-            scores[agent] += score
+        # basic scoring: count novel (non-duplicate) phrases and topic overlap, kept up to date by update()
+        scores = self.update(turns)
 
         # determine winner
         winner = scores.most_common(1)[0][0] if scores else "AgentA"
@@ -34,6 +44,31 @@ class JudgeNode:
             self.logger.log_event({"event":"judge_verdict","verdict":verdict})
         return verdict
 
+    def _score_turn(self, t):
+        text = t["text"]
+        if self._topic_words is None:
+            # the topic is guessed from the first turn; its words are lowercased once
+            self._topic_words = [w.lower() for w in self._infer_topic(text).split()]
+        score = len(text.split())
+        # novelty heuristic: penalize reused short suffixes
+        if text.count(" ") < 5:
+            score -= 1
+        # topic overlap
+        if self._topic_words:
+            lowered = text.lower()
+            if any(word in lowered for word in self._topic_words):
+                score += 2
+        self.scores[t["agent"]] += score
+        self._scored += 1
+        self._last = self._key(t)
+
+    @staticmethod
+    def _key(t):
+        return t.get("round"), t["agent"], t["text"]
+
+    async def ajudge(self, turns: list, summary: str) -> Dict:
+        return self.judge(turns, summary)
+
     def _infer_topic(self, text: str) -> str:
         # crude guess: pick words that are not stopwords (very simple)
         words = [w for w in text.split() if len(w) > 3]
@@ -0,0 +1,153 @@
+import typing
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional
+
+START = "__start__"
+END = "__end__"
+
+Edge = namedtuple("Edge", "source target conditional")
+
+
+class LocalGraph:
+    """Minimal in-process stand-in for a compiled LangGraph ``StateGraph``.
+
+    Supports what the debate graph uses: one node per step, fixed and
+    conditional edges, ``Annotated[type, reducer]`` state keys (which start
+    at ``type()``, like LangGraph's aggregate channels), keys outside the
+    schema being dropped, ``invoke``/``ainvoke``, ``stream``/``astream`` in
+    "values" or "updates" mode, ``with_config`` and ``get_graph`` for the
+    text exporters in generate_dag.py. There is no checkpointing, parallel
+    branches or interrupts, and importing it does not pull in LangGraph.
+    """
+
+    def __init__(self, state_schema):
+        hints = typing.get_type_hints(state_schema, include_extras=True)
+        self.keys = set(hints)
+        # key -> (reducer, base type) for Annotated keys
+        self.reducers = {}
+        for key, hint in hints.items():
+            if typing.get_origin(hint) is typing.Annotated:
+                base, reducer = typing.get_args(hint)[:2]
+                self.reducers[key] = (reducer, base)
+        self.nodes: Dict[str, tuple] = {}
+        self.edges: Dict[str, Callable] = {}
+        # (source, target, conditional) in insertion order, for get_graph
+        self.edge_list: List[Edge] = []
+        self.config = {}
+
+    def add_node(self, name: str, func: Callable, afunc: Optional[Callable] = None):
+        self.nodes[name] = (func, afunc)
+
+    def add_edge(self, source: str, target: str):
+        self.edges[source] = lambda state, config: target
+        self.edge_list.append(Edge(source, target, False))
+
+    def add_conditional_edges(self, source: str, router: Callable, path_map: Optional[dict] = None):
+        if path_map is None:
+            self.edges[source] = router
+        else:
+            self.edges[source] = lambda state, config: path_map[router(state, config)]
+            self.edge_list.extend(Edge(source, target, True) for target in dict.fromkeys(path_map.values()))
+
+    def compile(self, checkpointer=None) -> "LocalGraph":
+        if checkpointer is not None:
+            raise ValueError("The local engine does not support checkpointing")
+        return self
+
+    def with_config(self, config: Optional[dict] = None, **kwargs) -> "LocalGraph":
+        bound = LocalGraph.__new__(LocalGraph)
+        bound.__dict__.update(self.__dict__)
+        bound.config = _merge_config(self.config, {**(config or {}), **kwargs})
+        return bound
+
+    def get_graph(self) -> "GraphView":
+        return GraphView([START, *self.nodes, END], self.edge_list)
+
+    def _start(self, input: dict, config: Optional[dict]):
+        if input is None:
+            raise ValueError("The local engine cannot resume from a checkpoint")
+        config = _merge_config(self.config, config or {})
+        state = {key: base() for key, (reducer, base) in self.reducers.items()}
+        self._apply(state, input)
+        return state, config, config.get("recursion_limit", 25)
+
+    def _apply(self, state: dict, update: dict) -> dict:
+        applied = {}
+        for key, value in (update or {}).items():
+            if key not in self.keys:
+                continue
+            if key in self.reducers:
+                state[key] = self.reducers[key][0](state.get(key), value)
+            else:
+                state[key] = value
+            applied[key] = value
+        return applied
+
+    def _next(self, node: str, state: dict, config: dict, steps: int, limit: int) -> str:
+        target = self.edges[node](state, config) if node in self.edges else END
+        if target != END and steps >= limit:
+            raise RecursionError(f"Recursion limit of {limit} reached without hitting a stop condition")
+        return target
+
+    def stream(self, input: dict, config: Optional[dict] = None, stream_mode: str = "values"):
+        state, config, limit = self._start(input, config)
+        if stream_mode == "values":
+            yield dict(state)
+        node, steps = self._next(START, state, config, 0, limit), 0
+        while node != END:
+            update = self.nodes[node][0](dict(state), config)
+            steps += 1
+            applied = self._apply(state, update)
+            yield dict(state) if stream_mode == "values" else {node: applied}
+            node = self._next(node, state, config, steps, limit)
+
+    async def astream(self, input: dict, config: Optional[dict] = None, stream_mode: str = "values"):
+        state, config, limit = self._start(input, config)
+        if stream_mode == "values":
+            yield dict(state)
+        node, steps = self._next(START, state, config, 0, limit), 0
+        while node != END:
+            func, afunc = self.nodes[node]
+            update = await afunc(dict(state), config) if afunc else func(dict(state), config)
+            steps += 1
+            applied = self._apply(state, update)
+            yield dict(state) if stream_mode == "values" else {node: applied}
+            node = self._next(node, state, config, steps, limit)
+
+    def invoke(self, input: dict, config: Optional[dict] = None) -> dict:
+        state = None
+        for state in self.stream(input, config, stream_mode="values"):
+            pass
+        return state
+
+    async def ainvoke(self, input: dict, config: Optional[dict] = None) -> dict:
+        state = None
+        async for state in self.astream(input, config, stream_mode="values"):
+            pass
+        return state
+
+
+class GraphView:
+    """Node ids and edges of a LocalGraph, shaped like LangGraph's drawable graph."""
+
+    def __init__(self, nodes: List[str], edges: List[Edge]):
+        self.nodes = {node_id: None for node_id in nodes}
+        self.edges = list(edges)
+
+    def draw_mermaid(self) -> str:
+        lines = ["graph TD;"]
+        for node_id in self.nodes:
+            lines.append(f"\t{node_id}([<p>{node_id}</p>])" if node_id in (START, END) else f"\t{node_id}({node_id})")
+        for edge in self.edges:
+            lines.append(f"\t{edge.source} {'-.->' if edge.conditional else '-->'} {edge.target};")
+        return "\n".join(lines) + "\n"
+
+    def draw_mermaid_png(self) -> bytes:
+        raise ValueError("PNG rendering needs the langgraph engine; use a .mmd or .dot path")
+
+
+def _merge_config(base: dict, extra: dict) -> dict:
+    merged = {**base, **extra}
+    if "configurable" in base and "configurable" in extra:
+        merged["configurable"] = {**base["configurable"], **extra["configurable"]}
+    return merged
@@ -0,0 +1,447 @@
+import contextlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import struct
+import tempfile
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from nodes.log_reader import DebateTracker
+from nodes.log_segments import is_segmented, iter_segment_lines
+
+FORMATS = ("npz", "parquet")
+# column kinds: "i4"/"i8" integers, "dict:<name>" int32 codes into a shared dictionary (-1 = null), "str" text
+SCHEMAS = {
+    "events": {"ts_us": "i8", "debate": "i4", "event": "dict:event", "agent": "dict:agent", "round": "i4",
+               "text": "str"},
+    "debates": {"debate": "i4", "source": "dict:source", "topic": "dict:topic", "seed": "i8", "rounds": "i4",
+                "winner": "dict:agent"},
+    "scores": {"debate": "i4", "agent": "dict:agent", "score": "i8"},
+}
+# seed of a debate whose start_debate carried none
+NO_SEED = -1
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# LoggerNode writes {"ts": ..., "event": ..., "agent": ...} first; these events need nothing past that head
+_HEAD = re.compile(rb'\{"ts": "([^"]*)", "event": "([^"\\]*)"(?:, "agent": "((?:[^"\\]|\\.)*)")?')
+_HEAD_ONLY = {b"memory_requested", b"summary_updated"}
+
+
+def pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class _Dictionary:
+    # append-only value -> code mapping, so codes written in early chunks stay valid
+    __slots__ = ("codes", "values")
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _NpzTable:
+    """Streams one table into an uncompressed ``.npz``.
+
+    Each column is appended to a scratch file as chunks arrive; ``close``
+    wraps the files as ``.npy`` members of a stored (not deflated) zip, so
+    ``load_columns`` can memory-map every column in place.
+    """
+
+    def __init__(self, path: str, schema: dict):
+        self.path = path
+        self.schema = schema
+        self.scratch = tempfile.mkdtemp(prefix=".export-", dir=os.path.dirname(os.path.abspath(path)))
+        self.files = {}
+        self.rows = 0
+        for name, kind in schema.items():
+            if kind == "str":
+                self.files[name + ".offsets"] = self._open(name + ".offsets", np.int64)
+                np.zeros(1, dtype=np.int64).tofile(self.files[name + ".offsets"][0])
+                self.files[name + ".data"] = self._open(name + ".data", np.uint8)
+            else:
+                self.files[name] = self._open(name, np.int64 if kind == "i8" else np.int32)
+        self.text_bytes = {name: 0 for name, kind in schema.items() if kind == "str"}
+
+    def _open(self, member: str, dtype):
+        return open(os.path.join(self.scratch, member), "wb"), np.dtype(dtype)
+
+    def write(self, columns: dict, dictionaries: Dict[str, list]):
+        # dictionaries are written once, by close()
+        for name, kind in self.schema.items():
+            values = columns[name]
+            if kind == "str":
+                encoded = [v.encode("utf-8") for v in values]
+                lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+                (self.text_bytes[name] + np.cumsum(lengths)).tofile(self.files[name + ".offsets"][0])
+                self.files[name + ".data"][0].write(b"".join(encoded))
+                self.text_bytes[name] += int(lengths.sum())
+            else:
+                f, dtype = self.files[name]
+                np.asarray(values, dtype=dtype).tofile(f)
+        self.rows += len(next(iter(columns.values())))
+
+    def close(self, dictionaries: Dict[str, list]):
+        members = {}
+        for member, (f, dtype) in self.files.items():
+            f.close()
+            members[member] = (f.name, dtype)
+        try:
+            with zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+                for member, (path, dtype) in members.items():
+                    with open(path, "rb") as src, zf.open(member + ".npy", "w", force_zip64=True) as out:
+                        shape = (os.path.getsize(path) // dtype.itemsize,)
+                        np.lib.format.write_array_header_2_0(out, {"descr": dtype.str, "fortran_order": False,
+                                                                   "shape": shape})
+                        shutil.copyfileobj(src, out, 1 << 20)
+                for name, kind in self.schema.items():
+                    if kind.startswith("dict:"):
+                        with zf.open(name + ".dictionary.npy", "w") as out:
+                            np.save(out, np.asarray(dictionaries[kind[5:]], dtype=str))
+        finally:
+            shutil.rmtree(self.scratch, ignore_errors=True)
+
+
+class _ParquetTable:
+    """Streams one table into a Parquet file, one row group per chunk."""
+
+    def __init__(self, path: str, schema: dict):
+        import pyarrow  # noqa: F401  (fail early when the format was requested without pyarrow)
+        self.path = path
+        self.schema = schema
+        self.writer = None
+        self.rows = 0
+
+    def write(self, columns: dict, dictionaries: Dict[str, list]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = {}
+        for name, kind in self.schema.items():
+            values = columns[name]
+            if kind.startswith("dict:"):
+                codes = np.asarray(values, dtype=np.int32)
+                # the dictionary so far; codes are stable because dictionaries only grow
+                arrays[name] = pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0),
+                                                              pa.array(dictionaries[kind[5:]], pa.string()))
+            elif kind == "str":
+                arrays[name] = pa.array(values, pa.large_string())
+            else:
+                arrays[name] = pa.array(np.asarray(values, dtype=np.int64 if kind == "i8" else np.int32))
+        table = pa.table(arrays)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self, dictionaries: Dict[str, list]):
+        if self.writer is None:
+            # nothing was written: still leave an empty file with the right columns
+            self.write({name: [] for name in self.schema}, dictionaries)
+        self.writer.close()
+
+
+def _parse(line: bytes):
+    # (event dict or None, ts, name, agent) with a full JSON decode only when needed
+    head = _HEAD.match(line)
+    if head is not None and head.group(2) in _HEAD_ONLY:
+        agent = head.group(3)
+        if agent is not None:
+            agent = json.loads(b'"' + agent + b'"') if b"\\" in agent else agent.decode("utf-8")
+        return None, head.group(1).decode("ascii"), head.group(2).decode("ascii"), agent
+    event = json.loads(line)
+    agent = event.get("agent")
+    return event, event.get("ts"), event.get("event"), agent if isinstance(agent, str) else None
+
+
+def _ts_us(ts) -> int:
+    # microseconds since the epoch; a timestamp without offset is taken as UTC, a missing one as 0
+    try:
+        dt = datetime.fromisoformat(ts)
+    except (TypeError, ValueError):
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def export_columns(log_paths: Iterable[str], out_dir: str, format: str = "auto", chunk_rows: int = 65536) -> dict:
+    """Convert LoggerNode JSONL logs into ``events``/``debates``/``scores`` column tables under ``out_dir``.
+
+    Each log is a file or a segmented log directory. Logs are streamed line
+    by line and written in chunks of ``chunk_rows``, so memory does not grow
+    with the log (only the dictionaries of distinct events, agents, topics
+    and sources do). Debates are numbered across all logs in order, with
+    ``DebateTracker``'s rules. ``format`` is "parquet" (needs pyarrow), "npz"
+    or "auto" (parquet when pyarrow is installed). Returns the row count of
+    each table.
+    """
+    if format == "auto":
+        format = "parquet" if pyarrow_available() else "npz"
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS} or 'auto', got {format!r}")
+    os.makedirs(out_dir, exist_ok=True)
+    table_cls = _ParquetTable if format == "parquet" else _NpzTable
+    tables = {name: table_cls(os.path.join(out_dir, f"{name}.{format}"), schema) for name, schema in SCHEMAS.items()}
+    dictionaries = {"event": _Dictionary(), "agent": _Dictionary(), "topic": _Dictionary(), "source": _Dictionary()}
+    pending = {name: {column: [] for column in schema} for name, schema in SCHEMAS.items()}
+
+    def flush(name):
+        columns = pending[name]
+        if columns["debate"]:
+            tables[name].write(columns, {k: d.values for k, d in dictionaries.items()})
+            pending[name] = {column: [] for column in SCHEMAS[name]}
+
+    def append(name, *values):
+        columns = pending[name]
+        for column, value in zip(SCHEMAS[name], values):
+            columns[column].append(value)
+        if len(columns["debate"]) >= chunk_rows:
+            flush(name)
+
+    current = None
+    # debate numbers continue across logs
+    offset = 0
+
+    def close_debate():
+        # one debates row per debate; scores from its final (else judge) verdict
+        if current is None:
+            return
+        verdict = current["verdict"] or {}
+        winner = verdict.get("winner")
+        append("debates", current["debate"], current["source"], current["topic"], current["seed"],
+               current["rounds"], dictionaries["agent"].code(winner if isinstance(winner, str) else None))
+        for agent, score in (verdict.get("scores") or {}).items():
+            append("scores", current["debate"], dictionaries["agent"].code(agent), score)
+
+    try:
+        for path in log_paths:
+            source = dictionaries["source"].code(os.path.abspath(path))
+            tracker = DebateTracker()
+            with contextlib.ExitStack() as stack:
+                lines = iter_segment_lines(path) if is_segmented(path) else stack.enter_context(open(path, "rb"))
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        event, ts, name, agent = _parse(line)
+                    except ValueError:
+                        continue
+                    probe = event if event is not None else {"event": name}
+                    kind = tracker.observe(probe)
+                    # events before a log's first debate belong to none
+                    debate = offset + tracker.debate if tracker.debate >= 0 else -1
+                    if kind == "open":
+                        close_debate()
+                        seed = event.get("seed")
+                        current = {"debate": debate, "source": source, "topic": dictionaries["topic"].code(
+                            event.get("topic") if isinstance(event.get("topic"), str) else None),
+                            "seed": seed if isinstance(seed, int) else NO_SEED, "rounds": 0, "verdict": None}
+                    elif kind == "seed" and current is not None and isinstance(event.get("seed"), int):
+                        current["seed"] = event["seed"]
+                    rnd = tracker.round_of(probe)
+                    text = ""
+                    if name == "agent_turn":
+                        text = event.get("text") or ""
+                        if current is not None:
+                            current["rounds"] = max(current["rounds"], rnd)
+                    elif name in ("judge_verdict", "final_verdict") and current is not None:
+                        if name == "final_verdict" or current["verdict"] is None:
+                            current["verdict"] = event.get("verdict")
+                    append("events", _ts_us(ts), debate, dictionaries["event"].code(name),
+                           dictionaries["agent"].code(agent), rnd, text)
+            offset += tracker.debate + 1
+        close_debate()
+        for name in tables:
+            flush(name)
+    finally:
+        values = {k: d.values for k, d in dictionaries.items()}
+        for table in tables.values():
+            table.close(values)
+    return {name: table.rows for name, table in tables.items()}
+
+
+class ColumnTable:
+    """Equal-length NumPy columns of one exported table.
+
+    Dictionary columns are int32 codes into ``dictionaries[column]`` (-1 is
+    null) and text columns are decoded on demand with ``text``/``texts``.
+    Columns loaded from ``.npz`` are read-only memory maps.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], dictionaries: Dict[str, list], texts: Dict[str, tuple]):
+        self.columns = columns
+        self.dictionaries = dictionaries
+        # column -> (int64 end offsets with a leading 0, uint8 utf-8 data)
+        self._texts = texts
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def code(self, column: str, value) -> int:
+        # code of value in a dictionary column, -1 if it never occurs
+        try:
+            return self.dictionaries[column].index(value)
+        except ValueError:
+            return -1
+
+    def decode(self, column: str, rows=None) -> list:
+        values = self.dictionaries[column]
+        codes = self.columns[column] if rows is None else self.columns[column][rows]
+        return [values[c] if c >= 0 else None for c in codes.tolist()]
+
+    def text(self, column: str, row: int) -> str:
+        offsets, data = self._texts[column]
+        return bytes(data[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def texts(self, column: str, rows=None) -> List[str]:
+        rows = range(len(self)) if rows is None else np.asarray(rows).tolist()
+        return [self.text(column, r) for r in rows]
+
+
+def _npz_members(path: str) -> Dict[str, np.ndarray]:
+    # memory-map every .npy member of a stored zip in place
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed and cannot be memory-mapped")
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + 30 + name_len + extra_len)
+            version = np.lib.format.read_magic(f)
+            read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else \
+                np.lib.format.read_array_header_2_0
+            shape, fortran, dtype = read_header(f)
+            if not shape[0] or dtype.hasobject:
+                arrays[info.filename[:-4]] = np.zeros(shape, dtype=dtype)
+            else:
+                arrays[info.filename[:-4]] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape)
+    return arrays
+
+
+def _load_npz(path: str, schema: dict) -> ColumnTable:
+    members = _npz_members(path)
+    columns, dictionaries, texts = {}, {}, {}
+    for name, kind in schema.items():
+        if kind == "str":
+            texts[name] = (members[name + ".offsets"], members[name + ".data"])
+            continue
+        columns[name] = members[name]
+        if kind.startswith("dict:"):
+            dictionaries[name] = members[name + ".dictionary"].tolist()
+    return ColumnTable(columns, dictionaries, texts)
+
+
+def _load_parquet(path: str, schema: dict) -> ColumnTable:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=True)
+    columns, dictionaries, texts = {}, {}, {}
+    for name, kind in schema.items():
+        column = table.column(name)
+        if kind == "str":
+            array = pa.concat_arrays(column.chunks) if column.num_chunks else pa.array([], pa.large_string())
+            array = array.cast(pa.large_string())
+            offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+            data = np.frombuffer(array.buffers()[2], dtype=np.uint8) if array.buffers()[2] else np.zeros(0, np.uint8)
+            texts[name] = (offsets, data)
+        elif kind.startswith("dict:"):
+            # row groups may carry different dictionaries: re-encode against one
+            values = column.to_pylist()
+            dictionaries[name] = list(dict.fromkeys(v for v in values if v is not None))
+            index = {v: i for i, v in enumerate(dictionaries[name])}
+            columns[name] = np.asarray([index[v] if v is not None else -1 for v in values], dtype=np.int32)
+        else:
+            columns[name] = column.to_numpy()
+    return ColumnTable(columns, dictionaries, texts)
+
+
+def _shared_codes(table: ColumnTable, column: str, values: list) -> ColumnTable:
+    # re-express a dictionary column's codes in `values` (a superset of its dictionary)
+    own = table.dictionaries[column]
+    if own != values[:len(own)]:
+        index = {v: i for i, v in enumerate(values)}
+        remap = np.asarray([index[v] for v in own] + [-1], dtype=np.int32)
+        table.columns[column] = remap[table.columns[column]]
+    table.dictionaries[column] = values
+    return table
+
+
+class LogColumns:
+    """The ``events``, ``debates`` and ``scores`` tables written by ``export_columns``.
+
+    ``debates`` row i describes debate i. The agent codes of
+    ``events.agent``, ``debates.winner`` and ``scores.agent`` share one
+    dictionary, so they compare directly.
+    """
+
+    def __init__(self, events: ColumnTable, debates: ColumnTable, scores: ColumnTable):
+        agents = list(dict.fromkeys(events.dictionaries["agent"] + debates.dictionaries["winner"] +
+                                    scores.dictionaries["agent"]))
+        self.events = _shared_codes(events, "agent", agents)
+        self.debates = _shared_codes(debates, "winner", agents)
+        self.scores = _shared_codes(scores, "agent", agents)
+        self.agents = agents
+
+    def win_rates(self, personas: Optional[Dict[str, str]] = None, by_seed: bool = True) -> List[dict]:
+        """Wins / finished debates per agent (or ``personas[agent]``) and seed, vectorized over ``scores``.
+
+        Every agent with a score in a debate's verdict took part in it.
+        Agents missing from ``personas`` are grouped under their own name.
+        """
+        groups = [personas.get(a, a) for a in self.agents] if personas else list(self.agents)
+        group_names = list(dict.fromkeys(groups))
+        group_of_agent = np.asarray([group_names.index(g) for g in groups] or [0], dtype=np.int64)
+        debate = np.asarray(self.scores["debate"], dtype=np.int64)
+        agent = np.asarray(self.scores["agent"], dtype=np.int64)
+        won = agent == np.asarray(self.debates["winner"])[debate]
+        seeds = np.asarray(self.debates["seed"])[debate] if by_seed else np.zeros(len(debate), dtype=np.int64)
+        seed_values, seed_index = np.unique(seeds, return_inverse=True)
+        key = group_of_agent[agent] * len(seed_values) + seed_index.ravel()
+        size = len(group_names) * len(seed_values)
+        played = np.bincount(key, minlength=size)
+        wins = np.bincount(key, weights=won, minlength=size).astype(np.int64)
+        rows = []
+        for k in np.flatnonzero(played).tolist():
+            g, s = divmod(k, len(seed_values))
+            row = {"group": group_names[g], "debates": int(played[k]), "wins": int(wins[k]),
+                   "win_rate": float(wins[k] / played[k])}
+            if by_seed:
+                row["seed"] = int(seed_values[s])
+            rows.append(row)
+        return rows
+
+
+def load_columns(out_dir: str) -> LogColumns:
+    """Load a directory written by ``export_columns`` (npz columns are memory-mapped)."""
+    tables = {}
+    for name, schema in SCHEMAS.items():
+        npz, parquet = os.path.join(out_dir, f"{name}.npz"), os.path.join(out_dir, f"{name}.parquet")
+        if os.path.exists(npz):
+            tables[name] = _load_npz(npz, schema)
+        elif os.path.exists(parquet):
+            tables[name] = _load_parquet(parquet, schema)
+        else:
+            raise FileNotFoundError(f"No {name}.npz or {name}.parquet in {out_dir}")
+    return LogColumns(**tables)
@@ -0,0 +1,326 @@
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+from typing import Iterable, Iterator
+
+from nodes.log_segments import is_segmented, iter_segment_lines
+
+
+def expand_event(event: dict, turns: dict) -> dict:
+    """Return ``event`` with compact memory/summary references resolved.
+
+    ``turns`` maps round -> {"agent", "text"} and is filled from ``agent_turn``
+    events and compact ``defs``; pass the same dict for every event of one
+    log, in order. Events without references are returned unchanged.
+    """
+    name = event.get("event")
+    if name == "agent_turn":
+        turns[event["round"]] = {"agent": event["agent"], "text": event["text"]}
+        return event
+    if "defs" in event:
+        # json object keys are strings; rounds are ints
+        turns.update((int(r), t) for r, t in event["defs"].items())
+    if "memory_ref" in event:
+        ref = event["memory_ref"]
+        summary = ref["summary"]
+        snapshot = {
+            "turns": [{"round": r, "agent": turns[r]["agent"], "text": turns[r]["text"]} for r in ref["rounds"]],
+            "summary": summary if isinstance(summary, str) else " | ".join(turns[r]["text"] for r in summary),
+        }
+        event = {k: v for k, v in event.items() if k not in ("memory_ref", "defs")}
+        event["memory_snapshot"] = snapshot
+    elif name == "final_verdict" and not isinstance(event["verdict"].get("summary", ""), str):
+        verdict = dict(event["verdict"])
+        verdict["summary"] = " | ".join(turns[r]["text"] for r in verdict["summary"])
+        event = {**event, "verdict": verdict}
+    elif "summary_ref" in event:
+        summary = " | ".join(turns[r]["text"] for r in event["summary_ref"])
+        event = {k: v for k, v in event.items() if k not in ("summary_ref", "defs")}
+        event["summary"] = summary
+    return event
+
+
+def expand_events(events: Iterable[dict]) -> Iterator[dict]:
+    # full-snapshot events for a (possibly compact) log, in order
+    turns = {}
+    for event in events:
+        yield expand_event(event, turns)
+
+
+def read_log(path: str, expand: bool = True) -> Iterator[dict]:
+    # path is a log file or a segmented log directory (LoggerNode with segment_bytes/segment_events)
+    if is_segmented(path):
+        events = (json.loads(line) for line in iter_segment_lines(path) if line.strip())
+        yield from (expand_events(events) if expand else events)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        events = (json.loads(line) for line in f if line.strip())
+        yield from (expand_events(events) if expand else events)
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+CREATE TABLE IF NOT EXISTS events (
+    offset INTEGER PRIMARY KEY, length INTEGER NOT NULL, event TEXT, agent TEXT, round INTEGER,
+    debate INTEGER, flags INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS debates (debate INTEGER PRIMARY KEY, topic TEXT, seed INTEGER, offset INTEGER);
+CREATE INDEX IF NOT EXISTS events_event ON events (event, debate);
+CREATE INDEX IF NOT EXISTS events_debate ON events (debate, round);
+CREATE INDEX IF NOT EXISTS events_agent ON events (agent);
+"""
+
+# events.flags bits
+HAS_DEFS = 1
+# events that open a debate; a start_debate right after topic_validated continues it
+_DEBATE_OPENERS = ("topic_validated", "start_debate", "resume_debate")
+_FINGERPRINT_BYTES = 256
+
+
+class DebateTracker:
+    """Numbers debates and rounds for the events of a log, fed in file order.
+
+    A debate is numbered by its position in the log. Events without a round
+    of their own get the round of the last ``agent_turn`` in their debate; a
+    ``turn_error`` counts as the next round.
+    """
+
+    __slots__ = ("debate", "round", "pending")
+
+    def __init__(self, debate: int = -1, round: int = 0, pending: int = 0):
+        self.debate = debate
+        self.round = round
+        # 1 right after topic_validated: a start_debate then continues that debate
+        self.pending = pending
+
+    def observe(self, event: dict):
+        """Advance past ``event``; returns "open" if it opened a debate, "seed" for a continuing start_debate."""
+        name = event.get("event")
+        explicit = event.get("round")
+        kind = None
+        if name in _DEBATE_OPENERS and not (self.pending and name == "start_debate"):
+            self.debate += 1
+            self.round = explicit if isinstance(explicit, int) else 0
+            kind = "open"
+        elif name == "start_debate":
+            kind = "seed"
+        elif name == "agent_turn" and isinstance(explicit, int):
+            self.round = explicit
+        elif name == "turn_error":
+            self.round += 1
+        self.pending = int(name == "topic_validated")
+        return kind
+
+    def round_of(self, event: dict) -> int:
+        explicit = event.get("round")
+        return explicit if isinstance(explicit, int) else self.round
+
+
+class LogIndex:
+    """Sidecar offset index over a LoggerNode JSONL file, read through mmap.
+
+    The index (SQLite, ``<log>.idx`` by default) maps every line to its event
+    type, agent, round and debate, numbered as by ``DebateTracker``.
+    ``refresh()`` indexes only bytes appended since the last call (a partial
+    last line is left for later). A log that shrank or was replaced is
+    reindexed from scratch. Queries decode only the matching lines.
+    """
+
+    def __init__(self, path: str, index_path: str = None, refresh: bool = True):
+        if os.path.isdir(path):
+            raise ValueError(f"{path} is a directory; LogIndex maps a single log file (read segmented logs with "
+                             f"read_log)")
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self._db = sqlite3.connect(self.index_path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_INDEX_SCHEMA)
+        self._fh = None
+        self._mm = None
+        self._turn_maps = {}
+        if refresh:
+            self.refresh()
+
+    def close(self):
+        self._unmap()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- indexing ---
+
+    def refresh(self) -> int:
+        """Index lines appended since the last refresh; returns how many were added."""
+        size = os.path.getsize(self.path)
+        state = dict(self._db.execute("SELECT key, value FROM meta"))
+        indexed = state.get("indexed_bytes", 0)
+        self._map(size)
+        fingerprint = self._fingerprint(min(indexed, _FINGERPRINT_BYTES))
+        if size < indexed or state.get("fingerprint", fingerprint) != fingerprint:
+            self._db.executescript("DELETE FROM events; DELETE FROM debates; DELETE FROM meta;")
+            state, indexed = {}, 0
+        if size == indexed:
+            return 0
+
+        tracker = DebateTracker(state.get("debate", -1), state.get("round", 0), state.get("pending", 0))
+        rows, debates = [], []
+        mm, pos = self._mm, indexed
+        while True:
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                break
+            line = mm[pos:end]
+            start, pos = pos, end + 1
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            kind = tracker.observe(event)
+            if kind == "open":
+                debates.append([tracker.debate, event.get("topic"), event.get("seed"), start])
+            elif kind == "seed":
+                # topic_validated opened this debate; the seed arrives with start_debate
+                if debates:
+                    debates[-1][2] = event.get("seed")
+                else:
+                    self._db.execute("UPDATE debates SET seed = ? WHERE debate = ?",
+                                     (event.get("seed"), tracker.debate))
+            agent = event.get("agent")
+            rows.append((start, end - start, event.get("event"), agent if isinstance(agent, str) else None,
+                         tracker.round_of(event), tracker.debate, HAS_DEFS if "defs" in event else 0))
+
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.executemany("INSERT OR REPLACE INTO debates VALUES (?, ?, ?, ?)", debates)
+            self._db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+                ("indexed_bytes", pos), ("fingerprint", self._fingerprint(min(pos, _FINGERPRINT_BYTES))),
+                ("debate", tracker.debate), ("round", tracker.round), ("pending", tracker.pending)])
+        self._turn_maps.clear()
+        return len(rows)
+
+    def _map(self, size: int):
+        # (re)map the log when it has grown; mmap cannot map an empty file
+        if self._mm is not None and len(self._mm) == size:
+            return
+        self._unmap()
+        self._fh = open(self.path, "rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def _unmap(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _fingerprint(self, n: int) -> str:
+        return hashlib.blake2b(self._mm[:n], digest_size=8).hexdigest()
+
+    # --- queries ---
+
+    def debates(self) -> list:
+        rows = self._db.execute(
+            "SELECT d.debate, d.topic, d.seed, d.offset, COUNT(e.offset), MAX(e.round) FROM debates d "
+            "LEFT JOIN events e ON e.debate = d.debate GROUP BY d.debate ORDER BY d.debate")
+        return [{"debate": d, "topic": t, "seed": s, "offset": o, "events": n, "rounds": r or 0}
+                for d, t, s, o, n, r in rows]
+
+    def offsets(self, event=None, agent=None, round=None, debate=None, topic=None, limit=None):
+        """(offset, length, debate) of matching lines in file order.
+
+        ``event``/``agent`` may be a string or a collection of strings; ``round``
+        an int or an inclusive ``(lo, hi)`` pair.
+        """
+        where, params = self._where(event, agent, round, debate, topic)
+        query = "SELECT offset, length, debate FROM events" + where + " ORDER BY offset"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return self._db.execute(query, params)
+
+    def count(self, event=None, agent=None, round=None, debate=None, topic=None) -> int:
+        where, params = self._where(event, agent, round, debate, topic)
+        return self._db.execute("SELECT COUNT(*) FROM events" + where, params).fetchone()[0]
+
+    @staticmethod
+    def _where(event, agent, round, debate, topic):
+        clauses, params = [], []
+        for column, value in (("event", event), ("agent", agent)):
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+        if isinstance(round, int):
+            clauses.append("round = ?")
+            params.append(round)
+        elif round is not None:
+            clauses.append("round BETWEEN ? AND ?")
+            params.extend(round)
+        if debate is not None:
+            clauses.append("debate = ?")
+            params.append(debate)
+        if topic is not None:
+            clauses.append("debate IN (SELECT debate FROM debates WHERE topic = ?)")
+            params.append(topic)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def events(self, expand: bool = False, **filters) -> Iterator[dict]:
+        """Decode matching lines lazily; ``expand`` resolves compact memory/summary references."""
+        for offset, length, debate in self.offsets(**filters):
+            event = json.loads(self._mm[offset:offset + length])
+            if expand and ("memory_ref" in event or "summary_ref" in event or event.get("event") == "final_verdict"):
+                event = expand_event(event, self._turn_map(debate))
+            yield event
+
+    def _turn_map(self, debate: int) -> dict:
+        # round -> turn for one debate, from its agent_turn events and compact defs
+        turns = self._turn_maps.get(debate)
+        if turns is None:
+            turns = self._turn_maps[debate] = {}
+            rows = self._db.execute(
+                "SELECT offset, length FROM events WHERE debate = ? AND (event = 'agent_turn' OR flags & ?) "
+                "ORDER BY offset", (debate, HAS_DEFS)).fetchall()
+            for offset, length in rows:
+                expand_event(json.loads(self._mm[offset:offset + length]), turns)
+        return turns
+
+    # --- replay ---
+
+    def replay(self, debate: int, until_round: int = None, memory_node=None, judge_node=None) -> dict:
+        """Re-feed a debate's turns into MemoryNode/JudgeNode and return the rebuilt state.
+
+        Turns come from ``agent_turn`` events (``turn_error`` becomes the same
+        ``[ERROR] ...`` entry the graph records). With ``until_round`` the
+        debate is cut after that round and judged as if it ended there; for a
+        complete replay ``logged_verdict`` holds the verdict from the log.
+        """
+        from nodes.judge_node import JudgeNode
+        from nodes.memory_node import MemoryNode
+
+        memory_node = memory_node or MemoryNode()
+        judge_node = judge_node or JudgeNode()
+        rounds = None if until_round is None else (0, until_round)
+        summary = ""
+        logged_verdict = None
+        for event in self.events(event=("agent_turn", "turn_error", "final_verdict"), debate=debate,
+                                 round=rounds, expand=True):
+            if event["event"] == "final_verdict":
+                logged_verdict = event["verdict"]
+                continue
+            if event["event"] == "agent_turn":
+                memory_node.update_with_turn(event["round"], event["agent"], event["text"])
+            else:
+                memory_node.update_with_turn(len(memory_node.turns) + 1, event["agent"], f"[ERROR] {event['error']}")
+            summary = memory_node.generate_summary(memory_node.turns)
+        verdict = judge_node.judge(memory_node.turns, summary)
+        return {"debate": debate, "turns": list(memory_node.turns), "summary": summary, "verdict": verdict,
+                "logged_verdict": logged_verdict}
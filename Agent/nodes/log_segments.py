@@ -0,0 +1,231 @@
+import gzip
+import importlib.util
+import json
+import os
+import queue
+import secrets
+import shutil
+import threading
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+MANIFEST = "manifest.jsonl"
+COMPRESSIONS = ("auto", "gzip", "zstd", "none")
+# compressed segment suffixes, in the order a reader prefers them over the plain file
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def resolve_compression(compression: str) -> Optional[str]:
+    # "auto" picks zstd when the zstandard package is installed, else gzip; "none" -> None
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}, got {compression!r}")
+    if compression == "auto":
+        return "zstd" if zstd_available() else "gzip"
+    if compression == "zstd" and not zstd_available():
+        raise ValueError("zstd compression needs the zstandard package")
+    return None if compression == "none" else compression
+
+
+def _append_manifest(directory: str, record: dict):
+    # one O_APPEND write per record: lines from concurrent writers never interleave
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(os.path.join(directory, MANIFEST), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def compress_segment(directory: str, segment: str, codec: str) -> str:
+    """Compress ``segment`` (a sealed plain file) next to itself, then delete the plain file.
+
+    The compressed file appears under its final name only once complete, so
+    a reader sees either the plain or the finished compressed segment.
+    """
+    src = os.path.join(directory, segment)
+    dst = src + _SUFFIXES[codec]
+    tmp = dst + ".tmp"
+    with open(src, "rb") as f_in:
+        if codec == "zstd":
+            import zstandard
+            with open(tmp, "wb") as f_out:
+                zstandard.ZstdCompressor().copy_stream(f_in, f_out)
+        else:
+            with gzip.open(tmp, "wb", compresslevel=6) as f_out:
+                shutil.copyfileobj(f_in, f_out, 1 << 20)
+    os.replace(tmp, dst)
+    _append_manifest(directory, {"segment": segment, "state": "compressed", "codec": codec,
+                                 "bytes": os.path.getsize(dst)})
+    os.remove(src)
+    return dst
+
+
+class SegmentWriter:
+    """Writes one process's share of a segmented log directory.
+
+    Lines go to ``<prefix>-<seq>.jsonl`` files named after this writer (time,
+    pid and a random token), so concurrent processes never share a file. A
+    segment is sealed once it holds ``max_bytes`` bytes or ``max_events``
+    events (only between writes, so lines are never split) and then
+    compressed on a background thread. Every open/seal/compress is recorded
+    in the directory's ``manifest.jsonl`` with a single appending write.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = 64 << 20, max_events: Optional[int] = None,
+                 compression: str = "auto"):
+        if not max_bytes and not max_events:
+            raise ValueError("a segmented log needs max_bytes or max_events")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_events = max_events
+        self.codec = resolve_compression(compression)
+        os.makedirs(directory, exist_ok=True)
+        self.writer = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}-{secrets.token_hex(3)}"
+        self.seq = 0
+        self._fh = None
+        self._segment = None
+        self._bytes = 0
+        self._events = 0
+        self._queue = None
+        self._thread = None
+
+    def _open(self):
+        self._segment = f"seg-{self.writer}-{self.seq:06d}.jsonl"
+        self._fh = open(os.path.join(self.directory, self._segment), "ab")
+        self._bytes = self._events = 0
+        _append_manifest(self.directory, {"segment": self._segment, "state": "open", "writer": self.writer,
+                                          "seq": self.seq})
+
+    def write(self, text: str, events: int):
+        if self._fh is None:
+            self._open()
+        data = text.encode("utf-8")
+        self._fh.write(data)
+        self._bytes += len(data)
+        self._events += events
+        if (self.max_bytes and self._bytes >= self.max_bytes) or (self.max_events and self._events >= self.max_events):
+            self.rotate()
+
+    def flush(self, fsync: bool = False):
+        if self._fh is not None:
+            self._fh.flush()
+            if fsync:
+                os.fsync(self._fh.fileno())
+
+    def rotate(self):
+        # seal the current segment (if any) and queue it for compression; the next write opens a new one
+        if self._fh is None:
+            return
+        self._fh.close()
+        self._fh = None
+        _append_manifest(self.directory, {"segment": self._segment, "state": "sealed", "events": self._events,
+                                          "bytes": self._bytes})
+        self.seq += 1
+        if self.codec is not None:
+            if self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._compress_loop, name="SegmentCompressor", daemon=True)
+                self._thread.start()
+            self._queue.put(self._segment)
+
+    def _compress_loop(self):
+        while True:
+            segment = self._queue.get()
+            if segment is None:
+                return
+            compress_segment(self.directory, segment, self.codec)
+
+    def close(self):
+        # seal the last segment and wait until every sealed segment is compressed
+        self.rotate()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+def segment_paths(directory: str) -> List[str]:
+    """Current file of every segment in ``directory``: writers in the order they started, each in sequence.
+
+    A segment resolves to its compressed file once that exists, else to the
+    plain one; each writer's events are therefore contiguous, as in a
+    single-file log.
+    """
+    writers, seqs = {}, {}
+    with open(os.path.join(directory, MANIFEST), "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            record = json.loads(line)
+            if record.get("state") == "open":
+                writers.setdefault(record["writer"], len(writers))
+                seqs[record["segment"]] = (writers[record["writer"]], record["seq"])
+    paths = []
+    for segment in sorted(seqs, key=seqs.get):
+        path = _resolve(directory, segment)
+        if path is not None:
+            paths.append(path)
+    return paths
+
+
+def _resolve(directory: str, segment: str) -> Optional[str]:
+    base = os.path.join(directory, segment)
+    for suffix in list(_SUFFIXES.values()) + [""]:
+        if os.path.exists(base + suffix):
+            return base + suffix
+    return None
+
+
+def _open_segment(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+def iter_segment_lines(directory: str) -> Iterator[bytes]:
+    """Every complete line of a segmented log, across plain and compressed segments, in order.
+
+    A segment that is compressed between listing and opening is read from
+    its compressed file; a trailing partial line (a write in progress) is
+    skipped.
+    """
+    for path in segment_paths(directory):
+        try:
+            f = _open_segment(path)
+        except FileNotFoundError:
+            # compressed (and the plain file removed) since segment_paths looked
+            path = _resolve(directory, os.path.basename(path))
+            if path is None:
+                continue
+            f = _open_segment(path)
+        with f:
+            reader = f if not path.endswith(".zst") else _lines(f)
+            for line in reader:
+                if line.endswith(b"\n"):
+                    yield line
+
+
+def _lines(stream, size: int = 1 << 16) -> Iterator[bytes]:
+    # zstandard's stream reader has no line iteration
+    pending = b""
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            if pending:
+                yield pending
+            return
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line + b"\n"
+
+
+def is_segmented(path: str) -> bool:
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST))
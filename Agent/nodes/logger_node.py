@@ -1,22 +1,166 @@
 import json
 from datetime import datetime, timezone
 import os
+import queue
+import threading
+import time
+
+from nodes.log_segments import SegmentWriter
+
+FSYNC_POLICIES = ("none", "batch", "event")
 
 
 class LoggerNode:
-    def __init__(self, path):
+    """Appends one JSON object per line to ``path``.
+
+    By default every event opens, appends to and closes the file. With
+    ``buffered=True`` the file handle stays open and encoded lines are kept in
+    memory until ``batch_size`` events are pending, ``flush_interval`` seconds
+    have passed, or ``flush()``/``close()`` is called. ``fsync`` selects the
+    durability policy: ``"none"``, ``"batch"`` (fsync after every write of a
+    batch) or ``"event"`` (write and fsync every event). ``background=True``
+    (implies buffered) moves encoding and writing to a daemon thread; events
+    must not be mutated after they are logged in that mode.
+
+    With ``segment_bytes`` and/or ``segment_events``, ``path`` is a directory
+    of rotated, compressed segments instead of one file (see
+    ``nodes/log_segments.py``); any number of processes can log into the
+    same directory.
+
+    The line format is identical in every mode.
+    """
+
+    def __init__(self, path, buffered=False, batch_size=64, flush_interval=1.0, fsync="none", background=False,
+                 segment_bytes=None, segment_events=None, compression="auto"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
         self.path = path
+        self.buffered = buffered or background
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.background = background
         # ensure directory exists
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
+        self._segments = None
+        if segment_bytes or segment_events:
+            self._segments = SegmentWriter(path, segment_bytes, segment_events, compression)
+        self._fh = None
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        if self.background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._drain, name="LoggerNodeWriter", daemon=True)
+            self._thread.start()
+
     def _timestamp(self):
         # Use timezone-aware UTC timestamps
         return datetime.now(timezone.utc).isoformat()
 
+    @staticmethod
+    def _encode(entry: dict) -> str:
+        return json.dumps(entry, ensure_ascii=False) + "\n"
+
     def log_event(self, event: dict):
         entry = {
             "ts": self._timestamp(),
             **event,
         }
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        if not self.buffered and self._segments is not None:
+            with self._lock:
+                self._segments.write(self._encode(entry), 1)
+                self._segments.flush(self.fsync != "none")
+            return
+        if not self.buffered:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(self._encode(entry))
+                if self.fsync != "none":
+                    f.flush()
+                    os.fsync(f.fileno())
+            return
+        if self.background:
+            self._queue.put(entry)
+            return
+        with self._lock:
+            self._buffer.append(self._encode(entry))
+            if self.fsync == "event" or len(self._buffer) >= self.batch_size or self._interval_elapsed():
+                self._write_buffer()
+
+    def flush(self):
+        if self.background:
+            if self._thread is not None and self._thread.is_alive():
+                done = threading.Event()
+                self._queue.put(done)
+                done.wait()
+            return
+        with self._lock:
+            self._write_buffer()
+
+    def close(self):
+        if self.background and self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._write_buffer()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            if self._segments is not None:
+                # seals the last segment and waits for its compression
+                self._segments.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _interval_elapsed(self):
+        return self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _write_buffer(self):
+        # caller holds self._lock (or is the writer thread)
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._segments is not None:
+            self._segments.write("".join(self._buffer), len(self._buffer))
+            self._buffer.clear()
+            self._segments.flush(self.fsync != "none")
+            return
+        if self._fh is None:
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write("".join(self._buffer))
+        self._buffer.clear()
+        self._fh.flush()
+        if self.fsync != "none":
+            os.fsync(self._fh.fileno())
+
+    def _drain(self):
+        # background writer: encode off the caller's thread and write in batches
+        while True:
+            timeout = self.flush_interval if self._buffer else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                with self._lock:
+                    self._write_buffer()
+                continue
+            if item is None:
+                with self._lock:
+                    self._write_buffer()
+                return
+            if isinstance(item, threading.Event):
+                with self._lock:
+                    self._write_buffer()
+                item.set()
+                continue
+            with self._lock:
+                self._buffer.append(self._encode(item))
+                if self.fsync == "event" or len(self._buffer) >= self.batch_size or self._interval_elapsed():
+                    self._write_buffer()
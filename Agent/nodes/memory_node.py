@@ -1,38 +1,134 @@
 import json
-from typing import List
+from typing import List, Optional
+
+from nodes.similarity_index import SimilarityIndex
 
 
 class MemoryNode:
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, similarity_threshold: float = 0.75, compact_log: bool = False,
+                 resident_turns: Optional[int] = None, index_window: int = 4096):
         self.logger = logger
+        self.turns: List[dict] = []
+        # near-duplicate index over accepted turns, updated once per turn; with resident_turns only the
+        # newest texts stay in memory and older ones are re-read from the transcript (see Transcript.spilling),
+        # and near-duplicates are searched among the newest index_window texts (exact repeats among all)
+        self.index = SimilarityIndex(threshold=similarity_threshold, resident=resident_turns,
+                                     postings=None if resident_turns is None else index_window)
+        self.index.fetch = lambda ref: self.turns[ref]["text"]
+        # key of the last indexed turn, so a different transcript is not mistaken for a continuation
+        self._last = None
+        # compact_log: memory/summary events reference turns by round; a turn whose
+        # agent_turn event did not reach this logger is written once in "defs".
+        # see nodes/log_reader.py
+        self.compact_log = compact_log
+        self._defined = set()
+        self._summary_refs = {}
 
     def get_relevant_memory_for_agent(self, agent_name: str, turns: List[dict], summary: str) -> dict:
         # Supply only last two turns and a short summary to each agent
-        last_turns = turns[-2:]
+        last_turns = [dict(t) for t in turns[-2:]]
         mem = {"turns": last_turns, "summary": summary}
         if self.logger:
-            self.logger.log_event({"event":"memory_requested","agent":agent_name,"memory_snapshot":mem})
+            if self.compact_log:
+                defs = {}
+                ref = {"rounds": [self._ref(t, defs) for t in last_turns], "summary": self.summary_ref(summary)}
+                event = {"event":"memory_requested","agent":agent_name,"memory_ref":ref}
+                if defs:
+                    event["defs"] = defs
+                self.logger.log_event(event)
+            else:
+                self.logger.log_event({"event":"memory_requested","agent":agent_name,"memory_snapshot":mem})
         return mem
 
+    async def aget_relevant_memory_for_agent(self, agent_name: str, turns: List[dict], summary: str) -> dict:
+        return self.get_relevant_memory_for_agent(agent_name, turns, summary)
+
     def get_all_texts(self, turns: List[dict]):
         return [t["text"] for t in turns]
 
-    def has_similar(self, text: str, turns: List[dict], threshold: float = 0.75) -> bool:
-        # check against all prior turns for substantial similarity
-        import difflib
+    def reset(self):
+        # forget all turns so the node can be reused for another debate
+        self.turns = []
+        self.index.clear()
+        self._last = None
+        self._defined.clear()
+        self._summary_refs.clear()
+
+    def update_with_turn(self, round_number: int, agent_name: str, text: str) -> dict:
+        entry = {"round": round_number, "agent": agent_name, "text": text}
+        self.turns.append(entry)
+        self.index.add(text)
+        self._last = self._key(entry)
+        return entry
 
-        for t in self.get_all_texts(turns):
-            ratio = difflib.SequenceMatcher(None, text.lower(), t.lower()).ratio()
-            if ratio >= threshold:
-                if self.logger:
-                    self.logger.log_event({"event":"duplicate_detected","text":text,"matched":t,"ratio":ratio})
-                return True
-        return False
+    def sync_index(self, turns: List[dict]) -> SimilarityIndex:
+        # turns is treated as an append-only transcript: only unseen tails are indexed
+        n = len(self.index)
+        if n > len(turns) or (n and self._last != self._key(turns[n - 1])):
+            self.index.clear()
+            n = 0
+        if self.index.resident is not None:
+            self.index.fetch = lambda ref: turns[ref]["text"]
+        for ref, t in enumerate(turns[n:], n):
+            self.index.add(t["text"], ref)
+            self._last = self._key(t)
+        return self.index
+
+    @staticmethod
+    def _key(t):
+        return t.get("round"), t.get("agent"), t["text"]
+
+    def find_similar(self, text: str, turns: Optional[List[dict]] = None, threshold: float = 0.75):
+        # returns (matched_text, ratio) for the first prior turn at/above threshold, else None
+        index = self.sync_index(self.turns if turns is None else turns)
+        match = index.find(text, threshold)
+        if match is None:
+            return None
+        doc_id, ratio = match
+        return index.text(doc_id), ratio
+
+    def has_similar(self, text: str, turns: Optional[List[dict]] = None, threshold: float = 0.75) -> bool:
+        # check against all prior turns for substantial similarity
+        match = self.find_similar(text, turns, threshold)
+        if match is None:
+            return False
+        t, ratio = match
+        if self.logger:
+            self.logger.log_event({"event":"duplicate_detected","text":text,"matched":t,"ratio":ratio})
+        return True
 
     def generate_summary(self, turns: List[dict]) -> str:
         # simplistic summary update: append bullet
         summary_parts = [t["text"] for t in turns[-4:]]
         summary = " | ".join(summary_parts)
         if self.logger:
-            self.logger.log_event({"event":"summary_updated","summary":summary})
+            if self.compact_log:
+                defs = {}
+                refs = [self._ref(t, defs) for t in turns[-4:]]
+                # later memory requests carrying this summary reuse the same refs
+                self._summary_refs = {summary: refs}
+                event = {"event":"summary_updated","summary_ref":refs}
+                if defs:
+                    event["defs"] = defs
+                self.logger.log_event(event)
+            else:
+                self.logger.log_event({"event":"summary_updated","summary":summary})
         return summary
+
+    async def agenerate_summary(self, turns: List[dict]) -> str:
+        return self.generate_summary(turns)
+
+    def mark_logged(self, round_number: int):
+        # called by an AgentNode sharing this logger once the turn's agent_turn event is written
+        self._defined.add(round_number)
+
+    def _ref(self, turn, defs: dict) -> int:
+        ref = turn["round"]
+        if ref not in self._defined:
+            self._defined.add(ref)
+            defs[ref] = {"agent": turn["agent"], "text": turn["text"]}
+        return ref
+
+    def summary_ref(self, summary: str):
+        # the refs of the summary this node last produced (already defined); any other summary stays inline
+        return self._summary_refs.get(summary, summary)
@@ -0,0 +1,138 @@
+import functools
+import inspect
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(sorted_values, q: float) -> float:
+    # nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class Profiler:
+    """Opt-in wall/CPU/allocation timing for graph nodes and node methods.
+
+    Every measured call is emitted as a ``timing`` event on ``logger`` and kept
+    in memory for ``report()``. Sections may nest (a node calls the logger),
+    so times are inclusive. ``trace_memory`` turns on tracemalloc and adds the
+    peak bytes allocated inside each section. Meant for one debate at a time:
+    the section stack is not shared safely between interleaved debates.
+    """
+
+    def __init__(self, logger=None, trace_memory: bool = False):
+        # bound before attach() wraps the logger, so timing events are not timed themselves
+        self._emit = logger.log_event if logger else None
+        self.trace_memory = trace_memory
+        self.samples = defaultdict(list)
+        self.retries = defaultdict(int)
+        self._stack = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def section(self, name: str, extra=None):
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # keep the enclosing section's peak before resetting it for this one
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._stack.append([current, current])
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            event = {"event":"timing","node":name,"wall_ms":round(wall * 1e3, 4),"cpu_ms":round(cpu * 1e3, 4)}
+            peak_bytes = None
+            if self.trace_memory:
+                start, seen = self._stack.pop()
+                peak = max(seen, tracemalloc.get_traced_memory()[1])
+                peak_bytes = peak - start
+                event["peak_kb"] = round(peak_bytes / 1024, 2)
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+            if extra is not None:
+                event.update(extra())
+            self.samples[name].append((wall, cpu, peak_bytes))
+            self.retries[name] += event.get("retries", 0)
+            if self._emit:
+                self._emit(event)
+
+    def wrap(self, obj, method: str, name: str = None, extra=None):
+        # replace obj.method with a timed version on this instance only
+        fn = getattr(obj, method)
+        name = name or f"{type(obj).__name__}.{method}"
+        bound_extra = (lambda: extra(obj)) if extra else None
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def timed(*args, **kwargs):
+                with self.section(name, bound_extra):
+                    return await fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def timed(*args, **kwargs):
+                with self.section(name, bound_extra):
+                    return fn(*args, **kwargs)
+        setattr(obj, method, timed)
+        return timed
+
+    def attach(self, agents=(), memory_node=None, judge_node=None, logger=None):
+        # instrument the main node methods; async variants that delegate to the sync one are not wrapped
+        retries = lambda agent: {"retries": agent.last_retries}
+        for agent in agents:
+            self.wrap(agent, "take_turn", extra=retries)
+            self.wrap(agent, "atake_turn", "AgentNode.take_turn", extra=retries)
+        if memory_node is not None:
+            self.wrap(memory_node, "get_relevant_memory_for_agent")
+            self.wrap(memory_node, "generate_summary")
+            self.wrap(memory_node, "has_similar")
+            self.wrap(memory_node.index, "find")
+        if judge_node is not None:
+            self.wrap(judge_node, "update")
+            self.wrap(judge_node, "judge")
+        if logger is not None:
+            self.wrap(logger, "log_event")
+        return self
+
+    def close(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def report(self) -> list:
+        rows = []
+        for name in sorted(self.samples):
+            samples = self.samples[name]
+            wall = sorted(s[0] * 1e3 for s in samples)
+            row = {
+                "node": name,
+                "calls": len(samples),
+                "total_ms": sum(wall),
+                "p50_ms": percentile(wall, 50),
+                "p95_ms": percentile(wall, 95),
+                "p99_ms": percentile(wall, 99),
+                "cpu_ms": sum(s[1] for s in samples) * 1e3,
+                "retries": self.retries[name],
+            }
+            if self.trace_memory:
+                row["peak_kb"] = max(s[2] for s in samples) / 1024
+            rows.append(row)
+        return rows
+
+    def format_report(self) -> str:
+        rows = self.report()
+        lines = [f"{'node':<40} {'calls':>6} {'total ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+                 f"{'cpu ms':>8} {'retries':>7}" + (f" {'peak KiB':>9}" if self.trace_memory else "")]
+        for r in rows:
+            line = (f"{r['node']:<40} {r['calls']:>6} {r['total_ms']:>9.3f} {r['p50_ms']:>8.3f} {r['p95_ms']:>8.3f} "
+                    f"{r['p99_ms']:>8.3f} {r['cpu_ms']:>8.3f} {r['retries']:>7}")
+            if self.trace_memory:
+                line += f" {r['peak_kb']:>9.1f}"
+            lines.append(line)
+        return "\n".join(lines)
@@ -0,0 +1,257 @@
+import difflib
+import hashlib
+import zlib
+from array import array
+from typing import List, Optional, Tuple
+
+
+class SimilarityIndex:
+    """Incremental near-duplicate index over accepted turn texts.
+
+    Texts are lowercased once on insert and shingled into character n-grams.
+    A one-permutation MinHash signature is split into LSH bands, each hashed
+    to one int, which form an inverted index, so a query only looks at texts
+    sharing at least one band bucket. Candidates are then verified with the
+    same ``difflib.SequenceMatcher(None, new, prior).ratio()`` call as before.
+
+    While the index holds fewer than ``exact_below`` texts every prior text is
+    verified, which keeps short debates bit-for-bit identical to a full scan;
+    the buckets are only built once the index reaches that size. A bucket
+    holds a single doc id until a second text lands in it, then an array.
+
+    With ``resident`` set, only the newest ``resident`` texts are kept in
+    memory; an older one is re-read through ``fetch(ref)`` (``ref`` as passed
+    to ``add``) when it comes up as a candidate. Exact repeats of an indexed
+    text are counted but not indexed again, since the first copy already
+    answers every query the same way; they are found through an
+    open-addressing table of 8-byte digests.
+
+    ``postings`` (resident mode only) additionally bounds the buckets to the
+    newest ``postings`` distinct texts: older texts drop out of near-duplicate
+    search, while exact repeats are still found across the whole history.
+    What then stays resident per older text is its digest, a table slot and
+    its ref, about 40 bytes.
+    """
+
+    def __init__(self, threshold: float = 0.75, ngram: int = 7, bins: int = 96, rows: int = 3, exact_below: int = 256,
+                 resident: Optional[int] = None, postings: Optional[int] = None):
+        if bins % rows:
+            raise ValueError("bins must be a multiple of rows")
+        if postings is not None and (resident is None or postings < max(exact_below, 1)):
+            raise ValueError("postings needs resident and must be at least exact_below")
+        self.threshold = threshold
+        self.ngram = ngram
+        self.bins = bins
+        self.rows = rows
+        self.exact_below = exact_below
+        self.resident = resident
+        self.postings = postings
+        # ref -> text for texts no longer resident; set by the owner when resident is used
+        self.fetch = None
+        self.clear()
+
+    def __len__(self):
+        # texts added, including exact repeats that were not indexed again
+        return self._added
+
+    def clear(self):
+        # distinct texts (doc ids 0.._docs-1); with resident set the lists below are rings of that size
+        self._docs = 0
+        self._texts: List[Optional[str]] = []
+        self._lowered: List[Optional[str]] = []
+        # band hash -> doc id or array of doc ids; None until the index reaches exact_below texts
+        self._buckets = None
+        self._added = 0
+        self._refs = array("q")
+        # resident mode: digest per doc id, and an open-addressing table of doc id + 1 (0 = empty)
+        self._digests = array("q")
+        self._slots = array("q", bytes(8 * 64))
+        # postings mode: band hashes of the docs that still have postings, doc_id % postings per row
+        self._band_ring = array("q")
+
+    def add(self, text: str, ref: int = None) -> int:
+        lowered = text.lower()
+        self._added += 1
+        doc_id = self._docs
+        if self.resident is not None:
+            digest = _digest(lowered)
+            first = self._lookup(digest)
+            if first is not None:
+                return first
+            self._insert(doc_id, digest)
+            self._refs.append(self._added - 1 if ref is None else ref)
+        self._docs += 1
+        if self.resident is None:
+            self._texts.append(text)
+            self._lowered.append(lowered)
+        elif len(self._texts) < self.resident:
+            self._texts.append(text)
+            self._lowered.append(lowered)
+        else:
+            slot = doc_id % self.resident
+            self._texts[slot] = text
+            self._lowered[slot] = lowered
+        if self._buckets is not None:
+            if self.postings is not None and doc_id >= self.postings:
+                self._unpost(doc_id - self.postings)
+            self._post(doc_id, lowered)
+        elif self._docs >= self.exact_below:
+            self._buckets = {}
+            for prior in range(self._first_posted(), self._docs):
+                self._post(prior, self._lowered_text(prior))
+        return doc_id
+
+    def _first_posted(self) -> int:
+        # oldest doc id that still has postings (and is scanned below exact_below)
+        return 0 if self.postings is None else max(self._docs - self.postings, 0)
+
+    def _post(self, doc_id: int, lowered: str):
+        buckets = self._buckets
+        keys = self._band_keys(lowered)
+        for key in keys:
+            posting = buckets.get(key)
+            if posting is None:
+                buckets[key] = doc_id
+            elif type(posting) is int:
+                buckets[key] = array("q", (posting, doc_id))
+            else:
+                posting.append(doc_id)
+        if self.postings is not None:
+            width = self.bins // self.rows
+            # empty texts have no bands; pad so every ring row has the same width
+            row = array("q", keys + [0] * (width - len(keys)))
+            start = (doc_id % self.postings) * width
+            if start == len(self._band_ring):
+                self._band_ring.extend(row)
+            else:
+                self._band_ring[start:start + width] = row
+
+    def _unpost(self, doc_id: int):
+        # doc_id is the oldest doc with postings, so it leads every bucket it is in
+        width = self.bins // self.rows
+        start = (doc_id % self.postings) * width
+        buckets = self._buckets
+        for key in self._band_ring[start:start + width]:
+            posting = buckets.get(key)
+            if posting is None:
+                continue
+            if type(posting) is int:
+                if posting == doc_id:
+                    del buckets[key]
+                continue
+            while posting and posting[0] == doc_id:
+                posting.pop(0)
+            if len(posting) == 1:
+                buckets[key] = posting[0]
+            elif not posting:
+                del buckets[key]
+
+    def _lookup(self, digest: int) -> Optional[int]:
+        slots, mask = self._slots, len(self._slots) - 1
+        i = digest & mask
+        while slots[i]:
+            if self._digests[slots[i] - 1] == digest:
+                return slots[i] - 1
+            i = (i + 1) & mask
+        return None
+
+    def _insert(self, doc_id: int, digest: int):
+        self._digests.append(digest)
+        if 2 * len(self._digests) > len(self._slots):
+            # keep the table at most half full
+            self._slots = array("q", bytes(16 * len(self._slots)))
+            for prior in range(doc_id):
+                self._place(prior)
+        self._place(doc_id)
+
+    def _place(self, doc_id: int):
+        slots, mask = self._slots, len(self._slots) - 1
+        i = self._digests[doc_id] & mask
+        while slots[i]:
+            i = (i + 1) & mask
+        slots[i] = doc_id + 1
+
+    def _resident(self, doc_id: int) -> bool:
+        return self.resident is None or doc_id >= self._docs - self.resident
+
+    def text(self, doc_id: int) -> str:
+        if self.resident is None:
+            return self._texts[doc_id]
+        if self._resident(doc_id):
+            return self._texts[doc_id % self.resident]
+        return self.fetch(self._refs[doc_id])
+
+    def _lowered_text(self, doc_id: int) -> str:
+        if self.resident is None:
+            return self._lowered[doc_id]
+        if self._resident(doc_id):
+            return self._lowered[doc_id % self.resident]
+        return self.text(doc_id).lower()
+
+    def candidates(self, text: str) -> List[int]:
+        # ids of prior texts worth verifying, in insertion order
+        first = self._first_posted()
+        if self._docs - first < self.exact_below:
+            return list(range(first, self._docs))
+        found = set()
+        for key in self._band_keys(text.lower()):
+            posting = self._buckets.get(key)
+            if posting is None:
+                continue
+            if type(posting) is int:
+                found.add(posting)
+            else:
+                found.update(posting)
+        return sorted(found)
+
+    def find(self, text: str, threshold: Optional[float] = None) -> Optional[Tuple[int, float]]:
+        # first prior text (in insertion order) whose ratio reaches the threshold
+        threshold = self.threshold if threshold is None else threshold
+        lowered = text.lower()
+        if self.postings is not None:
+            # an exact repeat of a text that has no postings any more precedes every candidate
+            repeat = self._lookup(_digest(lowered))
+            if repeat is not None and repeat < self._first_posted():
+                return repeat, 1.0
+        n = len(lowered)
+        for doc_id in self.candidates(text):
+            prior = self._lowered_text(doc_id)
+            m = len(prior)
+            # ratio can never exceed 2*min/(n+m); skip hopeless pairs cheaply
+            if n + m and 2.0 * min(n, m) / (n + m) < threshold:
+                continue
+            sm = difflib.SequenceMatcher(None, lowered, prior)
+            if sm.quick_ratio() < threshold:
+                continue
+            ratio = sm.ratio()
+            if ratio >= threshold:
+                return doc_id, ratio
+        return None
+
+    def _band_keys(self, lowered: str):
+        q = self.ngram
+        grams = {lowered[i:i + q] for i in range(max(len(lowered) - q + 1, 1))}
+        # one-permutation hashing: one crc32 per gram, min per bin
+        sig = [None] * self.bins
+        for g in grams:
+            h = zlib.crc32(g.encode("utf-8"))
+            b = h % self.bins
+            v = h // self.bins
+            if sig[b] is None or v < sig[b]:
+                sig[b] = v
+        # densify empty bins by borrowing from the next filled bin
+        if any(v is None for v in sig):
+            filled = [i for i, v in enumerate(sig) if v is not None]
+            if not filled:
+                return []
+            for i in range(self.bins):
+                if sig[i] is None:
+                    j = next((f for f in filled if f > i), filled[0])
+                    sig[i] = (sig[j], j - i)
+        r = self.rows
+        # one int per band; a hash collision only adds a candidate that verification rejects
+        return [hash((band, *sig[band * r:(band + 1) * r])) for band in range(self.bins // r)]
+
+
+def _digest(lowered: str) -> int:
+    return int.from_bytes(hashlib.blake2b(lowered.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
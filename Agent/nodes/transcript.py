@@ -0,0 +1,278 @@
+import collections
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from typing import Iterable, List
+
+
+class Turn:
+    """Compact record for one debate turn.
+
+    Supports ``turn["text"]``/``turn.get()``/``dict(turn)`` so code written
+    against the old ``{"round", "agent", "text"}`` dicts keeps working.
+    """
+
+    __slots__ = ("round", "agent", "text")
+
+    def __init__(self, round: int, agent: str, text: str):
+        self.round = round
+        self.agent = agent
+        self.text = text
+
+    def __getitem__(self, key):
+        if key not in Turn.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in Turn.__slots__ else default
+
+    def keys(self):
+        return Turn.__slots__
+
+    def to_dict(self) -> dict:
+        return {"round": self.round, "agent": self.agent, "text": self.text}
+
+    def __eq__(self, other):
+        if isinstance(other, (Turn, dict)):
+            return all(self[k] == other.get(k) for k in Turn.__slots__) and len(other.keys()) == 3
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Turn(round={self.round!r}, agent={self.agent!r}, text={self.text!r})"
+
+
+class _TurnStore:
+    # column storage shared by every Transcript view over the same history
+    __slots__ = ("rounds", "agent_ids", "texts", "agents", "agent_index")
+
+    def __init__(self):
+        self.rounds = array("q")
+        self.agent_ids = array("I")
+        self.texts: List[str] = []
+        self.agents: List[str] = []
+        self.agent_index = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def append(self, round_number: int, agent: str, text: str):
+        agent_id = self.agent_index.get(agent)
+        if agent_id is None:
+            agent_id = self.agent_index[agent] = len(self.agents)
+            self.agents.append(sys.intern(agent))
+        self.rounds.append(round_number)
+        self.agent_ids.append(agent_id)
+        self.texts.append(text)
+
+    def turn(self, i: int) -> Turn:
+        return Turn(self.rounds[i], self.agents[self.agent_ids[i]], self.texts[i])
+
+    def text_list(self, n: int) -> List[str]:
+        return self.texts[:n]
+
+    def prefix(self, n: int) -> "_TurnStore":
+        store = _TurnStore()
+        store.rounds = self.rounds[:n]
+        store.agent_ids = self.agent_ids[:n]
+        store.texts = self.texts[:n]
+        store.agents = list(self.agents)
+        store.agent_index = dict(self.agent_index)
+        return store
+
+    def close(self):
+        pass
+
+
+class _SpillStore:
+    """Turn storage that keeps only the newest ``window`` turns in memory.
+
+    Older turns are appended to JSON-lines segment files of
+    ``segment_turns`` turns each in a private directory under ``directory``.
+    When a segment fills up, its line offsets are written next to it, so a
+    spilled turn is read back with one seek and resident state stays the
+    same size however long the transcript grows.
+    """
+
+    __slots__ = ("directory", "window", "segment_turns", "hot", "spilled", "agents", "_writer", "_offsets",
+                 "_reader")
+
+    def __init__(self, directory: str = None, window: int = 64, segment_turns: int = 4096):
+        if window < 1 or segment_turns < 1:
+            raise ValueError("window and segment_turns must be at least 1")
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="transcript-", dir=directory)
+        self.window = window
+        self.segment_turns = segment_turns
+        # (round, agent, text) of turns spilled..len-1
+        self.hot = collections.deque()
+        self.spilled = 0
+        self.agents = {}
+        self._writer = None
+        # line offsets of the segment being written
+        self._offsets = array("q")
+        # (segment, file, offsets) last read from
+        self._reader = None
+
+    def __len__(self):
+        return self.spilled + len(self.hot)
+
+    def append(self, round_number: int, agent: str, text: str):
+        agent = self.agents.setdefault(agent, sys.intern(agent))
+        self.hot.append((round_number, agent, text))
+        if len(self.hot) > self.window:
+            self._spill(self.hot.popleft())
+
+    def _path(self, segment: int, ext: str) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.{ext}")
+
+    def _spill(self, record):
+        if self._writer is None:
+            self._writer = open(self._path(self.spilled // self.segment_turns, "jsonl"), "ab")
+        self._offsets.append(self._writer.tell())
+        self._writer.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.spilled += 1
+        if len(self._offsets) == self.segment_turns:
+            # segment full: seal it with its offsets and start the next one on demand
+            self._writer.close()
+            self._writer = None
+            with open(self._path(self.spilled // self.segment_turns - 1, "idx"), "wb") as f:
+                self._offsets.tofile(f)
+            self._offsets = array("q")
+
+    def _read(self, i: int):
+        segment, line = divmod(i, self.segment_turns)
+        if segment == self.spilled // self.segment_turns:
+            # the open segment: its offsets are still in memory
+            self._writer.flush()
+            offsets = self._offsets
+        elif self._reader is not None and self._reader[0] == segment:
+            offsets = self._reader[2]
+        else:
+            offsets = array("q")
+            with open(self._path(segment, "idx"), "rb") as f:
+                offsets.frombytes(f.read())
+        if self._reader is None or self._reader[0] != segment:
+            if self._reader is not None:
+                self._reader[1].close()
+            self._reader = (segment, open(self._path(segment, "jsonl"), "rb"), offsets)
+        f = self._reader[1]
+        f.seek(offsets[line])
+        return json.loads(f.readline())
+
+    def turn(self, i: int) -> Turn:
+        if i >= self.spilled:
+            return Turn(*self.hot[i - self.spilled])
+        return Turn(*self._read(i))
+
+    def text_list(self, n: int) -> List[str]:
+        return [self.turn(i).text for i in range(n)]
+
+    def prefix(self, n: int) -> "_SpillStore":
+        # forks are rare (time travel); copy the first n turns into a new directory beside this one
+        store = _SpillStore(os.path.dirname(self.directory), self.window, self.segment_turns)
+        for i in range(n):
+            store.append(*self._turn_tuple(i))
+        return store
+
+    def _turn_tuple(self, i: int):
+        return self.hot[i - self.spilled] if i >= self.spilled else tuple(self._read(i))
+
+    def close(self):
+        # release file handles and delete the spilled segments
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._reader is not None:
+            self._reader[1].close()
+            self._reader = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class Transcript:
+    """Read-only, append-only view over a debate transcript.
+
+    Views never copy history: ``extend`` appends to the shared column store
+    and returns a longer view. Older views keep their length, so snapshots
+    stay valid; only extending an older view (a fork) copies its prefix.
+    ``Transcript.spilling`` starts an empty transcript whose older turns live
+    on disk (see ``_SpillStore``).
+    """
+
+    __slots__ = ("_store", "_len")
+
+    def __init__(self, turns: Iterable = ()):
+        self._store = _TurnStore()
+        for t in turns:
+            self._store.append(t["round"], t["agent"], t["text"])
+        self._len = len(self._store)
+
+    @classmethod
+    def spilling(cls, directory: str = None, window: int = 64, segment_turns: int = 4096) -> "Transcript":
+        # empty transcript keeping only the newest `window` turns in memory; call close() to delete the segments
+        return cls._view(_SpillStore(directory, window, segment_turns), 0)
+
+    @classmethod
+    def _view(cls, store: _TurnStore, n: int) -> "Transcript":
+        view = cls.__new__(cls)
+        view._store = store
+        view._len = n
+        return view
+
+    def __len__(self):
+        return self._len
+
+    def _turn(self, i: int) -> Turn:
+        return self._store.turn(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._turn(i) for i in range(*key.indices(self._len))]
+        if key < 0:
+            key += self._len
+        if not 0 <= key < self._len:
+            raise IndexError("transcript index out of range")
+        return self._turn(key)
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._turn(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (Transcript, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Transcript({len(self)} turns)"
+
+    def texts(self) -> List[str]:
+        return self._store.text_list(self._len)
+
+    def to_list(self) -> List[dict]:
+        return [t.to_dict() for t in self]
+
+    def extend(self, turns: Iterable) -> "Transcript":
+        store = self._store
+        if len(store) != self._len:
+            # someone already appended past this view: fork a private copy
+            store = store.prefix(self._len)
+        for t in turns:
+            store.append(t["round"], t["agent"], t["text"])
+        return Transcript._view(store, len(store))
+
+    def close(self):
+        self._store.close()
+
+
+def append_turns(left, right) -> Transcript:
+    """Reducer for ``DebateState.messages``: O(len(right)) instead of copying history."""
+    if not isinstance(left, Transcript):
+        left = Transcript(left or ())
+    if isinstance(right, Transcript) and not len(left):
+        return right
+    return left.extend(right or ())
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class TurnCache:
+    """Two-tier, content-addressed cache of accepted agent turns.
+
+    Tier one is an in-process LRU bounded by ``max_bytes`` of cached text.
+    Tier two (optional, ``path``) is a SQLite file that several worker
+    processes can share; disk hits are promoted into the LRU. Keys are
+    SHA-256 digests of the normalized generation inputs, so they are stable
+    across processes and runs.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, path: Optional[str] = None, namespace: str = ""):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.namespace = namespace
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lru = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS turns (key TEXT PRIMARY KEY, text TEXT NOT NULL)")
+            self._db.commit()
+
+    def key(self, agent: str, persona: str, topic: str, memory: dict, round_number: int, backend: str = "") -> str:
+        payload = {
+            "ns": self.namespace,
+            "backend": backend,
+            "agent": agent,
+            "persona": " ".join(persona.split()),
+            "topic": " ".join(topic.split()),
+            "memory": memory,
+            "round": round_number,
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=dict)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._lru.get(key)
+            if text is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return text
+            if self._db is not None:
+                row = self._db.execute("SELECT text FROM turns WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, text: str):
+        with self._lock:
+            self._remember(key, text)
+            if self._db is not None:
+                self._db.execute("INSERT OR IGNORE INTO turns (key, text) VALUES (?, ?)", (key, text))
+                self._db.commit()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "evictions": self.evictions, "entries": len(self._lru), "bytes": self._bytes}
+
+    def log_stats(self, logger):
+        if logger:
+            logger.log_event({"event":"cache_stats", **self.stats()})
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, text: str):
+        # caller holds self._lock
+        size = len(text.encode("utf-8"))
+        if key in self._lru:
+            self._bytes -= len(self._lru.pop(key).encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        self._lru[key] = text
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, old = self._lru.popitem(last=False)
+            self._bytes -= len(old.encode("utf-8"))
+            self.evictions += 1
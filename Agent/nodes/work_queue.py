@@ -0,0 +1,165 @@
+import contextlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+STATES = ("pending", "leased", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT, expires REAL, result TEXT, error TEXT, finished REAL
+);
+CREATE INDEX IF NOT EXISTS items_state ON items (state, id);
+"""
+
+
+class WorkQueue:
+    """SQLite work queue with time-limited leases, shared by worker processes.
+
+    Items are JSON payloads with a unique ``key`` (adding the same key twice
+    is a no-op). ``lease`` hands a worker up to ``n`` pending items, or items
+    whose lease expired, for ``ttl`` seconds; ``heartbeat`` extends them. An
+    item whose lease expired ``max_attempts`` times, or that failed that many
+    times, is marked failed. ``complete`` stores the first result for an item
+    and ignores later ones, so a worker whose lease expired while it finished
+    cannot record the item twice.
+
+    Expiry uses wall-clock time, so hosts sharing a queue need clocks closer
+    together than ``ttl``. WAL mode (the default) needs every process on one
+    host; with ``wal=False`` the file can sit on a shared filesystem with
+    working POSIX locks.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3, wal: bool = True):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # autocommit: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._db = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        # the journal mode is stored in the file, so switch back explicitly when wal is off
+        self._db.execute(f"PRAGMA journal_mode={'WAL' if wal else 'DELETE'}")
+        if wal:
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        # take the write lock up front so concurrent leases never pick the same rows
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def add(self, items: Iterable[Tuple[str, dict]]) -> int:
+        """Queue ``(key, payload)`` pairs; ids count up from 0 in the order added. Returns how many were new."""
+        added = 0
+        with self._transaction() as db:
+            for key, payload in items:
+                cur = db.execute("INSERT OR IGNORE INTO items (id, key, payload) "
+                                 "VALUES ((SELECT COALESCE(MAX(id) + 1, 0) FROM items), ?, ?)",
+                                 (key, json.dumps(payload, ensure_ascii=False, sort_keys=True)))
+                added += cur.rowcount
+        return added
+
+    def lease(self, worker: str, n: int = 1, ttl: float = 60.0) -> List[Tuple[int, dict]]:
+        """Lease up to ``n`` items (lowest ids first) to ``worker`` for ``ttl`` seconds."""
+        now = time.time()
+        with self._transaction() as db:
+            db.execute("UPDATE items SET state = 'failed', owner = NULL, error = 'lease expired' "
+                       "WHERE state = 'leased' AND expires < ? AND attempts >= ?", (now, self.max_attempts))
+            rows = db.execute("SELECT id, payload FROM items WHERE state = 'pending' "
+                              "OR (state = 'leased' AND expires < ?) ORDER BY id LIMIT ?", (now, n)).fetchall()
+            db.executemany("UPDATE items SET state = 'leased', owner = ?, expires = ?, attempts = attempts + 1 "
+                           "WHERE id = ?", [(worker, now + ttl, item_id) for item_id, _ in rows])
+        return [(item_id, json.loads(payload)) for item_id, payload in rows]
+
+    def heartbeat(self, worker: str, ids: Iterable[int], ttl: float = 60.0) -> List[int]:
+        """Extend ``worker``'s leases on ``ids``; returns the ids it still holds."""
+        ids = list(ids)
+        if not ids:
+            return []
+        marks = ",".join("?" * len(ids))
+        with self._transaction() as db:
+            db.execute(f"UPDATE items SET expires = ? WHERE state = 'leased' AND owner = ? AND id IN ({marks})",
+                       [time.time() + ttl, worker, *ids])
+            held = db.execute(f"SELECT id FROM items WHERE state = 'leased' AND owner = ? AND id IN ({marks})",
+                              [worker, *ids]).fetchall()
+        return [item_id for item_id, in held]
+
+    def complete(self, item_id: int, worker: str, result: dict) -> bool:
+        # idempotent: False if the item already has a result
+        with self._transaction() as db:
+            cur = db.execute("UPDATE items SET state = 'done', owner = ?, expires = NULL, result = ?, error = NULL, "
+                             "finished = ? WHERE id = ? AND state != 'done'",
+                             (worker, json.dumps(result, ensure_ascii=False), time.time(), item_id))
+        return cur.rowcount == 1
+
+    def fail(self, item_id: int, worker: str, error: str) -> bool:
+        # back to pending until max_attempts is used up; ignored unless worker still holds the lease
+        with self._transaction() as db:
+            cur = db.execute("UPDATE items SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                             "owner = NULL, expires = NULL, error = ? WHERE id = ? AND state = 'leased' AND owner = ?",
+                             (self.max_attempts, error, item_id, worker))
+        return cur.rowcount == 1
+
+    def release(self, worker: str, ids: Optional[Iterable[int]] = None) -> int:
+        """Hand ``worker``'s leases (all, or just ``ids``) back without using up an attempt."""
+        with self._transaction() as db:
+            query = ("UPDATE items SET state = 'pending', owner = NULL, expires = NULL, attempts = attempts - 1 "
+                     "WHERE state = 'leased' AND owner = ?")
+            if ids is None:
+                cur = db.execute(query, (worker,))
+            else:
+                cur = db.executemany(query + " AND id = ?", [(worker, item_id) for item_id in ids])
+        return cur.rowcount
+
+    def retry_failed(self) -> int:
+        # give every failed item a fresh set of attempts
+        with self._transaction() as db:
+            cur = db.execute("UPDATE items SET state = 'pending', attempts = 0 WHERE state = 'failed'")
+        return cur.rowcount
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM items GROUP BY state").fetchall()
+        return {**{state: 0 for state in STATES}, **dict(rows)}
+
+    def unfinished(self) -> bool:
+        # True while any item is pending or leased (an expired lease may still come back)
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM items WHERE state IN ('pending', 'leased') LIMIT 1").fetchone() \
+                is not None
+
+    def results(self) -> Iterator[Tuple[int, dict]]:
+        with self._lock:
+            rows = self._db.execute("SELECT id, result FROM items WHERE state = 'done' ORDER BY id").fetchall()
+        for item_id, result in rows:
+            yield item_id, json.loads(result)
+
+    def failures(self) -> List[dict]:
+        with self._lock:
+            rows = self._db.execute("SELECT id, payload, attempts, error FROM items WHERE state = 'failed' "
+                                    "ORDER BY id").fetchall()
+        return [{"id": item_id, "payload": json.loads(payload), "attempts": attempts, "error": error}
+                for item_id, payload, attempts, error in rows]
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
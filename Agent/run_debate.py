@@ -2,196 +2,410 @@
 """CLI launcher for the debate workflow using LangGraph."""
 import argparse
 import sys
-import os
 from datetime import datetime
-from typing import Literal
-
-from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from nodes.user_input_node import UserInputNode
 from nodes.memory_node import MemoryNode
-from nodes.agent_node import AgentNode
+from nodes.backends import HTTPBackend
+from nodes.turn_cache import TurnCache
 from nodes.judge_node import JudgeNode
 from nodes.logger_node import LoggerNode
+from nodes.profiler import Profiler
 from nodes.graph_state import DebateState
+from nodes.transcript import Transcript
+from nodes.debate_config import DebateConfig, round_robin
+from nodes.local_graph import END, START, LocalGraph
+
+# LangGraph (and the langchain_core it pulls in) is imported only when a graph is compiled with it
+ENGINES = ("langgraph", "local")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Run a structured debate between two agents.")
     parser.add_argument("--topic", type=str, help="Topic to debate (if omitted, prompted)")
     parser.add_argument("--seed", type=int, default=42, help="Optional seed for deterministic runs")
+    parser.add_argument("--persona-config", type=str, default=None,
+                        help="JSON file with the agents, personas, rounds and turn order (default: scientist vs "
+                             "philosopher, 8 rounds)")
     parser.add_argument("--log-path", type=str, default=None, help="Path to write the debate log")
+    parser.add_argument("--log-mode", choices=["append", "buffered", "background"], default="append",
+                        help="append: open/close per event; buffered: persistent handle with batched writes; "
+                             "background: buffered writes on a writer thread")
+    parser.add_argument("--log-fsync", choices=["none", "batch", "event"], default="none",
+                        help="Durability policy for the log file")
+    parser.add_argument("--log-segment-mb", type=float, default=None, metavar="MB",
+                        help="Segmented log: --log-path is a directory of rotated segments, sealed at this size")
+    parser.add_argument("--log-segment-events", type=int, default=None, metavar="N",
+                        help="Segmented log: seal a segment after N events (with or instead of --log-segment-mb)")
+    parser.add_argument("--log-compression", choices=["auto", "gzip", "zstd", "none"], default="auto",
+                        help="Compression of sealed segments (auto: zstd if zstandard is installed, else gzip)")
+    parser.add_argument("--log-compact", action="store_true",
+                        help="Log memory/summary events as references to turn texts (expand with nodes/log_reader.py)")
+    parser.add_argument("--render-dag", type=str, default=None, metavar="PATH",
+                        help="Also export the DAG of the selected --engine (.mmd Mermaid or .dot text; .png uses a "
+                             "remote renderer and needs the langgraph engine)")
+    parser.add_argument("--backend-url", type=str, default=None,
+                        help="Generate turns with an HTTP backend (see backend_server.py) instead of templates")
+    parser.add_argument("--cache-db", type=str, default=None,
+                        help="Reuse turns from a SQLite response cache (shared across runs/processes)")
+    parser.add_argument("--candidate-pool", action="store_true",
+                        help="Draw each agent's arguments from a seeded pool of all template combinations (no retry loop)")
+    parser.add_argument("--checkpoint-db", type=str, default=None,
+                        help="Persist debate state to this SQLite file after every node")
+    parser.add_argument("--thread-id", type=str, default=None,
+                        help="Checkpoint thread to write (or resume); defaults to debate-<timestamp>")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the checkpointed debate given by --thread-id instead of starting a new one")
+    parser.add_argument("--memory-window", type=int, default=None, metavar="N",
+                        help="Bounded memory: keep only the newest N turns in RAM and spill older ones to disk")
+    parser.add_argument("--spill-dir", type=str, default=None,
+                        help="Directory for spilled transcript segments (default: the system temp dir)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Log a timing event per node/method call and print a latency table at the end")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="With --profile, also trace peak allocations per call (tracemalloc; slower)")
+    parser.add_argument("--engine", choices=ENGINES, default="langgraph",
+                        help="Run the graph with LangGraph or the built-in local executor (faster startup, same logs)")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Run the graph with ainvoke on an asyncio event loop")
     args = parser.parse_args()
 
     # Setup log path
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_path = args.log_path or f"debate_log_{ts}.jsonl"
-    logger = LoggerNode(log_path)
-    
-    # Initialize implementation nodes
-    user_node = UserInputNode(logger=logger)
-    
-    # Get Topic
-    if args.topic:
-        topic = args.topic
-    else:
-        topic = user_node.prompt_topic()
+    segmented = bool(args.log_segment_mb or args.log_segment_events)
+    # concurrent runs can share one segment directory; single-file logs get a per-run name
+    log_path = args.log_path or ("debate_logs" if segmented else f"debate_log_{ts}.jsonl")
+    logger = LoggerNode(log_path, buffered=args.log_mode != "append", background=args.log_mode == "background",
+                        fsync=args.log_fsync,
+                        segment_bytes=int(args.log_segment_mb * 2 ** 20) if args.log_segment_mb else None,
+                        segment_events=args.log_segment_events, compression=args.log_compression)
     
-    topic_clean = user_node.validate_and_sanitize(topic)
-    if not topic_clean:
-        print("Invalid topic. Exiting.")
+    debate_config = DebateConfig.load(args.persona_config) if args.persona_config else DebateConfig.default()
+    checkpointer = None
+    if args.checkpoint_db:
+        if args.engine == "local":
+            print("--checkpoint-db needs the langgraph engine. Exiting.")
+            logger.close()
+            sys.exit(1)
+        from nodes.checkpointer import SqliteCheckpointer
+        checkpointer = SqliteCheckpointer(args.checkpoint_db)
+    if args.resume and not (checkpointer and args.thread_id):
+        print("--resume needs --checkpoint-db and --thread-id. Exiting.")
+        logger.close()
         sys.exit(1)
+    thread_id = args.thread_id or f"debate-{ts}"
+    run_config = {"configurable": {"thread_id": thread_id}} if checkpointer else None
+
+    if args.resume:
+        snapshot = compile_graph(debate_config.names, checkpointer).get_state(run_config)
+        if not snapshot.values:
+            print(f"No checkpoint found for thread {thread_id}. Exiting.")
+            logger.close()
+            sys.exit(1)
+        topic_clean = snapshot.values["topic"]
+        print(f"Resuming debate on: {topic_clean} (thread {thread_id}, round {snapshot.values.get('round_count', 0)})")
+        logger.log_event({"event":"resume_debate","topic":topic_clean,"thread_id":thread_id,
+                          "round":snapshot.values.get("round_count", 0)})
+    else:
+        # Initialize implementation nodes
+        user_node = UserInputNode(logger=logger)
+
+        # Get Topic
+        if args.topic:
+            topic = args.topic
+        else:
+            topic = user_node.prompt_topic()
+
+        topic_clean = user_node.validate_and_sanitize(topic)
+        if not topic_clean:
+            print("Invalid topic. Exiting.")
+            logger.close()
+            sys.exit(1)
 
-    print(f"Starting debate on: {topic_clean}")
-    logger.log_event({"event":"start_debate","topic":topic_clean, "seed": args.seed})
+        print(f"Starting debate on: {topic_clean}")
+        if checkpointer:
+            print(f"Checkpointing to {args.checkpoint_db} (thread {thread_id})")
+        logger.log_event({"event":"start_debate","topic":topic_clean, "seed": args.seed})
 
     # Initialize Agents and Helpers
-    a_persona = os.path.join("persona_templates", "scientist.txt")
-    b_persona = os.path.join("persona_templates", "philosopher.txt")
-    
-    agent_a = AgentNode("AgentA", persona_path=a_persona, seed=args.seed, logger=logger)
-    agent_b = AgentNode("AgentB", persona_path=b_persona, seed=args.seed + 1, logger=logger)
-    memory_node = MemoryNode(logger=logger)
+    backend = HTTPBackend(args.backend_url) if args.backend_url else None
+    cache = TurnCache(path=args.cache_db) if args.cache_db else None
+    memory_node = MemoryNode(logger=logger, compact_log=args.log_compact, resident_turns=args.memory_window)
+    agents = debate_config.build_agents(args.seed, logger=logger, memory=memory_node, backend=backend, cache=cache,
+                                        candidate_pool=args.candidate_pool)
     judge_node = JudgeNode(logger=logger)
+    profiler = None
+    if args.profile:
+        profiler = Profiler(logger, trace_memory=args.profile_memory)
+        profiler.attach(agents, memory_node, judge_node, logger)
 
-    app = build_graph(agent_a, agent_b, memory_node, judge_node, logger, topic_clean, log_path)
+    app = build_debate_graph(agents, memory_node, judge_node, logger, topic_clean, log_path,
+                             schedule=debate_config.schedule, checkpointer=checkpointer, profiler=profiler,
+                             engine=args.engine)
+    if args.render_dag:
+        from generate_dag import generate_dag
+        generate_dag(args.render_dag, debate_config.names, engine=args.engine)
 
     # Run
+    transcript = Transcript.spilling(args.spill_dir, args.memory_window) if args.memory_window else None
     initial_state = {
-        "messages": [], 
+        "messages": transcript if transcript is not None else [],
         "round_count": 0, 
         "summary": "", 
-        "current_speaker": None
+        "current_speaker": None,
+        "topic": topic_clean,
     }
-    
-    app.invoke(initial_state)
+    if args.resume:
+        # None tells LangGraph to continue from the last checkpoint; agents pick up their RNG state
+        initial_state = None
+        by_name = {agent.name: agent for agent in agents}
+        for name, state in snapshot.values.get("agent_rng", {}).items():
+            if name in by_name:
+                by_name[name].rng.setstate((state[0], tuple(state[1]), state[2]))
+
+    try:
+        if args.use_async:
+            import asyncio
+            asyncio.run(app.ainvoke(initial_state, run_config))
+        else:
+            app.invoke(initial_state, run_config)
+    finally:
+        if transcript is not None:
+            transcript.close()
+        if profiler:
+            profiler.close()
+            print("\n[Profile] per-call wall time (inclusive)")
+            print(profiler.format_report())
+        if checkpointer:
+            checkpointer.close()
+        if cache:
+            cache.log_stats(logger)
+            cache.close()
+        if backend:
+            backend.close()
+        logger.close()
+
+# compiled graphs keyed by agent topology; node functions look up the
+# per-debate objects in config["configurable"]["debate"]
+_GRAPH_CACHE = {}
+
+
+class DebateContext:
+    """Per-debate objects that a cached, compiled graph runs against.
+
+    ``schedule`` is the speaker of every round (routing reads it, so one
+    compiled graph serves any number of rounds and turn orders);
+    ``coordinator`` (optional RoundCoordinator) makes every agent node assert
+    it is speaking in turn; ``echo=False`` silences the per-turn prints;
+    ``profiler`` (optional Profiler) times every node.
+    """
+
+    def __init__(self, agents, memory_node, judge_node, logger, topic_clean, log_path, coordinator=None, echo=True,
+                 profiler=None, schedule=None):
+        self.agents = agents
+        self.schedule = tuple(schedule) if schedule is not None else round_robin(list(agents), 8)
+        self.memory_node = memory_node
+        self.judge_node = judge_node
+        self.logger = logger
+        self.topic = topic_clean
+        self.log_path = log_path
+        self.coordinator = coordinator
+        self.echo = echo
+        self.profiler = profiler
+
+
+def build_graph(agent_a, agent_b, memory_node, judge_node, logger, topic_clean, log_path, coordinator=None, echo=True,
+                checkpointer=None, profiler=None, engine="langgraph"):
+    return build_debate_graph([agent_a, agent_b], memory_node, judge_node, logger, topic_clean, log_path,
+                              coordinator=coordinator, echo=echo, checkpointer=checkpointer, profiler=profiler,
+                              engine=engine)
+
+
+def build_debate_graph(agents, memory_node, judge_node, logger, topic_clean, log_path, schedule=None, coordinator=None,
+                       echo=True, checkpointer=None, profiler=None, engine="langgraph"):
+    # any number of agents; schedule defaults to 8 rounds of round-robin in list order
+    ctx = DebateContext({a.name: a for a in agents}, memory_node, judge_node, logger, topic_clean, log_path,
+                        coordinator=coordinator, echo=echo, profiler=profiler, schedule=schedule)
+    if coordinator is not None and coordinator.schedule is None:
+        coordinator.use_schedule(ctx.schedule)
+    app = compile_graph(tuple(ctx.agents), checkpointer, engine)
+    # one agent step and one memory step per round, plus the judge
+    return app.with_config(configurable={"debate": ctx}, recursion_limit=2 * len(ctx.schedule) + 10)
+
+
+def compile_graph(agent_names=("AgentA", "AgentB"), checkpointer=None, engine="langgraph"):
+    # build and compile once per agent set, checkpointer and engine; rendering lives in generate_dag.py
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    key = (tuple(agent_names), checkpointer, engine)
+    app = _GRAPH_CACHE.get(key)
+    if app is None:
+        app = _GRAPH_CACHE[key] = _compile_graph(key[0], checkpointer, engine)
+    return app
+
+
+def _compile_graph(agent_names, checkpointer=None, engine="langgraph"):
+    if engine == "local":
+        RunnableConfig = dict
+    else:
+        from langchain_core.runnables import RunnableConfig, RunnableLambda
+        from langgraph.graph import StateGraph
 
-def build_graph(agent_a, agent_b, memory_node, judge_node, logger, topic_clean, log_path):
     # --- Graph Node Functions ---
+    # every node has a sync body (invoke) and an async one (ainvoke)
 
-    def call_agent_a(state: DebateState):
-        current_round = state.get("round_count", 0) + 1 # Increment here effectively for the turn
-        messages = state.get("messages", [])
-        summary = state.get("summary", "")
-        
-        # Get relevant context
-        relevant = memory_node.get_relevant_memory_for_agent("AgentA", messages, summary)
-        
-        # Generate text
-        try:
-            text = agent_a.take_turn(topic_clean, relevant, messages, current_round)
-        except Exception as e:
-            text = f"[ERROR] {str(e)}"
-            if logger:
-                logger.log_event({"event":"turn_error","agent":"AgentA","error":str(e)})
-
-        entry = {"round": current_round, "agent": "AgentA", "text": text}
-        print(f"[Round {current_round}] AgentA: {text}")
-        
-        return {
-            "messages": [entry],
-            "round_count": current_round, 
-            "current_speaker": "AgentA"
-        }
+    def node(name, func, afunc):
+        # (sync, async) bodies; a profiler on the debate context times the whole node as "node:<name>"
+        label = f"node:{name}"
 
-    def call_agent_b(state: DebateState):
-        current_round = state.get("round_count", 0) + 1
-        messages = state.get("messages", [])
-        summary = state.get("summary", "")
-        
-        relevant = memory_node.get_relevant_memory_for_agent("AgentB", messages, summary)
-        
-        try:
-            text = agent_b.take_turn(topic_clean, relevant, messages, current_round)
-        except Exception as e:
-            text = f"[ERROR] {str(e)}"
-            if logger:
-                logger.log_event({"event":"turn_error","agent":"AgentB","error":str(e)})
-
-        entry = {"round": current_round, "agent": "AgentB", "text": text}
-        print(f"[Round {current_round}] AgentB: {text}")
+        def run(state, config: RunnableConfig):
+            profiler = config["configurable"]["debate"].profiler
+            if profiler is None:
+                return func(state, config)
+            with profiler.section(label):
+                return func(state, config)
+
+        async def arun(state, config: RunnableConfig):
+            profiler = config["configurable"]["debate"].profiler
+            if profiler is None:
+                return await afunc(state, config)
+            with profiler.section(label):
+                return await afunc(state, config)
+
+        return run, arun
+
+    def make_agent_node(name):
+        def begin_turn(state, ctx):
+            current_round = state.get("round_count", 0) + 1 # Increment here effectively for the turn
+            if ctx.coordinator:
+                ctx.coordinator.require_turn(name)
+            return current_round, state.get("messages", []), state.get("summary", ""), state.get("topic") or ctx.topic
+
+        def end_turn(ctx, current_round, text=None, error=None):
+            if error is not None:
+                text = f"[ERROR] {str(error)}"
+                if ctx.logger:
+                    ctx.logger.log_event({"event":"turn_error","agent":name,"error":str(error)})
+            if ctx.coordinator:
+                ctx.coordinator.advance_round()
 
+            entry = {"round": current_round, "agent": name, "text": text}
+            if ctx.echo:
+                print(f"[Round {current_round}] {name}: {text}")
+
+            return {
+                "messages": [entry],
+                "round_count": current_round,
+                "current_speaker": name,
+                "agent_rng": {name: ctx.agents[name].rng.getstate()},
+            }
+
+        def call_agent(state: DebateState, config: RunnableConfig):
+            ctx = config["configurable"]["debate"]
+            current_round, messages, summary, topic = begin_turn(state, ctx)
+            # Get relevant context
+            relevant = ctx.memory_node.get_relevant_memory_for_agent(name, messages, summary)
+            # Generate text
+            try:
+                text = ctx.agents[name].take_turn(topic, relevant, messages, current_round)
+            except Exception as e:
+                return end_turn(ctx, current_round, error=e)
+            return end_turn(ctx, current_round, text)
+
+        async def acall_agent(state: DebateState, config: RunnableConfig):
+            ctx = config["configurable"]["debate"]
+            current_round, messages, summary, topic = begin_turn(state, ctx)
+            relevant = await ctx.memory_node.aget_relevant_memory_for_agent(name, messages, summary)
+            try:
+                text = await ctx.agents[name].atake_turn(topic, relevant, messages, current_round)
+            except Exception as e:
+                return end_turn(ctx, current_round, error=e)
+            return end_turn(ctx, current_round, text)
+
+        return node(name, call_agent, acall_agent)
+
+    def update_memory(state: DebateState, config: RunnableConfig):
+        # Update summary and the judge's running scores
+        ctx = config["configurable"]["debate"]
+        messages = state.get("messages", [])
+        new_summary = ctx.memory_node.generate_summary(messages)
+        ctx.judge_node.update(messages)
         return {
-            "messages": [entry],
-            "round_count": current_round,
-            "current_speaker": "AgentB"
+            "summary": new_summary,
+            "current_speaker": state.get("current_speaker")
         }
 
-    def update_memory(state: DebateState):
-        # Update summary
+    async def aupdate_memory(state: DebateState, config: RunnableConfig):
+        ctx = config["configurable"]["debate"]
         messages = state.get("messages", [])
-        new_summary = memory_node.generate_summary(messages)
+        new_summary = await ctx.memory_node.agenerate_summary(messages)
+        ctx.judge_node.update(messages)
         return {
             "summary": new_summary,
             "current_speaker": state.get("current_speaker")
         }
 
-    def call_judge(state: DebateState):
+    def report_verdict(ctx, verdict):
+        if ctx.echo:
+            print("\n[Judge] Summary of debate:")
+            print(verdict["summary"])
+            print(f"[Judge] Winner: {verdict['winner']}\nReason: {verdict['justification']}")
+
+        if ctx.logger:
+            logged = verdict
+            if ctx.memory_node.compact_log:
+                logged = {**verdict, "summary": ctx.memory_node.summary_ref(verdict["summary"])}
+            ctx.logger.log_event({"event":"final_verdict","verdict":logged})
+        if ctx.echo:
+            print(f"Log saved to {ctx.log_path}")
+
+        return {"verdict": verdict}
+
+    def call_judge(state: DebateState, config: RunnableConfig):
+        ctx = config["configurable"]["debate"]
         messages = state.get("messages", [])
         summary = state.get("summary", "")
-        verdict = judge_node.judge(messages, summary)
-        
-        print("\n[Judge] Summary of debate:")
-        print(verdict["summary"])
-        print(f"[Judge] Winner: {verdict['winner']}\nReason: {verdict['justification']}")
-        
-        if logger:
-            logger.log_event({"event":"final_verdict","verdict":verdict})
-        print(f"Log saved to {log_path}")
-        
-        return {"verdict": verdict}
+        return report_verdict(ctx, ctx.judge_node.judge(messages, summary))
+
+    async def acall_judge(state: DebateState, config: RunnableConfig):
+        ctx = config["configurable"]["debate"]
+        verdict = await ctx.judge_node.ajudge(state.get("messages", []), state.get("summary", ""))
+        return report_verdict(ctx, verdict)
 
     # --- Conditional Edge ---
 
-    def route_turn(state: DebateState) -> Literal["AgentA", "AgentB", "Judge"]:
+    def route_turn(state: DebateState, config: RunnableConfig) -> str:
+        # O(1): the next speaker is looked up in the debate's precomputed schedule
+        schedule = config["configurable"]["debate"].schedule
         rc = state.get("round_count", 0)
-        
-        # We need 8 rounds TOTAL. 
-        if rc >= 8: 
+        if rc >= len(schedule):
             return "Judge"
-        
-        if rc % 2 == 1:
-            return "AgentB"
-        else:
-            return "AgentA"
+        return schedule[rc]
 
     # --- Build Graph ---
-    workflow = StateGraph(DebateState)
-
-    workflow.add_node("AgentA", call_agent_a)
-    workflow.add_node("AgentB", call_agent_b)
-    workflow.add_node("Memory", update_memory)
-    workflow.add_node("Judge", call_judge)
-
-    workflow.add_edge(START, "AgentA")
-    workflow.add_edge("AgentA", "Memory")
-    workflow.add_edge("AgentB", "Memory")
-
-    workflow.add_conditional_edges(
-        "Memory",
-        route_turn,
-        {
-            "AgentA": "AgentA",
-            "AgentB": "AgentB",
-            "Judge": "Judge"
-        }
-    )
+    if engine == "local":
+        workflow = LocalGraph(DebateState)
+        add_node = workflow.add_node
+    else:
+        workflow = StateGraph(DebateState)
+
+        def add_node(name, func, afunc):
+            workflow.add_node(name, RunnableLambda(func, afunc=afunc, name=name))
+
+    routes = {name: name for name in agent_names}
+    routes["Judge"] = "Judge"
+    for name in agent_names:
+        add_node(name, *make_agent_node(name))
+        workflow.add_edge(name, "Memory")
+    add_node("Memory", *node("Memory", update_memory, aupdate_memory))
+    add_node("Judge", *node("Judge", call_judge, acall_judge))
+
+    workflow.add_conditional_edges(START, route_turn, routes)
+    workflow.add_conditional_edges("Memory", route_turn, routes)
 
     workflow.add_edge("Judge", END)
 
-    app = workflow.compile()
-    
-    # Generate Diagram
-    try:
-        png_data = app.get_graph().draw_mermaid_png()
-        with open("dag.png", "wb") as f:
-            f.write(png_data)
-        # print("Generated DAG: dag.png") 
-    except Exception:
-        pass
-        
-    return app
+    return workflow.compile(checkpointer=checkpointer)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Run many debates (topics x seeds x persona pairs) across a process pool."""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from nodes.user_input_node import UserInputNode
+from nodes.memory_node import MemoryNode
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.logger_node import LoggerNode
+from nodes.turn_cache import TurnCache
+from run_debate import build_graph
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PERSONA_DIR = os.path.join(ROOT, "persona_templates")
+
+# per-process cache of compiled debate graphs, keyed by persona pair
+_WORKERS = {}
+# per-process TurnCache (optional), shared by every persona pair in the worker
+_CACHE = None
+
+
+class _Worker:
+    """Nodes plus a compiled graph, built once per process and reused per debate."""
+
+    def __init__(self, persona_a: str, persona_b: str, cache=None):
+        self.cache = cache
+        self.logger = LoggerNode(os.devnull)
+        self.memory = MemoryNode(logger=self.logger)
+        self.agent_a = AgentNode("AgentA", persona_path=os.path.join(PERSONA_DIR, f"{persona_a}.txt"),
+                                 logger=self.logger, memory=self.memory, cache=cache)
+        self.agent_b = AgentNode("AgentB", persona_path=os.path.join(PERSONA_DIR, f"{persona_b}.txt"),
+                                 logger=self.logger, memory=self.memory, cache=cache)
+        self.judge = JudgeNode(logger=self.logger)
+        self.app = build_graph(self.agent_a, self.agent_b, self.memory, self.judge, self.logger, None, None)
+
+    def run(self, topic: str, seed: int, log_path: str) -> dict:
+        # reset every piece of per-debate state so results depend only on (topic, seed, pair)
+        self.logger.path = log_path
+        self.agent_a.reseed(seed)
+        self.agent_b.reseed(seed + 1)
+        self.memory.reset()
+        self.logger.log_event({"event":"start_debate","topic":topic, "seed": seed})
+        initial_state = {"messages": [], "round_count": 0, "summary": "", "topic": topic}
+        with contextlib.redirect_stdout(io.StringIO()):
+            final = self.app.invoke(initial_state)
+        if self.cache:
+            self.cache.log_stats(self.logger)
+        return final["verdict"]
+
+
+def _init_worker(cache_db=None, cache_bytes=None):
+    global _CACHE
+    if cache_db or cache_bytes:
+        _CACHE = TurnCache(max_bytes=cache_bytes or 8 * 1024 * 1024, path=cache_db)
+
+
+def _run_job(job: dict) -> dict:
+    pair = (job["persona_a"], job["persona_b"])
+    worker = _WORKERS.get(pair)
+    if worker is None:
+        worker = _WORKERS[pair] = _Worker(*pair, cache=_CACHE)
+    log_path = job["log_path"] or os.devnull
+    try:
+        verdict = worker.run(job["topic"], job["seed"], log_path)
+    except Exception as e:
+        return {**_job_key(job), "winner": None, "winner_persona": None, "scores": {}, "error": str(e)}
+    personas = {"AgentA": job["persona_a"], "AgentB": job["persona_b"]}
+    return {
+        **_job_key(job),
+        "winner": verdict["winner"],
+        "winner_persona": personas.get(verdict["winner"]),
+        "scores": verdict["scores"],
+    }
+
+
+def _reset_worker():
+    global _CACHE
+    if _CACHE is not None:
+        _CACHE.close()
+    _CACHE = None
+    _WORKERS.clear()
+
+
+def _job_key(job: dict) -> dict:
+    return {k: job[k] for k in ("debate", "topic", "seed", "persona_a", "persona_b")}
+
+
+def load_topics(path: str, logger=None):
+    validator = UserInputNode(logger=logger)
+    topics = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            clean = validator.validate_and_sanitize(line)
+            if clean:
+                topics.append(clean)
+            else:
+                print(f"Skipping invalid topic: {line!r}", file=sys.stderr)
+    return topics
+
+
+def make_jobs(topics, seeds, persona_pairs, log_dir=None):
+    # job ids are assigned from the grid order, never from scheduling order
+    jobs = []
+    for topic in topics:
+        for seed in seeds:
+            for persona_a, persona_b in persona_pairs:
+                idx = len(jobs)
+                log_path = os.path.join(log_dir, f"debate_{idx:06d}.jsonl") if log_dir else None
+                jobs.append({"debate": idx, "topic": topic, "seed": seed, "persona_a": persona_a,
+                             "persona_b": persona_b, "log_path": log_path})
+    return jobs
+
+
+def run_tournament(topics, seeds, persona_pairs=(("scientist", "philosopher"),), workers=None, out_dir=None, chunksize=8,
+                   cache_db=None, cache_bytes=None):
+    """Run every (topic, seed, persona pair) debate and return results ordered by debate id.
+
+    ``workers=0`` runs in-process; otherwise a ProcessPoolExecutor is used and
+    each worker compiles one graph per persona pair. With ``out_dir`` set, each
+    debate is logged to ``out_dir/logs/debate_<id>.jsonl`` and the per-debate
+    results are written to ``out_dir/results.jsonl``. ``cache_db``/``cache_bytes``
+    give every worker a TurnCache (the SQLite tier is shared between workers).
+    Cache hits skip generation, so only cache-less sweeps are seed-reproducible.
+    """
+    log_dir = None
+    if out_dir:
+        log_dir = os.path.join(out_dir, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+    jobs = make_jobs(topics, list(seeds), [tuple(p) for p in persona_pairs], log_dir)
+
+    if workers == 0:
+        _init_worker(cache_db, cache_bytes)
+        try:
+            results = [_run_job(job) for job in jobs]
+        finally:
+            _reset_worker()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_db, cache_bytes)) as pool:
+            results = list(pool.map(_run_job, jobs, chunksize=max(1, chunksize)))
+    results.sort(key=lambda r: r["debate"])
+
+    if out_dir:
+        with open(os.path.join(out_dir, "results.jsonl"), "w", encoding="utf-8") as f:
+            for r in results:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    return results
+
+
+def aggregate(results):
+    # per persona: debates played, wins, win rate and mean score
+    table = {}
+    for r in results:
+        for agent, persona in (("AgentA", r["persona_a"]), ("AgentB", r["persona_b"])):
+            row = table.setdefault(persona, {"persona": persona, "debates": 0, "wins": 0, "total_score": 0})
+            row["debates"] += 1
+            row["wins"] += int(r["winner"] == agent)
+            row["total_score"] += r["scores"].get(agent, 0)
+    rows = []
+    for persona in sorted(table):
+        row = table[persona]
+        row["win_rate"] = row["wins"] / row["debates"] if row["debates"] else 0.0
+        row["mean_score"] = row["total_score"] / row["debates"] if row["debates"] else 0.0
+        rows.append(row)
+    return rows
+
+
+def format_table(rows):
+    lines = [f"{'persona':<16} {'debates':>8} {'wins':>6} {'win rate':>9} {'mean score':>11}"]
+    for row in rows:
+        lines.append(f"{row['persona']:<16} {row['debates']:>8} {row['wins']:>6} {row['win_rate']:>9.3f} {row['mean_score']:>11.2f}")
+    return "\n".join(lines)
+
+
+def _parse_pair(value: str):
+    a, sep, b = value.partition(":")
+    if not sep or not a or not b:
+        raise argparse.ArgumentTypeError(f"persona pair must look like scientist:philosopher, got {value!r}")
+    return a, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a tournament of debates across topics and seeds.")
+    parser.add_argument("--topics", required=True, help="File with one topic per line")
+    parser.add_argument("--seed-start", type=int, default=0, help="First seed (inclusive)")
+    parser.add_argument("--seed-stop", type=int, default=10, help="Last seed (exclusive)")
+    parser.add_argument("--pairs", type=_parse_pair, nargs="+", default=[("scientist", "philosopher")],
+                        help="Persona pairs as agentA:agentB template names")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 runs in-process)")
+    parser.add_argument("--cache-db", type=str, default=None, help="SQLite turn cache shared by all workers")
+    parser.add_argument("--out-dir", type=str, default="tournament_out", help="Directory for logs and results")
+    args = parser.parse_args()
+
+    topics = load_topics(args.topics)
+    if not topics:
+        print("No valid topics. Exiting.")
+        sys.exit(1)
+    results = run_tournament(topics, range(args.seed_start, args.seed_stop), args.pairs,
+                             workers=args.workers, out_dir=args.out_dir, cache_db=args.cache_db)
+    errors = sum(1 for r in results if r.get("error"))
+    print(format_table(aggregate([r for r in results if not r.get("error")])))
+    print(f"{len(results)} debates ({errors} failed). Results saved to {os.path.join(args.out_dir, 'results.jsonl')}")
+
+
+if __name__ == "__main__":
+    main()
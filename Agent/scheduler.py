@@ -0,0 +1,107 @@
+"""Run many debates concurrently in one asyncio event loop."""
+import asyncio
+import os
+
+from nodes.agent_node import AgentNode
+from nodes.coordinator import RoundCoordinator
+from nodes.debate_config import round_robin
+from nodes.judge_node import JudgeNode
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_debate_graph
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PERSONA_DIR = os.path.join(ROOT, "persona_templates")
+
+
+class DebateScheduler:
+    """Interleaves debates on one event loop via ``ainvoke``.
+
+    At most ``max_concurrency`` debates run at once; the rest wait on a
+    semaphore. Each debate gets its own nodes and a RoundCoordinator, so turn
+    order inside a debate is enforced no matter how debates interleave.
+    Debates can be cancelled individually by id.
+    """
+
+    def __init__(self, max_concurrency=100, persona_a="scientist", persona_b="philosopher", log_dir=None, total_rounds=8,
+                 backend=None):
+        self.max_concurrency = max_concurrency
+        # shared generation backend (None = templates); HTTPBackend batches across debates
+        self.backend = backend
+        self.persona_a = persona_a
+        self.persona_b = persona_b
+        self.log_dir = log_dir
+        self.total_rounds = total_rounds
+        self.active = 0
+        self.peak_active = 0
+        self._semaphore = None
+        self._tasks = {}
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+    def submit(self, topic: str, seed: int, debate_id=None) -> asyncio.Task:
+        # must be called from inside the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        debate_id = len(self._tasks) if debate_id is None else debate_id
+        if debate_id in self._tasks:
+            raise ValueError(f"Duplicate debate id: {debate_id!r}")
+        task = asyncio.get_running_loop().create_task(self._run(debate_id, topic, seed))
+        self._tasks[debate_id] = task
+        return task
+
+    def cancel(self, debate_id) -> bool:
+        task = self._tasks.get(debate_id)
+        return task.cancel() if task is not None else False
+
+    async def gather(self) -> dict:
+        # results by debate id; cancelled debates map to {"cancelled": True}
+        ids = list(self._tasks)
+        outcomes = await asyncio.gather(*(self._tasks[i] for i in ids), return_exceptions=True)
+        results = {}
+        for debate_id, outcome in zip(ids, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                results[debate_id] = {"cancelled": True}
+            elif isinstance(outcome, BaseException):
+                results[debate_id] = {"error": str(outcome)}
+            else:
+                results[debate_id] = outcome
+        return results
+
+    async def run_all(self, jobs) -> dict:
+        """Submit ``(topic, seed)`` pairs (ids are their positions) and wait for all of them."""
+        for topic, seed in jobs:
+            self.submit(topic, seed)
+        return await self.gather()
+
+    async def _run(self, debate_id, topic: str, seed: int) -> dict:
+        async with self._semaphore:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                return await self._debate(debate_id, topic, seed)
+            finally:
+                self.active -= 1
+
+    async def _debate(self, debate_id, topic: str, seed: int) -> dict:
+        log_path = os.path.join(self.log_dir, f"debate_{debate_id}.jsonl") if self.log_dir else os.devnull
+        logger = LoggerNode(log_path)
+        memory = MemoryNode(logger=logger)
+        agent_a = AgentNode("AgentA", persona_path=os.path.join(PERSONA_DIR, f"{self.persona_a}.txt"), seed=seed,
+                            logger=logger, memory=memory, backend=self.backend)
+        agent_b = AgentNode("AgentB", persona_path=os.path.join(PERSONA_DIR, f"{self.persona_b}.txt"), seed=seed + 1,
+                            logger=logger, memory=memory, backend=self.backend)
+        # routing and turn order both follow this schedule, so total_rounds sets the debate length
+        schedule = round_robin([agent_a.name, agent_b.name], self.total_rounds)
+        coordinator = RoundCoordinator(schedule=schedule)
+        app = build_debate_graph([agent_a, agent_b], memory, JudgeNode(logger=logger), logger, topic, log_path,
+                                 schedule=schedule, coordinator=coordinator, echo=False)
+        logger.log_event({"event":"start_debate","topic":topic, "seed": seed})
+        try:
+            final = await app.ainvoke({"messages": [], "round_count": 0, "summary": "", "topic": topic})
+        except asyncio.CancelledError:
+            logger.log_event({"event":"debate_cancelled","round":coordinator.round_number()})
+            raise
+        finally:
+            logger.close()
+        return final["verdict"]
@@ -0,0 +1,161 @@
+"""Stream a debate as typed events while the graph runs."""
+import functools
+import os
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from nodes.user_input_node import UserInputNode
+from run_debate import build_graph
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PERSONA_DIR = os.path.join(ROOT, "persona_templates")
+
+
+class DebateEvent:
+    kind = None
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, **{k: getattr(self, k) for k in self.__slots__}}
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class TurnEvent(DebateEvent):
+    """One accepted (or failed, ``[ERROR] ...``) agent turn."""
+
+    kind = "turn"
+    __slots__ = ("round", "agent", "text")
+
+    def __init__(self, round: int, agent: str, text: str):
+        self.round = round
+        self.agent = agent
+        self.text = text
+
+
+class SummaryEvent(DebateEvent):
+    """The rolling summary after ``round``."""
+
+    kind = "summary"
+    __slots__ = ("round", "summary")
+
+    def __init__(self, round: int, summary: str):
+        self.round = round
+        self.summary = summary
+
+
+class VerdictEvent(DebateEvent):
+    """The judge's verdict; always the last event of a completed debate."""
+
+    kind = "verdict"
+    __slots__ = ("verdict",)
+
+    def __init__(self, verdict: dict):
+        self.verdict = verdict
+
+    @property
+    def winner(self) -> str:
+        return self.verdict["winner"]
+
+
+def print_event(event: DebateEvent):
+    # stdout sink matching run_debate's console output
+    if event.kind == "turn":
+        print(f"[Round {event.round}] {event.agent}: {event.text}")
+    elif event.kind == "verdict":
+        print("\n[Judge] Summary of debate:")
+        print(event.verdict["summary"])
+        print(f"[Judge] Winner: {event.verdict['winner']}\nReason: {event.verdict['justification']}")
+
+
+@functools.lru_cache(maxsize=None)
+def load_persona(persona: str) -> str:
+    # persona_templates/<persona>.txt, read once per process ("" if missing, like AgentNode)
+    path = os.path.join(PERSONA_DIR, f"{persona}.txt")
+    if not os.path.exists(path):
+        return ""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _prepare(topic, seed, persona_a, persona_b, log_path, backend, cache, engine):
+    logger = LoggerNode(log_path or os.devnull)
+    topic_clean = UserInputNode(logger=logger).validate_and_sanitize(topic)
+    if not topic_clean:
+        logger.close()
+        raise ValueError(f"Invalid topic: {topic!r}")
+    memory = MemoryNode(logger=logger)
+    agent_a = AgentNode("AgentA", persona_path=os.path.join(PERSONA_DIR, f"{persona_a}.txt"), seed=seed, logger=logger,
+                        memory=memory, backend=backend, cache=cache, persona_text=load_persona(persona_a))
+    agent_b = AgentNode("AgentB", persona_path=os.path.join(PERSONA_DIR, f"{persona_b}.txt"), seed=seed + 1,
+                        logger=logger, memory=memory, backend=backend, cache=cache, persona_text=load_persona(persona_b))
+    app = build_graph(agent_a, agent_b, memory, JudgeNode(logger=logger), logger, topic_clean, log_path, echo=False,
+                      engine=engine)
+    logger.log_event({"event":"start_debate","topic":topic_clean, "seed": seed})
+    initial_state = {"messages": [], "round_count": 0, "summary": "", "topic": topic_clean}
+    return app, logger, initial_state
+
+
+class _Translator:
+    # turns LangGraph "updates" chunks ({node: partial state}) into DebateEvents
+    def __init__(self):
+        self.round = 0
+        self.done = False
+
+    def events(self, chunk: dict):
+        for update in chunk.values():
+            if not update:
+                continue
+            for entry in update.get("messages", ()):
+                self.round = entry["round"]
+                yield TurnEvent(entry["round"], entry["agent"], entry["text"])
+            if "summary" in update:
+                yield SummaryEvent(self.round, update["summary"])
+            if "verdict" in update:
+                self.done = True
+                yield VerdictEvent(update["verdict"])
+
+
+def stream_debate(topic: str, seed: int = 42, persona_a: str = "scientist", persona_b: str = "philosopher",
+                  log_path: str = None, backend=None, cache=None, sink=None, engine: str = "langgraph"):
+    """Run a debate and yield TurnEvent/SummaryEvent/VerdictEvent as each node finishes.
+
+    The graph only advances while the caller iterates, so a slow consumer
+    applies backpressure, and closing the generator (or breaking out of the
+    loop) stops the debate after the current node; that is logged as
+    ``debate_stopped``. ``sink`` (e.g. ``print_event``) sees every event
+    before it is yielded. ``engine`` is passed to ``build_graph``.
+    """
+    app, logger, initial_state = _prepare(topic, seed, persona_a, persona_b, log_path, backend, cache, engine)
+    translator = _Translator()
+    try:
+        for chunk in app.stream(initial_state, stream_mode="updates"):
+            for event in translator.events(chunk):
+                if sink:
+                    sink(event)
+                yield event
+    finally:
+        if not translator.done:
+            logger.log_event({"event":"debate_stopped","round":translator.round})
+        logger.close()
+
+
+async def astream_debate(topic: str, seed: int = 42, persona_a: str = "scientist", persona_b: str = "philosopher",
+                         log_path: str = None, backend=None, cache=None, sink=None, engine: str = "langgraph"):
+    """Async-iterator variant of ``stream_debate`` (runs the graph with ``astream``)."""
+    app, logger, initial_state = _prepare(topic, seed, persona_a, persona_b, log_path, backend, cache, engine)
+    translator = _Translator()
+    try:
+        async for chunk in app.astream(initial_state, stream_mode="updates"):
+            for event in translator.events(chunk):
+                if sink:
+                    sink(event)
+                yield event
+    finally:
+        if not translator.done:
+            logger.log_event({"event":"debate_stopped","round":translator.round})
+        logger.close()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Run a tournament grid from a shared SQLite work queue, with workers on any number of hosts.
+
+    python sweep.py init sweep.db --topics topics.txt --seed-stop 1000 --pairs scientist:philosopher
+    python sweep.py work sweep.db --workers 4 --out-dir sweep_out      # on every host
+    python sweep.py status sweep.db
+    python sweep.py results sweep.db --out sweep_out/results.jsonl
+"""
+import argparse
+import json
+import os
+import secrets
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from nodes.work_queue import WorkQueue
+from run_tournament import _init_worker, _parse_pair, _reset_worker, _run_job, aggregate, format_table, load_topics, \
+    make_jobs
+
+
+def grid_items(topics, seeds, persona_pairs):
+    # (key, job) per debate; the key makes re-running init with a grown grid add only the new debates
+    for job in make_jobs(topics, list(seeds), [tuple(p) for p in persona_pairs]):
+        job = {k: job[k] for k in ("topic", "seed", "persona_a", "persona_b")}
+        yield json.dumps([job["topic"], job["seed"], job["persona_a"], job["persona_b"]], ensure_ascii=False), job
+
+
+def init_sweep(queue_path, topics, seeds, persona_pairs=(("scientist", "philosopher"),), wal=True) -> int:
+    """Queue every (topic, seed, persona pair) debate; returns how many were not queued already."""
+    with WorkQueue(queue_path, wal=wal) as queue:
+        return queue.add(grid_items(topics, seeds, persona_pairs))
+
+
+class _Heartbeat(threading.Thread):
+    """Keeps extending a worker's leases while it runs them; drops ids whose lease was lost."""
+
+    def __init__(self, queue, worker, ttl):
+        super().__init__(name="LeaseHeartbeat", daemon=True)
+        self.queue = queue
+        self.worker = worker
+        self.ttl = ttl
+        self.held = set()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def hold(self, ids):
+        with self._lock:
+            self.held.update(ids)
+
+    def drop(self, item_id):
+        with self._lock:
+            self.held.discard(item_id)
+
+    def holds(self, item_id) -> bool:
+        with self._lock:
+            return item_id in self.held
+
+    def run(self):
+        while not self._done.wait(self.ttl / 3):
+            with self._lock:
+                ids = list(self.held)
+            kept = set(self.queue.heartbeat(self.worker, ids, self.ttl))
+            with self._lock:
+                self.held -= set(ids) - kept
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def run_worker(queue_path, out_dir=None, batch=8, ttl=60.0, poll=1.0, max_items=None, worker_id=None,
+               cache_db=None, wal=True, max_attempts=3) -> dict:
+    """Lease and run debates from the queue until none are left (or ``max_items`` ran).
+
+    Debates run exactly as in ``run_tournament`` (seeded from the grid, so a
+    retried debate gives the same verdict), and results are committed with
+    ``WorkQueue.complete``. With ``out_dir``, a debate is logged to a
+    temporary file that is renamed to ``out_dir/logs/debate_<id>.jsonl`` once
+    it finished, so retries never append to a log twice. On exit, leases not
+    yet run are handed back.
+    """
+    worker = worker_id or f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(3)}"
+    log_dir = os.path.join(out_dir, "logs") if out_dir else None
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    stats = {"worker": worker, "completed": 0, "failed": 0, "duplicates": 0, "lost": 0}
+    queue = WorkQueue(queue_path, max_attempts=max_attempts, wal=wal)
+    heartbeat = _Heartbeat(queue, worker, ttl)
+    heartbeat.start()
+    _init_worker(cache_db)
+    ran = 0
+    try:
+        while max_items is None or ran < max_items:
+            items = queue.lease(worker, batch if max_items is None else min(batch, max_items - ran), ttl)
+            if not items:
+                if not queue.unfinished():
+                    break
+                # everything left is leased by other workers; wait in case a lease expires
+                time.sleep(poll)
+                continue
+            heartbeat.hold(item_id for item_id, _ in items)
+            for item_id, job in items:
+                if not heartbeat.holds(item_id):
+                    stats["lost"] += 1
+                    continue
+                _run_item(queue, worker, item_id, job, log_dir, stats)
+                heartbeat.drop(item_id)
+                ran += 1
+    finally:
+        heartbeat.stop()
+        queue.release(worker)
+        queue.close()
+        _reset_worker()
+    return stats
+
+
+def _run_item(queue, worker, item_id, job, log_dir, stats):
+    log_path = os.path.join(log_dir, f"debate_{item_id:06d}.jsonl") if log_dir else None
+    tmp = f"{log_path}.{worker}.tmp" if log_path else None
+    result = _run_job({**job, "debate": item_id, "log_path": tmp})
+    if result.get("error"):
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)
+        queue.fail(item_id, worker, result["error"])
+        stats["failed"] += 1
+        return
+    if tmp:
+        os.replace(tmp, log_path)
+    if queue.complete(item_id, worker, result):
+        stats["completed"] += 1
+    else:
+        stats["duplicates"] += 1
+
+
+def run_workers(queue_path, workers=None, **kwargs):
+    """Run ``workers`` worker processes on this host (``0`` runs one worker in-process); returns their stats."""
+    if workers == 0:
+        return [run_worker(queue_path, **kwargs)]
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_worker, queue_path, **kwargs) for _ in range(workers)]
+        return [f.result() for f in futures]
+
+
+def collect(queue_path, out_path=None, wal=True):
+    """Finished results ordered by debate id (the format ``run_tournament`` returns), optionally saved as JSONL."""
+    with WorkQueue(queue_path, wal=wal) as queue:
+        results = [result for _, result in queue.results()]
+    if out_path:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            for r in results:
+                f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-wal", dest="wal", action="store_false",
+                        help="Rollback journal instead of WAL, for a queue on a filesystem shared between hosts")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    init = sub.add_parser("init", help="Queue a topic x seed x persona grid (idempotent)")
+    init.add_argument("queue")
+    init.add_argument("--topics", required=True, help="File with one topic per line")
+    init.add_argument("--seed-start", type=int, default=0, help="First seed (inclusive)")
+    init.add_argument("--seed-stop", type=int, default=10, help="Last seed (exclusive)")
+    init.add_argument("--pairs", type=_parse_pair, nargs="+", default=[("scientist", "philosopher")],
+                      help="Persona pairs as agentA:agentB template names")
+
+    work = sub.add_parser("work", help="Run debates from the queue until it is empty")
+    work.add_argument("queue")
+    work.add_argument("--workers", type=int, default=None, help="Worker processes on this host (0 runs in-process)")
+    work.add_argument("--batch", type=int, default=8, help="Debates leased per queue round trip")
+    work.add_argument("--lease", type=float, default=60.0, help="Lease length in seconds (renewed by heartbeats)")
+    work.add_argument("--max-attempts", type=int, default=3, help="Attempts before a debate is marked failed")
+    work.add_argument("--out-dir", type=str, default=None, help="Directory for per-debate logs")
+    work.add_argument("--cache-db", type=str, default=None, help="SQLite turn cache shared by the workers")
+
+    status = sub.add_parser("status", help="Show item counts per state and failed debates")
+    status.add_argument("queue")
+
+    retry = sub.add_parser("retry", help="Re-queue failed debates")
+    retry.add_argument("queue")
+
+    results = sub.add_parser("results", help="Print the persona table of finished debates")
+    results.add_argument("queue")
+    results.add_argument("--out", type=str, default=None, help="Also write the results as JSONL")
+    args = parser.parse_args()
+
+    if args.command == "init":
+        topics = load_topics(args.topics)
+        if not topics:
+            print("No valid topics. Exiting.")
+            sys.exit(1)
+        added = init_sweep(args.queue, topics, range(args.seed_start, args.seed_stop), args.pairs, wal=args.wal)
+        print(f"Queued {added} new debates in {args.queue}")
+    elif args.command == "work":
+        t0 = time.perf_counter()
+        stats = run_workers(args.queue, args.workers, batch=args.batch, ttl=args.lease, out_dir=args.out_dir,
+                            cache_db=args.cache_db, wal=args.wal, max_attempts=args.max_attempts)
+        done = sum(s["completed"] for s in stats)
+        print(f"{done} debates in {time.perf_counter() - t0:.1f}s "
+              f"({sum(s['failed'] for s in stats)} failed attempts, {sum(s['duplicates'] for s in stats)} duplicates)")
+    elif args.command in ("status", "retry"):
+        with WorkQueue(args.queue, wal=args.wal) as queue:
+            if args.command == "retry":
+                print(f"Re-queued {queue.retry_failed()} failed debates")
+            print(" ".join(f"{state}={n}" for state, n in queue.counts().items()))
+            for f in queue.failures():
+                print(f"failed {f['id']} after {f['attempts']} attempts: {f['error']}")
+    else:
+        rows = collect(args.queue, args.out, wal=args.wal)
+        print(format_table(aggregate(rows)))
+        print(f"{len(rows)} finished debates" + (f". Results saved to {args.out}" if args.out else ""))
+
+
+if __name__ == "__main__":
+    main()
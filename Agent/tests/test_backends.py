@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from backend_server import StubBackendServer
+from nodes.agent_node import AgentNode
+from nodes.backends import GenerationBackend, HTTPBackend, TurnRequest
+from nodes.memory_node import MemoryNode
+from scheduler import DebateScheduler
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+@pytest.fixture
+def server():
+    srv = StubBackendServer().start()
+    yield srv
+    srv.stop()
+
+
+def test_http_backend_turns_are_deterministic(server):
+    backend = HTTPBackend(server.url)
+    texts = []
+    for _ in range(2):
+        mem = MemoryNode()
+        agent = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", memory=mem, backend=backend)
+        texts.append([agent.take_turn(TOPIC, {"turns": [], "summary": ""}, [], r) for r in (1, 3)])
+    backend.close()
+    assert texts[0] == texts[1]
+    assert TOPIC in texts[0][0]
+
+
+def test_async_requests_are_micro_batched(server):
+    backend = HTTPBackend(server.url, max_batch=16, batch_window=0.05)
+
+    async def go():
+        reqs = [TurnRequest("AgentA", "", TOPIC, {}, r, 0) for r in range(40)]
+        return await asyncio.gather(*(backend.agenerate(None, r) for r in reqs))
+
+    texts = asyncio.run(go())
+    backend.close()
+    assert len(texts) == 40
+    assert backend.prompts_sent == 40
+    assert backend.requests_sent <= 4
+    assert server.requests == backend.requests_sent
+
+
+def test_scheduler_with_shared_http_backend(server):
+    backend = HTTPBackend(server.url, max_batch=8)
+    results = asyncio.run(DebateScheduler(max_concurrency=8, backend=backend).run_all([(TOPIC, s) for s in range(8)]))
+    backend.close()
+    assert all("winner" in r for r in results.values())
+    assert backend.requests_sent < backend.prompts_sent
+
+
+def test_backend_without_generate_fails_at_construction():
+    class NoGenerate(GenerationBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoGenerate()
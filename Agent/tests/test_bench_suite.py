@@ -0,0 +1,59 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+SUITE_PATH = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "suite.py")
+
+
+@pytest.fixture(scope="module")
+def suite():
+    spec = importlib.util.spec_from_file_location("bench_suite", SUITE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _result(median):
+    return {"median_s": median, "min_s": median, "stdev_s": 0.0, "samples": 1, "ops_per_s": 1 / median,
+            "unit": "calls"}
+
+
+def test_suite_covers_every_node_and_debate_sizes(suite):
+    names = suite.select()
+    for prefix in ("duplicate_check[", "logger[", "summary[", "judge[", "graph_compile["):
+        assert any(n.startswith(prefix) for n in names)
+    assert "debate[rounds=8,engine=langgraph]" in names
+    assert "debate[rounds=1000,engine=langgraph]" in names
+    # quick runs skip the slow sizes
+    assert "debate[rounds=1000,engine=langgraph]" not in suite.select(quick=True)
+    assert suite.select("judge[turns=8]") == ["judge[turns=8]"]
+
+
+def test_compare_flags_regressions_beyond_threshold(suite):
+    baseline = {"a": _result(1.0), "b": _result(1.0), "c": _result(1.0), "gone": _result(1.0)}
+    current = {"a": _result(1.2), "b": _result(1.5), "c": _result(0.5), "added": _result(1.0)}
+    rows = {name: (ratio, status) for name, _, _, ratio, status in suite.compare(current, baseline, 0.25)}
+    assert rows["a"] == (pytest.approx(1.2), "ok")
+    assert rows["b"] == (pytest.approx(1.5), "regression")
+    assert rows["c"] == (pytest.approx(0.5), "improved")
+    assert rows["gone"][1] == "missing"
+    assert rows["added"][1] == "new"
+    assert "regression" in suite.format_comparison(suite.compare(current, baseline, 0.25))
+
+
+def test_main_saves_json_and_exits_nonzero_on_regression(suite, tmp_path, capsys):
+    out = tmp_path / "results.json"
+    args = ["--quick", "-k", "summary[history=8]", "--repeat", "2", "--min-time", "0"]
+    assert suite.main(args + ["--save", str(out)]) == 0
+    saved = json.loads(out.read_text())
+    assert saved["version"] == suite.FORMAT_VERSION and saved["meta"]["quick"] is True
+    assert list(saved["results"]) == ["summary[history=8]"]
+    assert saved["results"]["summary[history=8]"]["median_s"] > 0
+
+    assert suite.main(args + ["--baseline", str(out), "--threshold", "1000"]) == 0
+    saved["results"]["summary[history=8]"]["median_s"] = 1e-12
+    out.write_text(json.dumps(saved))
+    assert suite.main(args + ["--baseline", str(out)]) == 1
+    assert "1 regression(s): summary[history=8]" in capsys.readouterr().out
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import os
+
+from nodes.debate_config import DebateConfig
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from nodes.similarity_index import SimilarityIndex
+from nodes.transcript import Transcript, append_turns
+from run_debate import build_debate_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _entry(r, agent="AgentA"):
+    return {"round": r, "agent": agent, "text": f"turn {r} é"}
+
+
+def test_spilling_transcript_reads_back_every_turn(tmp_path):
+    entries = [_entry(r, "AgentA" if r % 2 else "AgentB") for r in range(1, 301)]
+    t = Transcript.spilling(str(tmp_path), window=4, segment_turns=16)
+    for i in range(0, 300, 7):
+        t = append_turns(t, entries[i:i + 7])
+    store = t._store
+    assert len(store.hot) == 4 and store.spilled == 296
+    assert t == entries
+    assert t[17] == entries[17] and t[-1] == entries[-1] and t[-5:] == entries[-5:]
+    assert t.texts() == [e["text"] for e in entries]
+    # spilled turns come back even after the reader has moved to another segment
+    assert [t[i]["round"] for i in (290, 3, 150, 3)] == [291, 4, 151, 4]
+    t.close()
+    assert not os.path.exists(store.directory)
+
+
+def test_forking_a_spilled_view(tmp_path):
+    base = append_turns(Transcript.spilling(str(tmp_path), window=2, segment_turns=3), [_entry(r) for r in range(1, 9)])
+    left = append_turns(base, [_entry(9)])
+    right = append_turns(base, [_entry(10)])
+    assert [t["round"] for t in left] == list(range(1, 10))
+    assert [t["round"] for t in right] == list(range(1, 9)) + [10]
+    assert right._store is not left._store
+    left.close()
+    right.close()
+
+
+def test_resident_index_answers_like_the_full_index():
+    texts = [f"argument number {i % 40} about oversight and public safety" for i in range(200)]
+    full, bounded = SimilarityIndex(), SimilarityIndex(resident=8)
+    bounded.fetch = lambda ref: texts[ref]
+    for i, text in enumerate(texts):
+        full.add(text)
+        bounded.add(text, i)
+    assert len(bounded) == 200 and len(bounded._texts) == 8 and len(bounded._refs) == 40
+    for probe in ("argument number 3 about oversight and public safety!", "something else entirely"):
+        a, b = full.find(probe), bounded.find(probe)
+        assert (a is None) == (b is None)
+        if a is not None:
+            assert full.text(a[0]) == bounded.text(b[0]) and a[1] == b[1]
+
+
+def test_postings_window_bounds_the_buckets():
+    texts = [f"argument {i} " + " ".join(f"w{(i * 7 + k) % 997}x{k}" for k in range(10)) for i in range(300)]
+    index = SimilarityIndex(resident=4, postings=50, exact_below=20)
+    index.fetch = lambda ref: texts[ref]
+    for i, text in enumerate(texts):
+        index.add(text, i)
+    posted = set()
+    for posting in index._buckets.values():
+        posted.update([posting] if isinstance(posting, int) else posting)
+    assert posted == set(range(250, 300))
+    # near-duplicates are found inside the window, exact repeats across the whole history
+    assert index.find(texts[290] + "!")[0] == 290
+    assert index.find(texts[10].upper()) == (10, 1.0)
+    assert index.find(texts[10] + "!") is None
+    assert index.add(texts[10], 300) == 10 and len(index) == 301
+
+
+def _run(window):
+    config = DebateConfig.default(24)
+    memory = MemoryNode(resident_turns=window)
+    app = build_debate_graph(config.build_agents(3, memory=memory), memory, JudgeNode(), None, TOPIC, None,
+                             schedule=config.schedule, echo=False)
+    messages = Transcript.spilling(window=window, segment_turns=5) if window else []
+    with contextlib.redirect_stdout(io.StringIO()):
+        final = app.invoke({"messages": messages, "round_count": 0, "summary": "", "topic": TOPIC})
+    result = (final["messages"].to_list(), final["summary"], final["verdict"])
+    if window:
+        assert final["messages"]._store is messages._store and messages._store.spilled == 24 - window
+        messages.close()
+    return result
+
+
+def test_bounded_debate_matches_unbounded():
+    assert _run(2) == _run(None)
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from nodes.agent_node import AgentNode, is_duplicate
+from nodes.backends import GenerationBackend, TurnRequest
+from nodes.candidate_pool import CandidatePool
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+class FixedBackend(GenerationBackend):
+    def __init__(self, texts):
+        self.texts = texts
+
+    def generate(self, agent, request):
+        return self.texts[0]
+
+    def candidates(self, agent, topic):
+        return list(self.texts)
+
+
+def run_debate(rounds, seed, candidate_pool=True):
+    memory = MemoryNode()
+    agents = [AgentNode("AgentA", "persona_templates/scientist.txt", seed=seed, memory=memory, candidate_pool=candidate_pool),
+              AgentNode("AgentB", "persona_templates/philosopher.txt", seed=seed + 1, memory=memory,
+                        candidate_pool=candidate_pool)]
+    for r in range(1, rounds + 1):
+        agent = agents[(r - 1) % 2]
+        text = agent.take_turn(TOPIC, memory.get_relevant_memory_for_agent(agent.name, memory.turns, ""), memory.turns, r)
+        assert agent.last_retries == 0
+        memory.update_with_turn(r, agent.name, text)
+    return [t["text"] for t in memory.turns]
+
+
+def test_candidates_cover_generate_and_vary():
+    agent = AgentNode("AgentA", "persona_templates/scientist.txt", seed=5)
+    candidates = set(agent.backend.candidates(agent, TOPIC))
+    for r in range(200):
+        request = TurnRequest(agent.name, agent.persona_text, TOPIC, {}, r, 0)
+        text = agent.backend.generate(agent, request)
+        assert text in candidates
+        assert agent.backend.vary(agent, request, text) in candidates
+
+
+def test_pool_debate_has_no_duplicates_and_is_deterministic():
+    texts = run_debate(16, seed=3)
+    assert texts == run_debate(16, seed=3)
+    for i, text in enumerate(texts):
+        assert not is_duplicate(text, texts[:i])
+
+
+def test_pool_skips_texts_already_in_transcript():
+    memory = MemoryNode()
+    agent = AgentNode("AgentA", "persona_templates/scientist.txt", memory=memory,
+                      backend=FixedBackend(["alpha beta gamma delta epsilon zeta", "one two three four five six"]),
+                      candidate_pool=True)
+    memory.update_with_turn(1, "AgentB", "alpha beta gamma delta epsilon zeta")
+    assert agent.take_turn(TOPIC, {}, memory.turns, 2) == "one two three four five six"
+
+
+def test_exhaustion_is_known_before_the_failing_turn(tmp_path):
+    log = tmp_path / "log.jsonl"
+    logger = LoggerNode(str(log))
+    memory = MemoryNode()
+    agent = AgentNode("AgentA", "persona_templates/scientist.txt", logger=logger, memory=memory,
+                      backend=FixedBackend(["alpha beta gamma delta epsilon zeta", "alpha beta gamma delta epsilon zeta!"]),
+                      candidate_pool=True)
+    text = agent.take_turn(TOPIC, {}, memory.turns, 1)
+    memory.update_with_turn(1, agent.name, text)
+    assert agent._pool.remaining == 0
+    with pytest.raises(Exception, match="candidate pool exhausted"):
+        agent.take_turn(TOPIC, {}, memory.turns, 2)
+    logger.close()
+    assert '"candidate_pool_exhausted"' in log.read_text(encoding="utf-8")
+
+
+def test_pool_resets_for_a_new_transcript():
+    pool = CandidatePool(["alpha beta gamma delta epsilon zeta", "one two three four five six"], random.Random(0))
+    first = pool.next(lambda text: False)
+    pool.sync([{"text": first}])
+    pool.sync([])
+    assert pool.remaining == 2
+    assert pool.next(lambda text: False) == first
+
+
+def test_pool_resets_for_a_different_transcript_of_equal_length():
+    pool = CandidatePool(["alpha beta gamma delta epsilon zeta", "one two three four five six"], random.Random(0))
+    first = pool.next(lambda text: False)
+    pool.sync([{"text": first}])
+    other = "completely different words about remote work policy"
+    pool.sync([{"text": other}])
+    assert pool.remaining == 2
+    assert pool.next(lambda text: False) == first
+
+
+def test_reseeded_agent_matches_a_fresh_one():
+    agent = AgentNode("AgentA", "persona_templates/scientist.txt", seed=1, candidate_pool=True)
+    agent.take_turn(TOPIC, {}, [], 1)
+    agent.reseed(9)
+    fresh = AgentNode("AgentA", "persona_templates/scientist.txt", seed=9, candidate_pool=True)
+    assert agent.take_turn(TOPIC, {}, [], 1) == fresh.take_turn(TOPIC, {}, [], 1)
+    assert agent._pool.order == fresh._pool.order
@@ -0,0 +1,98 @@
+import contextlib
+import io
+import sqlite3
+
+import pytest
+
+from nodes.agent_node import AgentNode
+from nodes.checkpointer import SqliteCheckpointer
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _nodes(seed=42):
+    mem = MemoryNode()
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, memory=mem)
+    return a, b, mem
+
+
+def _run(app, state, config=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return app.invoke(state, config)
+
+
+def _initial():
+    return {"messages": [], "round_count": 0, "summary": "", "topic": TOPIC}
+
+
+def test_resumed_debate_matches_uninterrupted(tmp_path):
+    a, b, mem = _nodes()
+    expected = _run(build_graph(a, b, mem, JudgeNode(), None, TOPIC, None), _initial())
+
+    config = {"configurable": {"thread_id": "t1"}}
+    saver = SqliteCheckpointer(str(tmp_path / "ck.db"))
+    a, b, mem = _nodes()
+    take_turn = b.take_turn
+
+    def crash(topic, memory, messages, round_number):
+        if round_number == 6:
+            raise KeyboardInterrupt
+        return take_turn(topic, memory, messages, round_number)
+
+    b.take_turn = crash
+    with pytest.raises(KeyboardInterrupt):
+        _run(build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=saver), _initial(), config)
+    saver.close()
+
+    # a fresh process: new nodes, new saver, state and RNGs restored from disk
+    saver = SqliteCheckpointer(str(tmp_path / "ck.db"))
+    a, b, mem = _nodes(seed=0)
+    app = build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=saver)
+    values = app.get_state(config).values
+    assert values["round_count"] == 5
+    for agent in (a, b):
+        st = values["agent_rng"][agent.name]
+        agent.rng.setstate((st[0], tuple(st[1]), st[2]))
+    final = _run(app, None, config)
+    saver.close()
+
+    assert final["verdict"] == expected["verdict"]
+    assert final["messages"].to_list() == expected["messages"].to_list()
+
+
+def test_transcript_rows_written_once(tmp_path):
+    path = str(tmp_path / "ck.db")
+    a, b, mem = _nodes()
+    with SqliteCheckpointer(path) as saver:
+        final = _run(build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=saver), _initial(),
+                     {"configurable": {"thread_id": "t1"}})
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT idx, round, agent, text FROM turns ORDER BY idx").fetchall()
+    blobs = conn.execute("SELECT COUNT(*) FROM blobs WHERE type = 'turns'").fetchone()[0]
+    assert [(r, a, t) for _, r, a, t in rows] == [(t.round, t.agent, t.text) for t in final["messages"]]
+    assert [idx for idx, *_ in rows] == list(range(8))
+    assert blobs >= 8
+
+
+def test_forked_thread_keeps_both_histories(tmp_path):
+    config = {"configurable": {"thread_id": "t1"}}
+    with SqliteCheckpointer(str(tmp_path / "ck.db")) as saver:
+        a, b, mem = _nodes()
+        app = build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=saver)
+        original = _run(app, _initial(), config)["messages"].to_list()
+        original_config = app.get_state(config).config
+        fork_point = next(s for s in app.get_state_history(config) if s.values.get("round_count") == 3)
+
+        # continue from round 3 with differently seeded agents: same prefix, different tail
+        a, b, mem = _nodes(seed=7)
+        app = build_graph(a, b, mem, JudgeNode(), None, TOPIC, None, checkpointer=saver)
+        forked = _run(app, None, fork_point.config)["messages"].to_list()
+        assert forked[:3] == original[:3] and forked != original
+
+        assert app.get_state(config).values["messages"].to_list() == forked
+        assert app.get_state(original_config).values["messages"].to_list() == original
+        assert app.get_state(fork_point.config).values["messages"].to_list() == original[:3]
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+from nodes.coordinator import RoundCoordinator
+from nodes.debate_config import AgentSpec, DebateConfig, persona_path
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_debate_graph, build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _run(config, seed=42, coordinator=None):
+    memory = MemoryNode()
+    agents = config.build_agents(seed, memory=memory)
+    app = build_debate_graph(agents, memory, JudgeNode(), None, TOPIC, None, schedule=config.schedule,
+                             coordinator=coordinator, echo=False)
+    return app.invoke({"messages": [], "round_count": 0, "summary": ""})
+
+
+def test_schedule_is_round_robin_or_custom_order():
+    agents = [AgentSpec(n, persona_path("scientist"), i) for i, n in enumerate("ABC")]
+    assert DebateConfig(agents, rounds=7).schedule == tuple("ABCABCA")
+    assert DebateConfig(agents, rounds=5, order=["C", "A"]).schedule == tuple("CACAC")
+    with pytest.raises(ValueError):
+        DebateConfig(agents[:1])
+    with pytest.raises(ValueError):
+        DebateConfig(agents + [AgentSpec("A", persona_path("scientist"), 3)])
+    with pytest.raises(ValueError):
+        DebateConfig([AgentSpec("Judge", "x.txt", 0)] + agents)
+    with pytest.raises(ValueError):
+        DebateConfig(agents, order=["A", "Z"])
+
+
+def test_default_config_matches_two_agent_graph():
+    memory = MemoryNode()
+    a, b = DebateConfig.default().build_agents(42, memory=memory)
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = build_graph(a, b, memory, JudgeNode(), None, TOPIC, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+    assert _run(DebateConfig.default()) == legacy
+
+
+def test_persona_config_file_drives_agents_rounds_and_order(tmp_path):
+    (tmp_path / "skeptic.txt").write_text("Skeptic persona: doubts every claim.", encoding="utf-8")
+    path = tmp_path / "panel.json"
+    path.write_text(json.dumps({
+        "rounds": 30,
+        "agents": [{"name": "Sci", "persona": "scientist"}, {"name": "Phil", "persona": "philosopher"},
+                   {"name": "Skep", "persona": "skeptic.txt"}],
+        "order": ["Skep", "Sci", "Phil", "Sci"],
+    }), encoding="utf-8")
+    config = DebateConfig.load(str(path))
+    assert config.agents[2].persona_path == str(tmp_path / "skeptic.txt")
+    coordinator = RoundCoordinator()
+    final = _run(config, coordinator=coordinator)
+    # 30 rounds is past LangGraph's default recursion limit of 25 steps
+    assert [t["agent"] for t in final["messages"]] == list(config.schedule)
+    assert [t["round"] for t in final["messages"]] == list(range(1, 31))
+    assert coordinator.finished() and coordinator.total == 30
+    assert set(final["verdict"]["scores"]) == {"Sci", "Phil", "Skep"}
+
+
+def test_coordinator_enforces_schedule():
+    coordinator = RoundCoordinator(schedule=["B", "A", "A"])
+    coordinator.require_turn("B")
+    coordinator.advance_round()
+    with pytest.raises(Exception):
+        coordinator.require_turn("B")
+    coordinator.require_turn("A")
+    # an explicit expected agent still wins over the schedule
+    coordinator.require_turn("B", "B")
@@ -0,0 +1,71 @@
+import json
+import urllib.request
+
+import pytest
+
+from debate_server import Admission, DebateRequestError, DebateServer, request_debate
+from streaming import stream_debate
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+@pytest.fixture
+def server():
+    server = DebateServer(workers=1, max_queue=1).start()
+    yield server
+    server.stop()
+
+
+def test_admission_sheds_beyond_queue_and_hands_slots_over_in_order():
+    admission = Admission(workers=1, max_queue=2)
+    running = admission.admit()
+    first, second = admission.admit(), admission.admit()
+    assert running.is_set() and not first.is_set() and not second.is_set()
+    assert admission.admit() is None
+    admission.release()
+    assert first.is_set() and not second.is_set() and admission.running == 1
+    admission.release()
+    admission.release()
+    assert admission.running == 0 and admission.queued == 0
+
+
+def test_streams_the_same_events_as_stream_debate(server, tmp_path):
+    events = list(request_debate(server.url, TOPIC, seed=3))
+    assert events[0] == {"kind": "started", "id": 1}
+    assert events[1:] == [e.to_dict() for e in stream_debate(TOPIC, seed=3)]
+    assert events[-1]["kind"] == "verdict"
+    stats = json.loads(urllib.request.urlopen(server.url + "/stats").read())
+    assert stats["accepted"] == stats["completed"] == 1 and stats["running"] == 0
+
+
+@pytest.mark.parametrize("params,message", [
+    ({"topic": "hi"}, "invalid topic"),
+    ({"topic": TOPIC, "persona_a": "../run_debate"}, "persona_a must be one of"),
+    ({"topic": TOPIC, "seed": "7"}, "seed must be an integer"),
+])
+def test_rejects_invalid_requests(server, params, message):
+    with pytest.raises(DebateRequestError, match=message) as e:
+        list(request_debate(server.url, **params))
+    assert e.value.status == 400
+
+
+def test_sheds_load_with_429_when_queue_is_full(server):
+    # occupy the only worker and the only queue slot
+    held = [server.admission.admit(), server.admission.admit()]
+    assert all(t is not None for t in held)
+    with pytest.raises(DebateRequestError) as e:
+        list(request_debate(server.url, TOPIC))
+    assert e.value.status == 429
+    assert server.stats()["rejected"] == 1
+    server.admission.release()
+    server.admission.release()
+    assert list(request_debate(server.url, TOPIC))[-1]["kind"] == "verdict"
+
+
+def test_queued_request_waits_for_a_worker(server):
+    server.admission.admit()
+    events = request_debate(server.url, TOPIC)
+    assert next(events)["kind"] == "queued"
+    server.admission.release()
+    kinds = [e["kind"] for e in events]
+    assert kinds[0] == "started" and kinds[-1] == "verdict"
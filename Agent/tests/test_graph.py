@@ -0,0 +1,43 @@
+import contextlib
+import io
+
+from generate_dag import to_dot, to_mermaid
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph, compile_graph
+
+
+def _run(seed, topic="Should AI be regulated like medicine?"):
+    mem = MemoryNode()
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, memory=mem)
+    app = build_graph(a, b, mem, JudgeNode(), None, topic, None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return app.invoke({"messages": [], "round_count": 0, "summary": ""})
+
+
+def test_compiled_graph_is_cached_per_topology():
+    assert compile_graph(("AgentA", "AgentB")) is compile_graph(("AgentA", "AgentB"))
+    assert compile_graph(("AgentA", "AgentB")) is not compile_graph(("Left", "Right"))
+
+
+def test_build_graph_does_not_render(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    final = _run(5, topic="Remote Work vs Office")
+    assert len(final["messages"]) == 8
+    assert not (tmp_path / "dag.png").exists()
+
+
+def test_cached_graph_binds_per_debate_objects():
+    first = _run(3)
+    _run(11)
+    again = _run(3)
+    assert first["verdict"] == again["verdict"]
+    assert first["messages"] == again["messages"]
+
+
+def test_text_exporters_are_offline():
+    app = compile_graph()
+    assert '"Memory" -> "Judge" [style=dashed];' in to_dot(app)
+    assert "Memory -.-> Judge;" in to_mermaid(app)
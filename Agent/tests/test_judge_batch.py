@@ -0,0 +1,33 @@
+import random
+
+from nodes.judge_batch import judge_batch, score_batch
+from nodes.judge_node import JudgeNode
+
+VOCAB = ["Should", "AI", "regulated", "regulate", "medicine", "Medicine", "risk", "x", "", "trust"]
+
+
+def random_transcripts(n, rng):
+    agents = ["AgentA", "AgentB", "AgentC"]
+    return [[{"round": r, "agent": rng.choice(agents), "text": " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, 9)))}
+             for r in range(1, rng.randint(0, 10))] for _ in range(n)]
+
+
+def test_batch_matches_judge_node():
+    transcripts = random_transcripts(500, random.Random(3))
+    summaries = [f"summary {i}" for i in range(len(transcripts))]
+    expected = [JudgeNode().judge(turns, s) for turns, s in zip(transcripts, summaries)]
+    assert judge_batch(transcripts, summaries) == expected
+
+
+def test_ties_go_to_first_speaker():
+    turns = [{"round": 1, "agent": "AgentB", "text": "one two three four five six"},
+             {"round": 2, "agent": "AgentA", "text": "one two three four five six"}]
+    batch = score_batch([turns, list(reversed(turns))])
+    assert batch.winners() == ["AgentB", "AgentA"]
+    assert judge_batch([turns]) == [JudgeNode().judge(turns, "")]
+
+
+def test_empty_inputs():
+    assert judge_batch([]) == []
+    assert judge_batch([[]]) == [JudgeNode().judge([], "")]
+    assert score_batch([[], []]).winners() == ["AgentA", "AgentA"]
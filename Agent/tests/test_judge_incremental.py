@@ -0,0 +1,62 @@
+import collections
+import contextlib
+import io
+import random
+
+from nodes.debate_config import AgentSpec, DebateConfig, persona_path
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_debate_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def reference_verdict(turns, summary):
+    # the full-pass scoring JudgeNode used before scores were kept incrementally
+    scores = collections.Counter()
+    words = [w for w in turns[0]["text"].split() if len(w) > 3] if turns else []
+    topic = " ".join(words[:3])
+    for t in turns:
+        score = len(t["text"].split())
+        if t["text"].count(" ") < 5:
+            score -= 1
+        if topic and any(word.lower() in t["text"].lower() for word in topic.split()):
+            score += 2
+        scores[t["agent"]] += score
+    winner = scores.most_common(1)[0][0] if scores else "AgentA"
+    return {"summary": summary, "winner": winner, "justification": f"{winner} had higher aggregate score ({scores}).",
+            "scores": dict(scores)}
+
+
+def test_graph_verdicts_match_full_pass_scoring():
+    judge = JudgeNode()
+    for n_agents, rounds in ((2, 8), (3, 9), (5, 23)):
+        config = DebateConfig([AgentSpec(f"Agent{i}", persona_path(("scientist", "philosopher", "economist")[i % 3]), i)
+                               for i in range(n_agents)], rounds)
+        for seed in range(6):
+            memory = MemoryNode()
+            app = build_debate_graph(config.build_agents(seed, memory=memory), memory, judge, None, TOPIC, None,
+                                     schedule=config.schedule, echo=False)
+            # the same judge is reused across debates, like a tournament worker
+            seen, turns = [], []
+            for chunk in app.stream({"messages": [], "round_count": 0, "summary": ""}, stream_mode="updates"):
+                for name, update in chunk.items():
+                    turns.extend(update.get("messages", ()))
+                    if name == "Memory":
+                        seen.append(judge.current_scores() == reference_verdict(turns, "")["scores"])
+                    if name == "Judge":
+                        assert update["verdict"] == reference_verdict(turns, update["verdict"]["summary"])
+            assert all(seen) and len(seen) == rounds
+
+
+def test_update_handles_ties_short_turns_and_new_transcripts():
+    rng = random.Random(0)
+    vocab = ["regulate", "medicine", "risk", "AI", "safety", "ethics", "x", "Should", "markets"]
+    judge = JudgeNode()
+    for _ in range(200):
+        turns = [{"round": r, "agent": rng.choice("ABC"), "text": " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 8)))}
+                 for r in range(1, rng.randint(1, 12))]
+        cut = rng.randint(0, len(turns))
+        judge.update(turns[:cut])
+        assert judge.judge(turns, "s") == reference_verdict(turns, "s")
+    assert JudgeNode().judge([], "") == reference_verdict([], "")
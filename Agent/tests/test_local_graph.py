@@ -0,0 +1,67 @@
+import asyncio
+import contextlib
+import io
+import subprocess
+import sys
+
+import pytest
+
+from generate_dag import to_dot
+from nodes.debate_config import DebateConfig
+from nodes.judge_node import JudgeNode
+from nodes.local_graph import LocalGraph
+from nodes.memory_node import MemoryNode
+from run_debate import build_debate_graph, compile_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _app(engine, config):
+    memory = MemoryNode()
+    return build_debate_graph(config.build_agents(7, memory=memory), memory, JudgeNode(), None, TOPIC, None,
+                              schedule=config.schedule, echo=False, engine=engine)
+
+
+def _state():
+    return {"messages": [], "round_count": 0, "summary": "", "current_speaker": None, "topic": TOPIC}
+
+
+@pytest.mark.parametrize("config", [DebateConfig.default(), DebateConfig.load("persona_templates/panel.json")])
+def test_local_engine_matches_langgraph(config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = _app("langgraph", config).invoke(_state())
+        assert _app("local", config).invoke(_state()) == expected
+        assert asyncio.run(_app("local", config).ainvoke(_state())) == expected
+
+
+def test_local_stream_matches_langgraph():
+    config = DebateConfig.default(4)
+    for mode in ("updates", "values"):
+        expected = list(_app("langgraph", config).stream(_state(), stream_mode=mode))
+        assert list(_app("local", config).stream(_state(), stream_mode=mode)) == expected
+
+
+def test_local_engine_limits():
+    app = _app("local", DebateConfig.default(20)).with_config(recursion_limit=10)
+    with pytest.raises(RecursionError):
+        app.invoke(_state())
+    with pytest.raises(ValueError):
+        compile_graph(("AgentA", "AgentB"), checkpointer=object(), engine="local")
+    assert isinstance(compile_graph(("AgentA", "AgentB"), engine="local"), LocalGraph)
+
+
+def test_local_run_never_imports_langgraph(tmp_path):
+    code = ("import sys, run_debate; sys.argv = ['run_debate.py', '--topic', 'Is tea better than coffee?', "
+            f"'--log-path', {str(tmp_path / 'log.jsonl')!r}, '--engine', 'local', "
+            f"'--render-dag', {str(tmp_path / 'dag.mmd')!r}]; run_debate.main(); "
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in ('langgraph', 'langchain_core')))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == "[]"
+    assert "Memory -.-> Judge;" in (tmp_path / "dag.mmd").read_text(encoding="utf-8")
+
+
+def test_local_graph_exports_the_same_edges():
+    def edges(engine):
+        return sorted(line for line in to_dot(compile_graph(("AgentA", "AgentB"), engine=engine)).splitlines())
+
+    assert edges("local") == edges("langgraph")
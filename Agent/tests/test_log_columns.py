@@ -0,0 +1,123 @@
+import contextlib
+import io
+import json
+
+import numpy as np
+import pytest
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.log_columns import NO_SEED, export_columns, load_columns
+from nodes.log_reader import LogIndex, read_log
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+
+
+def _debate(path, topic, seed, compact=False):
+    logger = LoggerNode(str(path))
+    mem = MemoryNode(logger=logger, compact_log=compact)
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, logger=logger, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, logger=logger, memory=mem)
+    logger.log_event({"event":"topic_validated","topic":topic})
+    logger.log_event({"event":"start_debate","topic":topic,"seed":seed})
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_graph(a, b, mem, JudgeNode(logger=logger), logger, topic, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+    logger.close()
+
+
+@pytest.fixture
+def logs(tmp_path):
+    first, second = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    for seed in (1, 2, 3):
+        _debate(first, "Should AI be regulated like medicine?", seed)
+    _debate(second, "Is nuclear power green?", 7, compact=True)
+    return [str(first), str(second)]
+
+
+def test_export_matches_the_log(logs, tmp_path):
+    counts = export_columns(logs, str(tmp_path / "out"), format="npz", chunk_rows=10)
+    cols = load_columns(str(tmp_path / "out"))
+    events = [e for path in logs for e in read_log(path, expand=False)]
+    assert counts == {"events": len(events), "debates": 4, "scores": 8}
+    assert isinstance(cols.events["debate"], np.memmap)
+
+    assert cols.events.decode("event") == [e["event"] for e in events]
+    assert cols.events.decode("agent") == [e.get("agent") for e in events]
+    turns = [i for i, e in enumerate(events) if e["event"] == "agent_turn"]
+    assert cols.events.texts("text", turns) == [events[i]["text"] for i in turns]
+    assert cols.events.text("text", 0) == ""
+    # debates and rounds are numbered as LogIndex numbers them, continuing across logs
+    with LogIndex(logs[0]) as index:
+        rows = index._db.execute("SELECT debate, round FROM events ORDER BY offset").fetchall()
+    assert list(zip(cols.events["debate"][:len(rows)].tolist(), cols.events["round"][:len(rows)].tolist())) == rows
+    assert set(cols.events["debate"][len(rows):].tolist()) == {3}
+
+    verdicts = [e["verdict"] for e in events if e["event"] == "final_verdict"]
+    assert cols.debates["debate"].tolist() == [0, 1, 2, 3]
+    assert cols.debates["seed"].tolist() == [1, 2, 3, 7]
+    assert cols.debates["rounds"].tolist() == [8, 8, 8, 8]
+    assert cols.debates.decode("winner") == [v["winner"] for v in verdicts]
+    assert cols.debates.decode("topic") == ["Should AI be regulated like medicine?"] * 3 + ["Is nuclear power green?"]
+    assert [(d, a, s) for d, a, s in zip(cols.scores["debate"].tolist(), cols.scores.decode("agent"),
+                                         cols.scores["score"].tolist())] == [
+        (d, a, s) for d, v in enumerate(verdicts) for a, s in v["scores"].items()]
+
+
+def test_chunk_size_does_not_change_the_output(logs, tmp_path):
+    export_columns(logs, str(tmp_path / "small"), format="npz", chunk_rows=3)
+    export_columns(logs, str(tmp_path / "large"), format="npz")
+    small, large = load_columns(str(tmp_path / "small")), load_columns(str(tmp_path / "large"))
+    for name in ("events", "debates", "scores"):
+        a, b = getattr(small, name), getattr(large, name)
+        assert a.dictionaries == b.dictionaries
+        for column in a.columns:
+            assert np.array_equal(a[column], b[column])
+    assert small.events.texts("text") == large.events.texts("text")
+
+
+def test_win_rates_by_persona_and_seed(logs, tmp_path):
+    export_columns(logs, str(tmp_path / "out"), format="npz")
+    cols = load_columns(str(tmp_path / "out"))
+    winners = cols.debates.decode("winner")
+    rates = {(r["group"], r["seed"]): (r["wins"], r["debates"]) for r in cols.win_rates()}
+    for d, seed in enumerate([1, 2, 3, 7]):
+        for agent in ("AgentA", "AgentB"):
+            assert rates[agent, seed] == (int(winners[d] == agent), 1)
+    by_persona = cols.win_rates(personas={"AgentA": "scientist", "AgentB": "philosopher"}, by_seed=False)
+    assert {r["group"]: r["wins"] for r in by_persona} == {"scientist": winners.count("AgentA"),
+                                                           "philosopher": winners.count("AgentB")}
+    assert all(r["debates"] == 4 for r in by_persona)
+
+
+def test_handles_escaped_agents_missing_seeds_and_unfinished_debates(tmp_path):
+    log = tmp_path / "odd.jsonl"
+    events = [
+        {"ts": "2025-01-01T00:00:00+00:00", "event": "start_debate", "topic": "Odd names in debate"},
+        {"ts": "2025-01-01T00:00:01+00:00", "event": "memory_requested", "agent": "Agent \"Q\" é",
+         "memory_snapshot": {"turns": [], "summary": ""}},
+        {"ts": "2025-01-01T00:00:02+00:00", "event": "agent_turn", "agent": "Agent \"Q\" é", "text": "hi",
+         "round": 1},
+        {"ts": "2025-01-01T00:00:03", "event": "start_debate", "topic": "Never finished", "seed": 5},
+    ]
+    log.write_text("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events) + "not json\n",
+                   encoding="utf-8")
+    export_columns([str(log)], str(tmp_path / "out"), format="npz")
+    cols = load_columns(str(tmp_path / "out"))
+    assert cols.events.decode("agent") == [None, "Agent \"Q\" é", "Agent \"Q\" é", None]
+    assert cols.events["ts_us"][-1] - cols.events["ts_us"][0] == 3_000_000
+    assert cols.debates["seed"].tolist() == [NO_SEED, 5]
+    assert cols.debates.decode("winner") == [None, None]
+    assert len(cols.scores) == 0 and cols.win_rates() == []
+
+
+def test_parquet_round_trip(logs, tmp_path):
+    pytest.importorskip("pyarrow")
+    export_columns(logs, str(tmp_path / "pq"), format="parquet", chunk_rows=10)
+    export_columns(logs, str(tmp_path / "npz"), format="npz")
+    pq, npz = load_columns(str(tmp_path / "pq")), load_columns(str(tmp_path / "npz"))
+    assert pq.events.decode("event") == npz.events.decode("event")
+    assert pq.events.texts("text") == npz.events.texts("text")
+    assert pq.debates.decode("winner") == npz.debates.decode("winner")
+    assert pq.win_rates() == npz.win_rates()
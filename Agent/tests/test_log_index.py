@@ -0,0 +1,91 @@
+import contextlib
+import io
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.log_reader import LogIndex, read_log
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+
+
+def _debate(path, topic, seed, compact=False):
+    logger = LoggerNode(str(path))
+    mem = MemoryNode(logger=logger, compact_log=compact)
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, logger=logger, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, logger=logger, memory=mem)
+    logger.log_event({"event":"topic_validated","topic":topic})
+    logger.log_event({"event":"start_debate","topic":topic,"seed":seed})
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_graph(a, b, mem, JudgeNode(logger=logger), logger, topic, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+
+
+def test_queries_match_a_full_scan(tmp_path):
+    log = tmp_path / "debates.jsonl"
+    _debate(log, "Should AI be regulated like medicine?", 1)
+    _debate(log, "Is nuclear power green?", 2, compact=True)
+    _debate(log, "Should AI be regulated like medicine?", 3)
+    events = list(read_log(str(log), expand=False))
+
+    with LogIndex(str(log)) as index:
+        assert [(d["topic"], d["seed"], d["rounds"]) for d in index.debates()] == [
+            ("Should AI be regulated like medicine?", 1, 8), ("Is nuclear power green?", 2, 8),
+            ("Should AI be regulated like medicine?", 3, 8)]
+        topics, debate = [], -1
+        for e in events:
+            if e["event"] == "topic_validated":
+                debate += 1
+            topics.append((debate, e))
+        scan = [e for d, e in topics if d in (0, 2) and e["event"] in ("agent_turn", "turn_error")]
+        assert list(index.events(event=("agent_turn", "turn_error"), topic="Should AI be regulated like medicine?")) == scan
+        assert [e["round"] for e in index.events(event="agent_turn", agent="AgentB", debate=1)] == [2, 4, 6, 8]
+        assert index.count(event="agent_turn", round=(3, 5), debate=1) == 3
+        assert index.count() == len(events)
+        # compact references in debate 1 resolve to full snapshots
+        expanded = list(index.events(event="memory_requested", debate=1, expand=True))
+        assert expanded[-1]["memory_snapshot"]["turns"][-1]["round"] == 7
+
+
+def test_replay_reproduces_logged_verdict(tmp_path):
+    log = tmp_path / "debates.jsonl"
+    _debate(log, "Should AI be regulated like medicine?", 1)
+    _debate(log, "Is nuclear power green?", 2, compact=True)
+    with LogIndex(str(log)) as index:
+        for debate in (0, 1):
+            result = index.replay(debate)
+            assert len(result["turns"]) == 8
+            assert result["verdict"] == result["logged_verdict"]
+        partial = index.replay(0, until_round=5)
+        assert [t["round"] for t in partial["turns"]] == [1, 2, 3, 4, 5]
+        assert partial["logged_verdict"] is None
+
+
+def test_refresh_is_incremental_and_skips_partial_lines(tmp_path):
+    log = tmp_path / "debates.jsonl"
+    _debate(log, "Should AI be regulated like medicine?", 1)
+    with LogIndex(str(log)) as index:
+        first = index.count()
+        assert index.refresh() == 0
+    _debate(log, "Is nuclear power green?", 2)
+    with open(log, "a", encoding="utf-8") as f:
+        f.write('{"ts": "2026-01-01T00:00:00+00:00", "event": "turn_error_pending')
+    with LogIndex(str(log), refresh=False) as index:
+        assert index.refresh() == first
+        assert len(index.debates()) == 2
+        with open(log, "a", encoding="utf-8") as f:
+            f.write('", "agent": "AgentA", "error": "timeout"}\n')
+        assert index.refresh() == 1
+        assert [e["error"] for e in index.events(event="turn_error_pending")] == ["timeout"]
+
+
+def test_replaced_log_is_reindexed(tmp_path):
+    log = tmp_path / "debates.jsonl"
+    _debate(log, "Should AI be regulated like medicine?", 1)
+    _debate(log, "Is nuclear power green?", 2)
+    with LogIndex(str(log)) as index:
+        assert len(index.debates()) == 2
+    log.unlink()
+    _debate(log, "Is nuclear power green?", 5)
+    with LogIndex(str(log)) as index:
+        assert [(d["topic"], d["seed"]) for d in index.debates()] == [("Is nuclear power green?", 5)]
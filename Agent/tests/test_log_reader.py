@@ -0,0 +1,58 @@
+import contextlib
+import io
+import json
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.log_reader import read_log
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _debate(path, compact, failing_round=None):
+    logger = LoggerNode(str(path))
+    mem = MemoryNode(logger=logger, compact_log=compact)
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=42, logger=logger, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=43, logger=logger, memory=mem)
+    if failing_round:
+        take_turn = b.take_turn
+
+        def flaky(topic, memory, messages, round_number):
+            if round_number == failing_round:
+                raise Exception("backend unavailable")
+            return take_turn(topic, memory, messages, round_number)
+
+        b.take_turn = flaky
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_graph(a, b, mem, JudgeNode(logger=logger), logger, TOPIC, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+    return [{k: v for k, v in e.items() if k != "ts"} for e in read_log(str(path))]
+
+
+def test_compact_log_expands_to_full_log(tmp_path):
+    full = _debate(tmp_path / "full.jsonl", compact=False)
+    compact = _debate(tmp_path / "compact.jsonl", compact=True)
+    assert compact == full
+    raw = [json.loads(line) for line in (tmp_path / "compact.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert not any("memory_snapshot" in e for e in raw)
+    # every turn was already written by its agent_turn event
+    assert not any("defs" in e for e in raw)
+    assert (tmp_path / "compact.jsonl").stat().st_size * 2.5 < (tmp_path / "full.jsonl").stat().st_size
+
+
+def test_turns_without_agent_turn_event_are_defined_once(tmp_path):
+    full = _debate(tmp_path / "full.jsonl", compact=False, failing_round=4)
+    compact = _debate(tmp_path / "compact.jsonl", compact=True, failing_round=4)
+    assert compact == full
+    raw = [json.loads(line) for line in (tmp_path / "compact.jsonl").read_text(encoding="utf-8").splitlines()]
+    defs = [e["defs"] for e in raw if "defs" in e]
+    assert defs == [{"4": {"agent": "AgentB", "text": "[ERROR] backend unavailable"}}]
+
+
+def test_read_log_without_expand_returns_raw_events(tmp_path):
+    _debate(tmp_path / "compact.jsonl", compact=True)
+    raw = list(read_log(str(tmp_path / "compact.jsonl"), expand=False))
+    assert any("memory_ref" in e for e in raw)
@@ -0,0 +1,114 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from nodes.log_columns import export_columns, load_columns
+from nodes.log_reader import LogIndex, read_log
+from nodes.log_segments import MANIFEST, SegmentWriter, segment_paths
+from nodes.logger_node import LoggerNode
+
+
+def _events(n, agent="AgentA"):
+    return [{"event":"agent_turn","agent":agent,"text":f"turn {i} " + "x" * 40,"round":i} for i in range(n)]
+
+
+def _manifest(directory):
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_rotates_by_event_count_and_reads_back_in_order(tmp_path, buffered):
+    logger = LoggerNode(str(tmp_path / "log"), buffered=buffered, batch_size=4, segment_events=10,
+                        compression="none")
+    for event in _events(35):
+        logger.log_event(event)
+    logger.close()
+    paths = segment_paths(str(tmp_path / "log"))
+    assert all(p.endswith(".jsonl") for p in paths)
+    # rotation happens between writes, so a buffered logger seals whole batches
+    sealed = [r["events"] for r in _manifest(str(tmp_path / "log")) if r["state"] == "sealed"]
+    assert sealed == ([12, 12, 11] if buffered else [10, 10, 10, 5])
+    assert len(paths) == len(sealed)
+    assert [e["round"] for e in read_log(str(tmp_path / "log"))] == list(range(35))
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_sealed_segments_are_compressed(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    logger = LoggerNode(str(tmp_path / "log"), segment_bytes=2000, compression=compression)
+    for event in _events(100):
+        logger.log_event(event)
+    logger.close()
+    suffix = ".gz" if compression == "gzip" else ".zst"
+    assert sorted(os.listdir(tmp_path / "log")) == sorted(
+        [MANIFEST] + [os.path.basename(p) for p in segment_paths(str(tmp_path / "log"))])
+    assert all(p.endswith(suffix) for p in segment_paths(str(tmp_path / "log")))
+    assert len(segment_paths(str(tmp_path / "log"))) > 3
+    assert [e["round"] for e in read_log(str(tmp_path / "log"))] == list(range(100))
+
+
+def test_segment_lines_match_a_plain_log(tmp_path):
+    plain = LoggerNode(str(tmp_path / "plain.jsonl"))
+    segmented = LoggerNode(str(tmp_path / "log"), segment_events=7, compression="gzip")
+    for logger in (plain, segmented):
+        logger._timestamp = lambda: "2025-01-01T00:00:00+00:00"
+        for event in _events(20):
+            logger.log_event(event)
+        logger.close()
+    joined = b"".join(gzip.open(p).read() for p in segment_paths(str(tmp_path / "log")))
+    assert joined == (tmp_path / "plain.jsonl").read_bytes()
+
+
+def test_writers_sharing_a_directory_keep_their_own_files(tmp_path):
+    directory = str(tmp_path / "log")
+    first = LoggerNode(directory, segment_events=5, compression="none")
+    second = LoggerNode(directory, segment_events=5, compression="none")
+    # interleaved writes, as from two processes
+    for a, b in zip(_events(12, "AgentA"), _events(12, "AgentB")):
+        first.log_event(a)
+        second.log_event(b)
+    first.close()
+    second.close()
+    events = list(read_log(directory))
+    # each writer's events stay contiguous and in order, the first writer to start first
+    assert [e["agent"] for e in events] == ["AgentA"] * 12 + ["AgentB"] * 12
+    assert [e["round"] for e in events] == list(range(12)) * 2
+
+
+def test_reader_skips_a_partial_last_line(tmp_path):
+    writer = SegmentWriter(str(tmp_path / "log"), max_events=100, compression="none")
+    writer.write(json.dumps({"event": "a"}) + "\n", 1)
+    writer.write('{"event": "b", "te', 1)
+    writer.flush()
+    assert [e["event"] for e in read_log(str(tmp_path / "log"))] == ["a"]
+    writer.write('xt": "done"}\n', 0)
+    writer.close()
+    assert [e["event"] for e in read_log(str(tmp_path / "log"))] == ["a", "b"]
+
+
+def test_export_and_index_of_a_segmented_log(tmp_path):
+    directory = str(tmp_path / "log")
+    logger = LoggerNode(directory, segment_events=3, compression="gzip")
+    logger.log_event({"event":"start_debate","topic":"Is nuclear power green?","seed":4})
+    for event in _events(8):
+        logger.log_event(event)
+    logger.log_event({"event":"final_verdict","verdict":{"winner":"AgentA","scores":{"AgentA":3,"AgentB":1}}})
+    logger.close()
+    export_columns([directory], str(tmp_path / "out"), format="npz")
+    cols = load_columns(str(tmp_path / "out"))
+    assert len(cols.events) == 10
+    assert cols.debates["seed"].tolist() == [4]
+    assert cols.debates.decode("winner") == ["AgentA"]
+    with pytest.raises(ValueError):
+        LogIndex(directory)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        SegmentWriter("unused", max_bytes=None, max_events=None)
+    with pytest.raises(ValueError):
+        SegmentWriter("unused", max_events=1, compression="lz4")
@@ -0,0 +1,58 @@
+import pytest
+
+from nodes.logger_node import LoggerNode
+
+
+EVENTS = [
+    {"event": "agent_turn", "agent": "AgentA", "text": "Ünïcode stays raw", "round": 1},
+    {"event": "summary_updated", "summary": "a | b"},
+    {"event": "duplicate_detected", "text": "x", "matched": "x", "ratio": 1.0},
+]
+
+
+def _write(logger):
+    logger._timestamp = lambda: "2025-01-01T00:00:00+00:00"
+    for e in EVENTS:
+        logger.log_event(e)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"buffered": True},
+    {"buffered": True, "batch_size": 2, "fsync": "batch"},
+    {"buffered": True, "fsync": "event"},
+    {"background": True},
+])
+def test_buffered_modes_are_byte_compatible(tmp_path, kwargs):
+    plain = LoggerNode(str(tmp_path / "plain.jsonl"))
+    _write(plain)
+    with LoggerNode(str(tmp_path / "buffered.jsonl"), **kwargs) as buffered:
+        _write(buffered)
+    assert (tmp_path / "buffered.jsonl").read_bytes() == (tmp_path / "plain.jsonl").read_bytes()
+
+
+def test_buffered_flushes_on_batch_size_and_explicit_flush(tmp_path):
+    path = tmp_path / "log.jsonl"
+    logger = LoggerNode(str(path), buffered=True, batch_size=2, flush_interval=None)
+    logger.log_event({"event": "one"})
+    assert not path.exists() or path.read_text() == ""
+    logger.log_event({"event": "two"})
+    assert len(path.read_text().splitlines()) == 2
+    logger.log_event({"event": "three"})
+    logger.flush()
+    assert len(path.read_text().splitlines()) == 3
+    logger.close()
+
+
+def test_background_flush_waits_for_writer(tmp_path):
+    path = tmp_path / "log.jsonl"
+    logger = LoggerNode(str(path), background=True, batch_size=1000, flush_interval=60)
+    for i in range(50):
+        logger.log_event({"event": "tick", "i": i})
+    logger.flush()
+    assert len(path.read_text().splitlines()) == 50
+    logger.close()
+
+
+def test_invalid_fsync_policy_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LoggerNode(str(tmp_path / "log.jsonl"), fsync="always")
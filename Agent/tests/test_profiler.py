@@ -0,0 +1,80 @@
+import contextlib
+import io
+import json
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from nodes.profiler import Profiler, percentile
+from run_debate import build_graph
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _debate(tmp_path, profile):
+    log = tmp_path / "debate.jsonl"
+    logger = LoggerNode(str(log))
+    mem = MemoryNode(logger=logger)
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=42, logger=logger, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=43, logger=logger, memory=mem)
+    judge = JudgeNode(logger=logger)
+    profiler = Profiler(logger, trace_memory=True).attach((a, b), mem, judge, logger) if profile else None
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_graph(a, b, mem, judge, logger, TOPIC, None, profiler=profiler).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+    if profiler:
+        profiler.close()
+    return profiler, [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_nested_sections_are_inclusive():
+    events = []
+
+    class Sink:
+        log_event = staticmethod(events.append)
+
+    profiler = Profiler(Sink(), trace_memory=True)
+    with profiler.section("outer"):
+        with profiler.section("inner"):
+            blob = [0] * 100000
+        del blob
+    profiler.close()
+    inner, outer = events
+    assert (inner["node"], outer["node"]) == ("inner", "outer")
+    assert outer["wall_ms"] >= inner["wall_ms"]
+    # the outer peak includes the allocation made inside the inner section
+    assert outer["peak_kb"] >= inner["peak_kb"] > 700
+
+
+def test_profiled_debate_reports_nodes_and_keeps_log(tmp_path):
+    (tmp_path / "plain").mkdir()
+    (tmp_path / "prof").mkdir()
+    _, plain = _debate(tmp_path / "plain", profile=False)
+    profiler, profiled = _debate(tmp_path / "prof", profile=True)
+
+    timing = [e for e in profiled if e["event"] == "timing"]
+    strip = lambda evs: [{k: v for k, v in e.items() if k != "ts"} for e in evs]
+    assert strip([e for e in profiled if e["event"] != "timing"]) == strip(plain)
+    assert not any(e["event"] == "timing" for e in plain)
+
+    rows = {r["node"]: r for r in profiler.report()}
+    assert rows["node:AgentA"]["calls"] == rows["node:AgentB"]["calls"] == 4
+    assert rows["node:Memory"]["calls"] == 8 and rows["node:Judge"]["calls"] == 1
+    assert rows["AgentNode.take_turn"]["calls"] == 8
+    assert rows["LoggerNode.log_event"]["calls"] == len(plain)
+    # retries in the report equal the per-turn counts on the timing events
+    turns = [e for e in timing if e["node"] == "AgentNode.take_turn"]
+    assert rows["AgentNode.take_turn"]["retries"] == sum(e["retries"] for e in turns)
+    for r in rows.values():
+        assert r["p50_ms"] <= r["p95_ms"] <= r["p99_ms"]
+    assert "p99 ms" in profiler.format_report()
@@ -0,0 +1,51 @@
+import asyncio
+import contextlib
+import io
+import json
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+from scheduler import DebateScheduler
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _sync_verdict(seed):
+    mem = MemoryNode()
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, memory=mem)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_graph(a, b, mem, JudgeNode(), None, TOPIC, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})["verdict"]
+
+
+def test_concurrent_debates_match_sequential_runs():
+    scheduler = DebateScheduler(max_concurrency=4)
+    results = asyncio.run(scheduler.run_all([(TOPIC, seed) for seed in range(12)]))
+    assert 1 < scheduler.peak_active <= 4
+    for seed in range(12):
+        assert results[seed] == _sync_verdict(seed)
+
+
+def test_cancel_single_debate(tmp_path):
+    async def go():
+        scheduler = DebateScheduler(max_concurrency=2, log_dir=str(tmp_path))
+        for seed in range(3):
+            scheduler.submit(TOPIC, seed, debate_id=f"d{seed}")
+        await asyncio.sleep(0)
+        assert scheduler.cancel("d1")
+        return await scheduler.gather()
+
+    results = asyncio.run(go())
+    assert results["d1"] == {"cancelled": True}
+    assert "winner" in results["d0"] and "winner" in results["d2"]
+
+
+def test_total_rounds_sets_debate_length(tmp_path):
+    results = asyncio.run(DebateScheduler(log_dir=str(tmp_path), total_rounds=4).run_all([(TOPIC, 0)]))
+    assert "winner" in results[0]
+    with open(tmp_path / "debate_0.jsonl", encoding="utf-8") as f:
+        events = [json.loads(line)["event"] for line in f]
+    assert events.count("agent_turn") == 4
@@ -0,0 +1,64 @@
+import random
+
+from nodes.agent_node import is_duplicate
+from nodes.memory_node import MemoryNode
+from nodes.similarity_index import SimilarityIndex
+
+
+WORDS = "risk safety oversight innovation ethics data policy harm benefit standard regulation evidence".split()
+
+
+def _turns(n, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))) for _ in range(n)]
+
+
+def test_index_matches_full_scan_below_exact_cutoff():
+    turns = _turns(60)
+    index = SimilarityIndex()
+    for t in turns:
+        index.add(t)
+    for probe in _turns(40, seed=1) + [turns[3].upper(), turns[10] + " risk"]:
+        assert (index.find(probe) is not None) == is_duplicate(probe, turns)
+
+
+def test_index_finds_near_duplicates_through_lsh():
+    # exact_below=0 forces the banded candidate path even for a small index
+    index = SimilarityIndex(exact_below=0)
+    index.add("AI must be regulated due to high risk of harm")
+    index.add("Open research norms support faster scientific progress overall")
+    match = index.find("AI must be regulated due to high risk of harms")
+    assert match is not None and match[0] == 0
+    assert index.find("Completely unrelated sentence about gardening tools") is None
+
+
+def test_memory_index_syncs_with_transcript():
+    mem = MemoryNode()
+    turns = [{"round": 1, "agent": "AgentA", "text": "AI must be regulated due to high risk of harm"}]
+    assert mem.has_similar("AI must be regulated due to high risks", turns)
+    turns.append({"round": 2, "agent": "AgentB", "text": "Freedom of inquiry is a core human value"})
+    assert mem.has_similar("freedom of inquiry is a core human value!", turns)
+    assert len(mem.index) == 2
+
+
+def test_memory_index_rebuilds_for_a_different_transcript():
+    mem = MemoryNode()
+    mem.sync_index([{"text": "alpha beta gamma delta epsilon zeta eta"}])
+    other = [{"text": "completely different words about remote work policy"}]
+    assert not mem.has_similar("alpha beta gamma delta epsilon zeta eta", other)
+    assert mem.has_similar("completely different words about remote work policy", other)
+    assert len(mem.index) == 1
+
+
+def test_buckets_are_built_once_the_exact_cutoff_is_reached():
+    turns = _turns(30)
+    index = SimilarityIndex(exact_below=20)
+    for t in turns[:19]:
+        index.add(t)
+    assert index._buckets is None
+    for t in turns[19:]:
+        index.add(t)
+    assert index._buckets and all(isinstance(k, int) for k in index._buckets)
+    # texts added before the buckets existed are still found through them
+    assert 2 in index.candidates(turns[2] + " risk")
+    assert index.find(turns[2] + " risk") is not None
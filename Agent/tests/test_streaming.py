@@ -0,0 +1,64 @@
+import asyncio
+import contextlib
+import io
+import json
+
+import pytest
+
+from nodes.agent_node import AgentNode
+from nodes.judge_node import JudgeNode
+from nodes.memory_node import MemoryNode
+from run_debate import build_graph
+from streaming import TurnEvent, VerdictEvent, astream_debate, print_event, stream_debate
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def _invoke(seed):
+    mem = MemoryNode()
+    a = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, memory=mem)
+    b = AgentNode("AgentB", persona_path="persona_templates/philosopher.txt", seed=seed + 1, memory=mem)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_graph(a, b, mem, JudgeNode(), None, TOPIC, None).invoke(
+            {"messages": [], "round_count": 0, "summary": ""})
+
+
+def test_stream_yields_turns_summaries_then_verdict():
+    events = list(stream_debate(TOPIC, seed=7))
+    final = _invoke(7)
+    assert [e.kind for e in events] == ["turn", "summary"] * 8 + ["verdict"]
+    assert [(e.round, e.agent, e.text) for e in events if isinstance(e, TurnEvent)] == [
+        (t["round"], t["agent"], t["text"]) for t in final["messages"]]
+    assert isinstance(events[-1], VerdictEvent) and events[-1].verdict == final["verdict"]
+    assert events[-2].summary == final["summary"]
+
+
+def test_async_stream_matches_sync():
+    async def collect():
+        return [e.to_dict() async for e in astream_debate(TOPIC, seed=3)]
+
+    assert asyncio.run(collect()) == [e.to_dict() for e in stream_debate(TOPIC, seed=3)]
+
+
+def test_closing_the_stream_stops_the_debate(tmp_path):
+    log = tmp_path / "debate.jsonl"
+    seen = []
+    stream = stream_debate(TOPIC, log_path=str(log), sink=seen.append)
+    for event in stream:
+        if event.kind == "turn" and event.round == 2:
+            break
+    stream.close()
+    events = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert [e["round"] for e in events if e["event"] == "agent_turn"] == [1, 2]
+    assert events[-1] == {"ts": events[-1]["ts"], "event": "debate_stopped", "round": 2}
+    assert [e.kind for e in seen] == ["turn", "summary", "turn"]
+
+
+def test_print_sink_and_invalid_topic():
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        verdict = [e for e in stream_debate(TOPIC, sink=print_event)][-1]
+    assert out.getvalue().splitlines()[0].startswith("[Round 1] AgentA: ")
+    assert f"[Judge] Winner: {verdict.winner}" in out.getvalue()
+    with pytest.raises(ValueError):
+        next(stream_debate("   "))
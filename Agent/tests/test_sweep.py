@@ -0,0 +1,78 @@
+import os
+import time
+
+from nodes.work_queue import WorkQueue
+from run_tournament import run_tournament
+import sweep
+from sweep import collect, init_sweep, run_worker, run_workers
+
+TOPICS = ["Should AI be regulated like medicine?", "Remote Work vs Office"]
+
+
+def test_worker_processes_match_a_local_tournament(tmp_path):
+    queue = str(tmp_path / "sweep.db")
+    assert init_sweep(queue, TOPICS, range(4)) == 8
+    stats = run_workers(queue, workers=3, batch=2, out_dir=str(tmp_path / "out"))
+    assert sum(s["completed"] for s in stats) == 8
+    assert collect(queue, str(tmp_path / "out" / "results.jsonl")) == run_tournament(TOPICS, range(4), workers=0)
+    assert sorted(os.listdir(tmp_path / "out" / "logs")) == [f"debate_{i:06d}.jsonl" for i in range(8)]
+
+
+def test_growing_the_grid_only_queues_new_debates(tmp_path):
+    queue = str(tmp_path / "sweep.db")
+    init_sweep(queue, TOPICS[:1], range(2))
+    run_worker(queue)
+    assert init_sweep(queue, TOPICS[:1], range(3)) == 1
+    assert run_worker(queue)["completed"] == 1
+    assert collect(queue) == run_tournament(TOPICS[:1], range(3), workers=0)
+
+
+def test_resumes_after_a_worker_dies_mid_batch(tmp_path):
+    queue = str(tmp_path / "sweep.db")
+    init_sweep(queue, TOPICS, range(2))
+    with WorkQueue(queue) as q:
+        # a worker leased three debates and crashed: its leases run out
+        q.lease("crashed", 3, ttl=0)
+    stats = run_worker(queue, batch=2, out_dir=str(tmp_path / "out"))
+    assert stats["completed"] == 4
+    with WorkQueue(queue) as q:
+        assert q.counts()["done"] == 4
+    assert collect(queue) == run_tournament(TOPICS, range(2), workers=0)
+    assert not [f for f in os.listdir(tmp_path / "out" / "logs") if f.endswith(".tmp")]
+
+
+def test_failed_debates_are_retried_then_marked_failed(tmp_path, monkeypatch):
+    queue = str(tmp_path / "sweep.db")
+    init_sweep(queue, TOPICS[:1], range(2))
+    monkeypatch.setattr(sweep, "_run_job", lambda job: {"debate": job["debate"], "error": "backend down"})
+    stats = run_worker(queue, max_attempts=2)
+    assert stats["failed"] == 4 and stats["completed"] == 0
+    with WorkQueue(queue) as q:
+        assert q.counts()["failed"] == 2
+        assert [(f["attempts"], f["error"]) for f in q.failures()] == [(2, "backend down")] * 2
+
+
+def test_max_items_hands_back_unrun_leases(tmp_path):
+    queue = str(tmp_path / "sweep.db")
+    init_sweep(queue, TOPICS, range(2))
+    assert run_worker(queue, batch=8, max_items=1)["completed"] == 1
+    with WorkQueue(queue) as q:
+        assert q.counts() == {"pending": 3, "leased": 0, "done": 1, "failed": 0}
+
+
+def test_heartbeats_keep_a_slow_debate_leased(tmp_path, monkeypatch):
+    queue = str(tmp_path / "sweep.db")
+    init_sweep(queue, TOPICS[:1], range(1))
+    stolen = []
+
+    def slow_job(job):
+        # the debate outlives its 0.3 s lease several times over; heartbeats renew it
+        with WorkQueue(queue) as q:
+            for _ in range(4):
+                time.sleep(0.25)
+                stolen.extend(q.lease("rival", 1, ttl=10))
+        return {"debate": job["debate"], "winner": "AgentA"}
+
+    monkeypatch.setattr(sweep, "_run_job", slow_job)
+    assert run_worker(queue, ttl=0.3)["completed"] == 1
+    assert stolen == []
@@ -0,0 +1,26 @@
+from run_tournament import aggregate, make_jobs, run_tournament
+
+TOPICS = ["Should AI be regulated like medicine?", "Remote Work vs Office"]
+
+
+def test_results_independent_of_worker_count(tmp_path):
+    inline = run_tournament(TOPICS, range(3), workers=0, out_dir=str(tmp_path / "inline"))
+    pooled = run_tournament(TOPICS, range(3), workers=2, out_dir=str(tmp_path / "pooled"), chunksize=1)
+    assert inline == pooled
+    assert [r["debate"] for r in inline] == list(range(6))
+    assert (tmp_path / "pooled" / "logs" / "debate_000005.jsonl").exists()
+
+
+def test_reused_worker_matches_fresh_run():
+    # the same (topic, seed) must give the same verdict whatever ran before it in the worker
+    first = run_tournament(TOPICS[:1], [7], workers=0)
+    after_others = run_tournament(TOPICS, [1, 2, 7], workers=0)
+    assert [r for r in after_others if r["seed"] == 7 and r["topic"] == TOPICS[0]][0]["scores"] == first[0]["scores"]
+
+
+def test_aggregate_counts_wins_per_persona():
+    jobs = make_jobs(TOPICS[:1], [0], [("scientist", "philosopher")])
+    results = [{**jobs[0], "winner": "AgentB", "scores": {"AgentA": 10, "AgentB": 12}}]
+    rows = {r["persona"]: r for r in aggregate(results)}
+    assert rows["philosopher"]["wins"] == 1 and rows["scientist"]["wins"] == 0
+    assert rows["scientist"]["mean_score"] == 10
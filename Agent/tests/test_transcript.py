@@ -0,0 +1,41 @@
+import json
+
+from nodes.memory_node import MemoryNode
+from nodes.transcript import Transcript, Turn, append_turns
+
+
+def _entry(r, agent="AgentA"):
+    return {"round": r, "agent": agent, "text": f"turn {r}"}
+
+
+def test_reducer_appends_without_copying_history():
+    t1 = append_turns(Transcript(), [_entry(1)])
+    t2 = append_turns(t1, [_entry(2, "AgentB")])
+    assert t2._store is t1._store
+    assert len(t1) == 1 and len(t2) == 2
+    assert t2 == [_entry(1), _entry(2, "AgentB")]
+    assert t2[-1]["agent"] == "AgentB" and t2[-1].round == 2
+
+
+def test_extending_an_older_view_forks():
+    base = append_turns([], [_entry(1)])
+    left = append_turns(base, [_entry(2)])
+    right = append_turns(base, [_entry(3)])
+    assert [t["round"] for t in left] == [1, 2]
+    assert [t["round"] for t in right] == [1, 3]
+
+
+def test_agent_names_are_interned_and_turns_behave_like_dicts():
+    t = Transcript([_entry(1, "Agent" + "A"), _entry(2, "AgentA")])
+    assert t[0].agent is t[1].agent
+    assert dict(t[0]) == _entry(1, "AgentA")
+    assert isinstance(t[-2:][0], Turn)
+    assert json.loads(json.dumps(t.to_list())) == [_entry(1), _entry(2)]
+
+
+def test_memory_node_reads_transcript_views():
+    t = Transcript([_entry(r) for r in range(1, 6)])
+    mem = MemoryNode()
+    snapshot = mem.get_relevant_memory_for_agent("AgentA", t, "")
+    assert snapshot["turns"] == [_entry(4), _entry(5)]
+    assert mem.generate_summary(t) == "turn 2 | turn 3 | turn 4 | turn 5"
@@ -0,0 +1,54 @@
+import json
+
+from nodes.agent_node import AgentNode
+from nodes.logger_node import LoggerNode
+from nodes.memory_node import MemoryNode
+from nodes.turn_cache import TurnCache
+
+TOPIC = "Should AI be regulated like medicine?"
+
+
+def test_keys_are_stable_and_normalized():
+    cache = TurnCache()
+    k1 = cache.key("AgentA", "Scientist  persona\r\n", TOPIC, {"turns": [], "summary": ""}, 1)
+    k2 = TurnCache().key("AgentA", "Scientist persona", "  Should AI be  regulated like medicine? ", {"summary": "", "turns": []}, 1)
+    assert k1 == k2
+    assert k1 != cache.key("AgentA", "Scientist persona", TOPIC, {"turns": [], "summary": ""}, 2)
+
+
+def test_lru_evicts_by_size():
+    cache = TurnCache(max_bytes=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"
+    cache.put("c", "12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345" and cache.get("c") == "12345"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_tier_is_shared(tmp_path):
+    db = str(tmp_path / "turns.db")
+    writer = TurnCache(path=db)
+    writer.put("k", "cached text")
+    reader = TurnCache(path=db)
+    assert reader.get("k") == "cached text"
+    assert reader.get("k") == "cached text"
+    assert reader.stats()["disk_hits"] == 1 and reader.stats()["hits"] == 1
+    writer.close()
+    reader.close()
+
+
+def test_agent_reuses_cached_turns_and_logs_stats(tmp_path):
+    log = LoggerNode(str(tmp_path / "log.jsonl"))
+    cache = TurnCache(path=str(tmp_path / "turns.db"))
+    texts = []
+    for seed in (1, 99):
+        agent = AgentNode("AgentA", persona_path="persona_templates/scientist.txt", seed=seed, memory=MemoryNode(), cache=cache)
+        texts.append(agent.take_turn(TOPIC, {"turns": [], "summary": ""}, [], 1))
+    # same inputs -> the second agent gets the first agent's turn instead of generating
+    assert texts[0] == texts[1]
+    cache.log_stats(log)
+    event = json.loads((tmp_path / "log.jsonl").read_text().splitlines()[-1])
+    assert event["event"] == "cache_stats" and event["hits"] == 1 and event["misses"] == 1
+    cache.close()
@@ -0,0 +1,70 @@
+import pytest
+
+from nodes.work_queue import WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = WorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    q.add((f"item-{i}", {"n": i}) for i in range(5))
+    yield q
+    q.close()
+
+
+def test_add_is_idempotent_and_numbers_from_zero(queue):
+    assert queue.add([("item-0", {"n": 0}), ("item-5", {"n": 5})]) == 1
+    assert [item_id for item_id, _ in queue.lease("w", 10)] == list(range(6))
+    assert queue.counts() == {"pending": 0, "leased": 6, "done": 0, "failed": 0}
+
+
+def test_leases_are_exclusive_until_they_expire(queue):
+    assert [p["n"] for _, p in queue.lease("a", 2)] == [0, 1]
+    assert [p["n"] for _, p in queue.lease("b", 2)] == [2, 3]
+    # ttl=0: "c" takes item 4 and dies; its lease is immediately up for grabs
+    assert [i for i, _ in queue.lease("c", 1, ttl=0)] == [4]
+    assert [i for i, _ in queue.lease("d", 5)] == [4]
+    assert queue.heartbeat("c", [4]) == []
+    assert queue.heartbeat("a", [0, 1, 4]) == [0, 1]
+
+
+def test_complete_is_idempotent(queue):
+    (item_id, _), = queue.lease("a", 1, ttl=0)
+    queue.lease("b", 1)
+    assert queue.complete(item_id, "b", {"winner": "AgentA"})
+    # the worker whose lease expired finishes too: its result is dropped
+    assert not queue.complete(item_id, "a", {"winner": "AgentA"})
+    assert list(queue.results()) == [(0, {"winner": "AgentA"})]
+
+
+def test_failures_retry_until_max_attempts(queue):
+    for attempt in range(2):
+        (item_id, _), = queue.lease("a", 1)
+        assert queue.fail(item_id, "a", f"boom {attempt}")
+    assert queue.counts()["failed"] == 1
+    assert queue.failures() == [{"id": 0, "payload": {"n": 0}, "attempts": 2, "error": "boom 1"}]
+    # a fail from a worker that no longer holds the lease is ignored
+    (item_id, _), = queue.lease("a", 1)
+    assert not queue.fail(item_id, "b", "not mine")
+    assert queue.retry_failed() == 1
+    assert queue.counts()["pending"] == 4
+
+
+def test_expired_leases_count_as_attempts(queue):
+    queue.lease("a", 5, ttl=0)
+    queue.lease("b", 5, ttl=0)
+    assert queue.lease("c", 5) == []
+    assert queue.counts()["failed"] == 5
+    assert {f["error"] for f in queue.failures()} == {"lease expired"}
+    assert not queue.unfinished()
+
+
+def test_release_hands_leases_back(queue):
+    queue.lease("a", 3)
+    assert queue.release("a", [2]) == 1
+    assert queue.release("a") == 2
+    assert [i for i, _ in queue.lease("b", 5)] == list(range(5))
+
+
+def test_invalid_settings(tmp_path):
+    with pytest.raises(ValueError):
+        WorkQueue(str(tmp_path / "q.db"), max_attempts=0)